@@ -33,5 +33,5 @@ async def startup_event():
 
 
 is_test = Config.environment == "test"
-if not is_test:
+if not is_test and Config.cron_config.run_in_api:
     setup_cron_jobs(app)
@@ -72,11 +72,35 @@ class CronConfig:
     track_completed_tasks_int = int(os.environ.get("TRACK_COMPLETED_TASKS_INT", 30))
     track_creating_tasks_chunk_size = os.environ.get("TRACK_CREATING_TASKS_CHUNK_SIZE", 5)
     track_creating_tasks_int = int(os.environ.get("TRACK_CREATING_TASKS_INT", 300))
+    track_creating_tasks_min_delay = int(os.environ.get("TRACK_CREATING_TASKS_MIN_DELAY", 30))
+    "Delay, in seconds, before the status of a task upload is checked again"
+    track_creating_tasks_max_delay = int(os.environ.get("TRACK_CREATING_TASKS_MAX_DELAY", 1800))
+    "Maximum delay between the status checks of a task upload, the delay is doubled each time"
     track_assignments_int = int(os.environ.get("TRACK_ASSIGNMENTS_INT", 5))
     track_assignments_chunk_size = os.environ.get("TRACK_ASSIGNMENTS_CHUNK_SIZE", 10)
 
     retrieve_annotations_int = int(os.environ.get("RETRIEVE_ANNOTATIONS_INT", 60))
-    retrieve_annotations_chunk_size = os.environ.get("RETRIEVE_ANNOTATIONS_CHUNK_SIZE", 5)
+    retrieve_annotations_chunk_size = int(os.environ.get("RETRIEVE_ANNOTATIONS_CHUNK_SIZE", 5))
+    retrieve_annotations_concurrency = int(os.environ.get("RETRIEVE_ANNOTATIONS_CONCURRENCY", 2))
+    "Maximum number of projects retrieved at the same time, sharing the CVAT connections"
+
+    run_in_api = str_to_bool(os.environ.get("RUN_CRON_JOBS_IN_API", "yes"))
+    "Runs the cron jobs in the API processes. Disable when dedicated workers are used"
+
+    enable_event_triggers = str_to_bool(os.environ.get("ENABLE_EVENT_TRIGGERS", "yes"))
+    "Runs the jobs as soon as the related events are committed in the database"
+    event_triggered_jobs_int = int(os.environ.get("EVENT_TRIGGERED_JOBS_INT", 300))
+    "Minimal polling interval, in seconds, of the jobs driven by events. Catches missed events"
+
+
+class WorkerConfig:
+    jobs = os.environ.get("WORKER_JOBS", "")
+    "Comma-separated names of the cron jobs run by the worker. All jobs are run by default"
+
+    escrow_shards = int(os.environ.get("WORKER_ESCROW_SHARDS", 1))
+    "Number of workers the escrows are distributed between"
+    escrow_shard_index = int(os.environ.get("WORKER_ESCROW_SHARD_INDEX", 0))
+    "Index of the escrow shard processed by the worker, from 0 to WORKER_ESCROW_SHARDS - 1"
 
 
 class CvatConfig:
@@ -84,6 +108,10 @@ class CvatConfig:
     cvat_admin = os.environ.get("CVAT_ADMIN", "admin")
     cvat_admin_pass = os.environ.get("CVAT_ADMIN_PASS", "admin")
     cvat_org_slug = os.environ.get("CVAT_ORG_SLUG", "")
+    cvat_api_pool_size = int(os.environ.get("CVAT_API_POOL_SIZE", 10))
+    "Maximum number of connections kept open to CVAT by each process"
+    cvat_download_chunk_size = int(os.environ.get("CVAT_DOWNLOAD_CHUNK_SIZE", 1024 * 1024))
+    "Size, in bytes, of the chunks read from CVAT downloads. Bigger files are spooled to disk"
 
     cvat_job_overlap = int(os.environ.get("CVAT_JOB_OVERLAP", 0))
     cvat_job_segment_size = int(os.environ.get("CVAT_JOB_SEGMENT_SIZE", 150))
@@ -149,6 +177,7 @@ class Config:
     human_app_config = HumanAppConfig
 
     cron_config = CronConfig
+    worker_config = WorkerConfig
     cvat_config = CvatConfig
     storage_config = StorageConfig
     features = FeaturesConfig
@@ -42,6 +42,17 @@ class TaskType(str, Enum, metaclass=BetterEnumMeta):
     image_boxes = "IMAGE_BOXES"
 
 
+class AnnotationExportStatuses(str, Enum, metaclass=BetterEnumMeta):
+    requested = "requested"
+    ready = "ready"
+
+
+class AnnotationRetrievalStages(str, Enum, metaclass=BetterEnumMeta):
+    exports_requested = "exports_requested"
+    exports_ready = "exports_ready"
+    uploaded = "uploaded"
+
+
 class CvatLabelType(str, Enum, metaclass=BetterEnumMeta):
     tag = "tag"
     points = "points"
@@ -80,6 +91,16 @@ class OracleWebhookStatuses(str, Enum, metaclass=BetterEnumMeta):
     failed = "failed"
 
 
+class EventTopics(str, Enum, metaclass=BetterEnumMeta):
+    job_completed = "job_completed"
+    task_completed = "task_completed"
+    project_completed = "project_completed"
+    incoming_job_launcher_webhook = "incoming_job_launcher_webhook"
+    outgoing_job_launcher_webhook = "outgoing_job_launcher_webhook"
+    incoming_recording_oracle_webhook = "incoming_recording_oracle_webhook"
+    outgoing_recording_oracle_webhook = "outgoing_recording_oracle_webhook"
+
+
 class PlatformType(str, Enum, metaclass=BetterEnumMeta):
     CVAT = "cvat"
 
@@ -1,7 +1,13 @@
+import logging
+from functools import wraps
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+
 from apscheduler.schedulers.background import BackgroundScheduler
 from fastapi import FastAPI
 
 from src.core.config import Config
+from src.core.types import EventTopics
+from src.crons.events import EventListener, EventTriggeredJob
 from src.crons.process_job_launcher_webhooks import (
     process_incoming_job_launcher_webhooks,
     process_outgoing_job_launcher_webhooks,
@@ -17,55 +23,134 @@ from src.crons.state_trackers import (
     track_completed_tasks,
     track_task_creation,
 )
+from src.db.locks import AdvisoryLock
+from src.log import ROOT_LOGGER_NAME
 
+module_logger = f"{ROOT_LOGGER_NAME}.cron"
 
-def setup_cron_jobs(app: FastAPI):
-    @app.on_event("startup")
-    def cron_record():
-        scheduler = BackgroundScheduler()
-        scheduler.add_job(
+# The jobs by name, with their polling intervals
+CRON_JOBS: Dict[str, Tuple[Callable[[], None], int]] = {
+    fn.__name__: (fn, interval)
+    for fn, interval in [
+        (
             process_incoming_job_launcher_webhooks,
-            "interval",
-            seconds=Config.cron_config.process_job_launcher_webhooks_int,
-        )
-        scheduler.add_job(
+            Config.cron_config.process_job_launcher_webhooks_int,
+        ),
+        (
             process_outgoing_job_launcher_webhooks,
-            "interval",
-            seconds=Config.cron_config.process_job_launcher_webhooks_int,
-        )
-        scheduler.add_job(
+            Config.cron_config.process_job_launcher_webhooks_int,
+        ),
+        (
             process_incoming_recording_oracle_webhooks,
-            "interval",
-            seconds=Config.cron_config.process_recording_oracle_webhooks_int,
-        )
-        scheduler.add_job(
+            Config.cron_config.process_recording_oracle_webhooks_int,
+        ),
+        (
             process_outgoing_recording_oracle_webhooks,
-            "interval",
-            seconds=Config.cron_config.process_recording_oracle_webhooks_int,
-        )
-        scheduler.add_job(
-            track_completed_projects,
-            "interval",
-            seconds=Config.cron_config.track_completed_projects_int,
-        )
-        scheduler.add_job(
-            track_completed_tasks,
-            "interval",
-            seconds=Config.cron_config.track_completed_tasks_int,
-        )
-        scheduler.add_job(
-            retrieve_annotations,
-            "interval",
-            seconds=Config.cron_config.retrieve_annotations_int,
-        )
-        scheduler.add_job(
-            track_task_creation,
-            "interval",
-            seconds=Config.cron_config.track_creating_tasks_int,
-        )
-        scheduler.add_job(
-            track_assignments,
-            "interval",
-            seconds=Config.cron_config.track_assignments_int,
+            Config.cron_config.process_recording_oracle_webhooks_int,
+        ),
+        (track_completed_projects, Config.cron_config.track_completed_projects_int),
+        (track_completed_tasks, Config.cron_config.track_completed_tasks_int),
+        (retrieve_annotations, Config.cron_config.retrieve_annotations_int),
+        (track_task_creation, Config.cron_config.track_creating_tasks_int),
+        (track_assignments, Config.cron_config.track_assignments_int),
+    ]
+}
+
+# The jobs which have all their work announced by events. Their polling is only a safety net.
+# The other triggered jobs keep polling for webhook retries and CVAT exports.
+EVENT_DRIVEN_JOBS = {track_completed_tasks, track_completed_projects}
+
+# The jobs which can't be split by escrows. Only one process runs each of them at a time.
+# The other jobs process their own escrow shard in each worker.
+SINGLETON_JOBS = {track_completed_tasks, track_completed_projects, track_assignments}
+
+# The jobs are run as soon as these events happen
+EVENT_SUBSCRIPTIONS: Dict[EventTopics, Callable[[], None]] = {
+    EventTopics.incoming_job_launcher_webhook: process_incoming_job_launcher_webhooks,
+    EventTopics.outgoing_job_launcher_webhook: process_outgoing_job_launcher_webhooks,
+    EventTopics.incoming_recording_oracle_webhook: process_incoming_recording_oracle_webhooks,
+    EventTopics.outgoing_recording_oracle_webhook: process_outgoing_recording_oracle_webhooks,
+    EventTopics.job_completed: track_completed_tasks,
+    EventTopics.task_completed: track_completed_projects,
+    EventTopics.project_completed: retrieve_annotations,
+}
+
+
+def parse_job_names(value: str) -> List[str]:
+    """
+    Parses a comma-separated list of the job names. Returns all jobs for an empty list.
+    """
+    job_names = [name.strip() for name in value.split(",") if name.strip()]
+
+    unknown_job_names = set(job_names).difference(CRON_JOBS)
+    if unknown_job_names:
+        raise ValueError(
+            "Unknown cron jobs: {}. Available jobs: {}".format(
+                ", ".join(sorted(unknown_job_names)), ", ".join(CRON_JOBS)
+            )
         )
-        scheduler.start()
+
+    return job_names or list(CRON_JOBS)
+
+
+def _run_as_leader(fn: Callable[[], None]) -> Callable[[], None]:
+    """
+    Runs the job only in the process holding the job lock.
+    The lock is kept between the runs, so the job stays in the same process until it exits.
+    """
+    lock = AdvisoryLock(f"cron:{fn.__name__}")
+    logger = logging.getLogger(module_logger).getChild(fn.__name__)
+
+    @wraps(fn)
+    def wrapper() -> None:
+        if not lock.try_acquire():
+            logger.debug("The job is run by another process, skipping")
+            return
+
+        fn()
+
+    return wrapper
+
+
+def start_cron_jobs(
+    job_names: Optional[Collection[str]] = None,
+) -> Tuple[BackgroundScheduler, Optional[EventListener]]:
+    """
+    Starts the cron jobs with the given names, or all of them.
+    Returns the scheduler and the event listener, if event triggers are enabled.
+    """
+    if job_names is None:
+        job_names = list(CRON_JOBS)
+
+    scheduler = BackgroundScheduler()
+
+    event_triggers_enabled = Config.cron_config.enable_event_triggers
+    jobs: Dict[Callable[[], None], EventTriggeredJob] = {}
+
+    for job_name in job_names:
+        fn, interval = CRON_JOBS[job_name]
+
+        if event_triggers_enabled and fn in EVENT_DRIVEN_JOBS:
+            interval = max(interval, Config.cron_config.event_triggered_jobs_int)
+
+        job_fn = _run_as_leader(fn) if fn in SINGLETON_JOBS else fn
+        jobs[fn] = EventTriggeredJob(job_fn, scheduler)
+        scheduler.add_job(jobs[fn], "interval", seconds=interval, name=job_name)
+
+    scheduler.start()
+
+    listener = None
+    if event_triggers_enabled:
+        subscriptions: Dict[EventTopics, List[EventTriggeredJob]] = {
+            topic: [jobs[fn]] for topic, fn in EVENT_SUBSCRIPTIONS.items() if fn in jobs
+        }
+        listener = EventListener(subscriptions)
+        listener.start()
+
+    return scheduler, listener
+
+
+def setup_cron_jobs(app: FastAPI):
+    @app.on_event("startup")
+    def cron_record():
+        start_cron_jobs()
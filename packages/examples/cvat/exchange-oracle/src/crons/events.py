@@ -0,0 +1,128 @@
+import logging
+import select
+import threading
+from typing import Callable, Dict, Iterable, List
+
+from apscheduler.schedulers.base import BaseScheduler
+
+from src.core.types import EventTopics
+from src.db import engine
+from src.log import ROOT_LOGGER_NAME
+from src.services.events import EVENTS_CHANNEL
+
+module_logger = f"{ROOT_LOGGER_NAME}.cron.events"
+
+
+class EventTriggeredJob:
+    """
+    Wraps a cron job function, so that it can be run by the scheduler both on its schedule
+    and when triggered by an event.
+
+    Runs of the function don't overlap. If the job is triggered while running,
+    it is run again, so the changes committed during the run are not missed.
+    """
+
+    def __init__(self, fn: Callable[[], None], scheduler: BaseScheduler):
+        self._fn = fn
+        self._scheduler = scheduler
+        self._lock = threading.Lock()
+        self._triggered = threading.Event()
+
+    @property
+    def name(self) -> str:
+        return self._fn.__name__
+
+    def trigger(self) -> None:
+        self._triggered.set()
+
+        # Multiple triggers before the job is started are coalesced into a single run
+        self._scheduler.add_job(
+            self, id=f"{self.name}:triggered", name=self.name, replace_existing=True
+        )
+
+    def __call__(self) -> None:
+        while self._lock.acquire(blocking=False):
+            try:
+                self._triggered.clear()
+                self._fn()
+            finally:
+                self._lock.release()
+
+            if not self._triggered.is_set():
+                break
+
+
+class EventListener(threading.Thread):
+    """
+    Listens to the events published with src.services.events.notify
+    and triggers the jobs subscribed to them.
+    """
+
+    def __init__(
+        self,
+        subscriptions: Dict[EventTopics, List[EventTriggeredJob]],
+        *,
+        poll_interval: float = 5,
+        reconnect_interval: float = 5,
+    ):
+        super().__init__(name="event-listener", daemon=True)
+
+        self._subscriptions = subscriptions
+        self._poll_interval = poll_interval
+        self._reconnect_interval = reconnect_interval
+        self._stopped = threading.Event()
+        self._logger = logging.getLogger(module_logger)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._listen()
+            except Exception as error:
+                self._logger.exception(error)
+                self._stopped.wait(self._reconnect_interval)
+
+    def _listen(self) -> None:
+        connection = engine.raw_connection()
+        connection.detach()  # the connection is not shared with the pool
+
+        try:
+            dbapi_connection = connection.driver_connection
+            dbapi_connection.autocommit = True
+
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {EVENTS_CHANNEL}")
+
+            self._logger.debug(f"Listening to the '{EVENTS_CHANNEL}' channel")
+
+            # The events published while not listening are lost
+            self._dispatch(self._subscriptions)
+
+            while not self._stopped.is_set():
+                readable, _, _ = select.select([dbapi_connection], [], [], self._poll_interval)
+                if not readable:
+                    continue
+
+                dbapi_connection.poll()
+                topics = set(n.payload for n in dbapi_connection.notifies)
+                dbapi_connection.notifies.clear()
+
+                self._dispatch(topics)
+        finally:
+            connection.close()
+
+    def _dispatch(self, topics: Iterable[str]) -> None:
+        jobs: Dict[str, EventTriggeredJob] = {}
+        for topic in topics:
+            if topic not in EventTopics:
+                self._logger.warning(f"Received an unknown event '{topic}', ignoring")
+                continue
+
+            for job in self._subscriptions.get(EventTopics(topic), []):
+                jobs[job.name] = job
+
+        for job in jobs.values():
+            self._logger.debug(f"Triggering the job {job.name}")
+            job.trigger()
@@ -12,7 +12,7 @@ from src.core.config import Config, CronConfig
 from src.core.oracle_events import ExchangeOracleEvent_TaskCreationFailed
 from src.core.types import JobLauncherEventType, OracleWebhookTypes, ProjectStatuses
 from src.db import SessionLocal
-from src.db.utils import ForUpdateParams
+from src.db.utils import ForUpdateParams, get_escrow_shard
 from src.log import ROOT_LOGGER_NAME
 from src.models.webhook import Webhook
 from src.utils.logging import get_function_logger
@@ -36,6 +36,7 @@ def process_incoming_job_launcher_webhooks():
                 OracleWebhookTypes.job_launcher,
                 limit=CronConfig.process_job_launcher_webhooks_chunk_size,
                 for_update=ForUpdateParams(skip_locked=True),
+                shard=get_escrow_shard(),
             )
 
             for webhook in webhooks:
@@ -171,6 +172,7 @@ def process_outgoing_job_launcher_webhooks():
                 OracleWebhookTypes.job_launcher,
                 limit=CronConfig.process_job_launcher_webhooks_chunk_size,
                 for_update=ForUpdateParams(skip_locked=True),
+                shard=get_escrow_shard(),
             )
             for webhook in webhooks:
                 try:
@@ -16,7 +16,7 @@ from src.core.types import (
     TaskStatus,
 )
 from src.db import SessionLocal
-from src.db.utils import ForUpdateParams
+from src.db.utils import ForUpdateParams, get_escrow_shard
 from src.log import ROOT_LOGGER_NAME
 from src.models.webhook import Webhook
 from src.utils.logging import get_function_logger
@@ -40,6 +40,7 @@ def process_incoming_recording_oracle_webhooks():
                 OracleWebhookTypes.recording_oracle,
                 limit=CronConfig.process_recording_oracle_webhooks_chunk_size,
                 for_update=ForUpdateParams(skip_locked=True),
+                shard=get_escrow_shard(),
             )
 
             for webhook in webhooks:
@@ -143,6 +144,7 @@ def process_outgoing_recording_oracle_webhooks():
                 OracleWebhookTypes.recording_oracle,
                 limit=CronConfig.process_recording_oracle_webhooks_chunk_size,
                 for_update=ForUpdateParams(skip_locked=True),
+                shard=get_escrow_shard(),
             )
             for webhook in webhooks:
                 try:
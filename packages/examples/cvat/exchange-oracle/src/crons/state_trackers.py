@@ -1,20 +1,36 @@
-from typing import Dict, List
+import logging
+import threading
+from functools import partial
+from typing import IO, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
 
 import src.cvat.api_calls as cvat_api
 import src.models.cvat as cvat_models
 import src.services.cloud.client as cloud_client
 import src.services.cvat as cvat_service
+import src.services.events as events_service
 import src.services.webhook as oracle_db_service
 from src.chain.escrow import get_escrow_manifest, validate_escrow
 from src.core.annotation_meta import RESULTING_ANNOTATIONS_FILE
-from src.core.config import CronConfig, StorageConfig
+from src.core.config import CronConfig, CvatConfig, StorageConfig
 from src.core.oracle_events import (
     ExchangeOracleEvent_TaskCreationFailed,
     ExchangeOracleEvent_TaskFinished,
 )
-from src.core.types import JobStatuses, OracleWebhookTypes, ProjectStatuses, TaskStatus
+from src.core.types import (
+    AnnotationExportStatuses,
+    AnnotationRetrievalStages,
+    AssignmentStatus,
+    EventTopics,
+    JobStatuses,
+    OracleWebhookTypes,
+    ProjectStatuses,
+    TaskStatus,
+)
 from src.db import SessionLocal
-from src.db.utils import ForUpdateParams
+from src.db.locks import AdvisoryLock
+from src.db.utils import ForUpdateParams, get_escrow_shard
 from src.handlers.annotation import (
     CVAT_EXPORT_FORMAT_MAPPING,
     FileDescriptor,
@@ -23,6 +39,7 @@ from src.handlers.annotation import (
 )
 from src.log import ROOT_LOGGER_NAME
 from src.utils.assignments import compose_output_annotation_filename, parse_manifest
+from src.utils.concurrency import map_concurrently
 from src.utils.logging import get_function_logger
 
 module_logger = f"{ROOT_LOGGER_NAME}.cron.cvat"
@@ -31,35 +48,21 @@ module_logger = f"{ROOT_LOGGER_NAME}.cron.cvat"
 def track_completed_projects() -> None:
     """
     Tracks completed projects:
-    1. Retrieves projects with "annotation" status
-    2. Retrieves tasks related to this project
-    3. If all tasks are completed -> updates project status to "completed"
+    1. Finds projects with "annotation" status and all the tasks completed
+    2. Updates their status to "completed"
     """
     logger = get_function_logger(module_logger)
 
     try:
         logger.debug("Starting cron job")
         with SessionLocal.begin() as session:
-            # Get active projects from db
-            projects = cvat_service.get_projects_by_status(
-                session,
-                ProjectStatuses.annotation,
-                limit=CronConfig.track_completed_projects_chunk_size,
-                for_update=ForUpdateParams(skip_locked=True),
+            completed_project_ids = cvat_service.complete_projects_with_completed_tasks(
+                session, limit=CronConfig.track_completed_projects_chunk_size
             )
 
-            completed_project_ids = []
-
-            for project in projects:
-                tasks = cvat_service.get_tasks_by_cvat_project_id(session, project.cvat_id)
-                if tasks and all(task.status == TaskStatus.completed for task in tasks):
-                    cvat_service.update_project_status(
-                        session, project.id, ProjectStatuses.completed
-                    )
-
-                    completed_project_ids.append(project.cvat_id)
-
             if completed_project_ids:
+                events_service.notify(session, EventTopics.project_completed)
+
                 logger.info(
                     "Found new completed projects: {}".format(
                         ", ".join(str(t) for t in completed_project_ids)
@@ -74,29 +77,19 @@ def track_completed_projects() -> None:
 def track_completed_tasks() -> None:
     """
     Tracks completed tasks:
-    1. Retrieves tasks with "annotation" status
-    2. Retrieves jobs related to this task
-    3. If all jobs are completed -> updates task status to "completed"
+    1. Finds tasks with "annotation" status and all the jobs completed
+    2. Updates their status to "completed"
     """
     logger = get_function_logger(module_logger)
 
     try:
         logger.debug("Starting cron job")
         with SessionLocal.begin() as session:
-            tasks = cvat_service.get_tasks_by_status(
-                session, TaskStatus.annotation, for_update=ForUpdateParams(skip_locked=True)
-            )
-
-            completed_task_ids = []
-
-            for task in tasks:
-                jobs = cvat_service.get_jobs_by_cvat_task_id(session, task.cvat_id)
-                if jobs and all(job.status == JobStatuses.completed for job in jobs):
-                    cvat_service.update_task_status(session, task.id, TaskStatus.completed)
-
-                    completed_task_ids.append(task.cvat_id)
+            completed_task_ids = cvat_service.complete_tasks_with_completed_jobs(session)
 
             if completed_task_ids:
+                events_service.notify(session, EventTopics.task_completed)
+
                 logger.info(
                     "Found new completed tasks: {}".format(
                         ", ".join(str(t) for t in completed_task_ids)
@@ -108,12 +101,72 @@ def track_completed_tasks() -> None:
         logger.debug("Finishing cron job")
 
 
+def _remove_cvat_job_assignees(
+    job_assignments: Dict[int, str], *, status: AssignmentStatus, logger: logging.Logger
+) -> None:
+    """
+    Removes the assignees of the CVAT jobs concurrently, if the assignments are still
+    the latest ones of the jobs. If a job fails to be updated, its assignment status
+    is reverted, so that the job is processed again in the next run.
+
+    The projects of the jobs are locked meanwhile, as when the jobs are assigned,
+    so that a job assigned again in between keeps its new assignee.
+
+    job_assignments: CVAT job id -> the latest assignment id of the job, which has
+    the "status" status already
+    """
+
+    if not job_assignments:
+        return
+
+    with SessionLocal.begin() as session:
+        jobs = cvat_service.get_jobs_by_cvat_id(session, list(job_assignments))
+        cvat_service.get_projects_by_cvat_ids(
+            session, list({job.cvat_project_id for job in jobs}), for_update=True
+        )
+
+        latest_assignments = cvat_service.get_latest_assignments_by_cvat_job_ids(
+            session, list(job_assignments)
+        )
+        cvat_job_ids = [
+            cvat_job_id
+            for cvat_job_id, assignment_id in job_assignments.items()
+            if cvat_job_id in latest_assignments
+            and latest_assignments[cvat_job_id].id == assignment_id
+        ]
+
+        results = map_concurrently(
+            lambda cvat_job_id: cvat_api.update_job_assignee(cvat_job_id, assignee_id=None),
+            cvat_job_ids,
+            max_workers=CvatConfig.cvat_api_pool_size,
+        )
+
+        failed_assignment_ids = []
+        for cvat_job_id, result in zip(cvat_job_ids, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to remove the assignee of the job {cvat_job_id}: {result}")
+                failed_assignment_ids.append(job_assignments[cvat_job_id])
+
+        if failed_assignment_ids:
+            cvat_service.update_assignments_status(
+                session,
+                failed_assignment_ids,
+                AssignmentStatus.created,
+                current_status=status,
+            )
+
+
 def track_assignments() -> None:
     """
     Tracks assignments:
     1. Checks time for each active assignment
     2. If an assignment is timed out, expires it
     3. If a project or task state is not "annotation", cancels assignments
+
+    The assignments are updated in the DB first, then the assignees are removed
+    from the CVAT jobs, so the assignments are not locked during the CVAT requests.
+    The projects of the jobs are locked during the CVAT requests instead, so that
+    the jobs are not assigned again meanwhile.
     """
     logger = get_function_logger(module_logger)
 
@@ -136,17 +189,22 @@ def track_assignments() -> None:
                     )
                 )
 
-                latest_assignment = cvat_service.get_latest_assignment_by_cvat_job_id(
-                    session, assignment.cvat_job_id
-                )
-                if latest_assignment.id == assignment.id:
-                    # Avoid un-assigning if it's not the latest assignment
+            latest_assignments = cvat_service.get_latest_assignments_by_cvat_job_ids(
+                session, [assignment.cvat_job_id for assignment in assignments]
+            )
 
-                    cvat_api.update_job_assignee(
-                        assignment.cvat_job_id, assignee_id=None
-                    )  # note that calling it in a loop can take too much time
+            # Avoid un-assigning if it's not the latest assignment
+            expired_job_assignments = {
+                assignment.cvat_job_id: assignment.id
+                for assignment in assignments
+                if latest_assignments[assignment.cvat_job_id].id == assignment.id
+            }
 
-                cvat_service.expire_assignment(session, assignment.id)
+            cvat_service.expire_assignments(session, [assignment.id for assignment in assignments])
+
+        _remove_cvat_job_assignees(
+            expired_job_assignments, status=AssignmentStatus.expired, logger=logger
+        )
 
         with SessionLocal.begin() as session:
             assignments = cvat_service.get_active_assignments(
@@ -155,168 +213,432 @@ def track_assignments() -> None:
                 for_update=ForUpdateParams(skip_locked=True),
             )
 
+            assignments = [
+                assignment
+                for assignment in assignments
+                if assignment.job.project.status != ProjectStatuses.annotation
+            ]
+
             for assignment in assignments:
-                if assignment.job.project.status != ProjectStatuses.annotation:
-                    logger.warning(
-                        "Canceling the unfinished assignment {} (user {}, job id {}) - "
-                        "the project state is not annotation".format(
-                            assignment.id,
-                            assignment.user_wallet_address,
-                            assignment.cvat_job_id,
-                        )
+                logger.warning(
+                    "Canceling the unfinished assignment {} (user {}, job id {}) - "
+                    "the project state is not annotation".format(
+                        assignment.id,
+                        assignment.user_wallet_address,
+                        assignment.cvat_job_id,
                     )
+                )
 
-                    latest_assignment = cvat_service.get_latest_assignment_by_cvat_job_id(
-                        session, assignment.cvat_job_id
-                    )
-                    if latest_assignment.id == assignment.id:
-                        # Avoid un-assigning if it's not the latest assignment
+            latest_assignments = cvat_service.get_latest_assignments_by_cvat_job_ids(
+                session, [assignment.cvat_job_id for assignment in assignments]
+            )
+
+            # Avoid un-assigning if it's not the latest assignment
+            canceled_job_assignments = {
+                assignment.cvat_job_id: assignment.id
+                for assignment in assignments
+                if latest_assignments[assignment.cvat_job_id].id == assignment.id
+            }
 
-                        cvat_api.update_job_assignee(
-                            assignment.cvat_job_id, assignee_id=None
-                        )  # note that calling it in a loop can take too much time
+            cvat_service.cancel_assignments(session, [assignment.id for assignment in assignments])
 
-                    cvat_service.cancel_assignment(session, assignment.id)
+        _remove_cvat_job_assignees(
+            canceled_job_assignments, status=AssignmentStatus.canceled, logger=logger
+        )
     except Exception as error:
         logger.exception(error)
     finally:
         logger.debug("Finishing cron job")
 
 
-def retrieve_annotations() -> None:
+def _request_annotation_export(export: Tuple[int, Optional[int], str]) -> bool:
+    cvat_project_id, cvat_job_id, format_name = export
+    if cvat_job_id is None:
+        return cvat_api.request_project_annotations(cvat_project_id, format_name=format_name)
+    else:
+        return cvat_api.request_job_annotations(cvat_job_id, format_name=format_name)
+
+
+def _start_annotation_retrieval(project_id: str) -> Optional[AnnotationRetrievalStages]:
     """
-    Retrieves and stores completed annotations:
-    1. Retrieves annotations from projects with "completed" status
-    2. Postprocesses them
-    3. Stores annotations in s3 bucket
-    4. Prepares a webhook to recording oracle
+    Checks the project is still completed and requests annotation exports, if they are
+    not requested yet. Returns the current retrieval stage of the project.
+    """
+
+    with SessionLocal.begin() as session:
+        project = cvat_service.get_project_by_id(
+            session, project_id, for_update=True, status_in=[ProjectStatuses.completed]
+        )
+        if not project:
+            return None
+
+        # Check if all jobs within the project are completed
+        if not cvat_service.is_project_completed(session, project.id):
+            cvat_service.update_project_status(session, project.id, ProjectStatuses.annotation)
+            cvat_service.update_project_annotation_retrieval_stage(session, project.id, None)
+            cvat_service.delete_annotation_exports_by_cvat_project_id(session, project.cvat_id)
+            return None
+
+        if project.annotation_retrieval_stage:
+            return AnnotationRetrievalStages(project.annotation_retrieval_stage)
+
+        jobs = cvat_service.get_jobs_by_cvat_project_id(session, project.cvat_id)
+        cvat_service.delete_annotation_exports_by_cvat_project_id(session, project.cvat_id)
+        cvat_service.create_annotation_exports(
+            session,
+            project.cvat_id,
+            [job.cvat_id for job in jobs],
+            format_name=CVAT_EXPORT_FORMAT_MAPPING[project.job_type],
+        )
+        cvat_service.update_project_annotation_retrieval_stage(
+            session, project.id, AnnotationRetrievalStages.exports_requested
+        )
+
+        return AnnotationRetrievalStages.exports_requested
+
+
+def _cancel_annotation_retrieval(session: Session, project_id: str) -> None:
+    """
+    Clears the retrieval stage and the annotation exports of a project which is
+    no longer completed. The exports of a removed project are removed with it.
     """
-    logger = get_function_logger(module_logger)
+
+    project = cvat_service.get_project_by_id(session, project_id, for_update=True)
+    if project:
+        cvat_service.update_project_annotation_retrieval_stage(session, project.id, None)
+        cvat_service.delete_annotation_exports_by_cvat_project_id(session, project.cvat_id)
+
+
+def _check_annotation_exports(
+    project_id: str, *, cvat_workers: int, logger: logging.Logger
+) -> Optional[AnnotationRetrievalStages]:
+    """
+    Checks the readiness of the pending annotation exports of the project, without waiting
+    for them, with up to "cvat_workers" concurrent CVAT requests.
+    Returns the new retrieval stage of the project.
+    """
+
+    with SessionLocal.begin() as session:
+        project = cvat_service.get_project_by_id(
+            session, project_id, status_in=[ProjectStatuses.completed]
+        )
+        if not project:
+            _cancel_annotation_retrieval(session, project_id)
+            return None
+
+        pending_exports = [
+            (e.id, (e.cvat_project_id, e.cvat_job_id, e.format_name))
+            for e in cvat_service.get_annotation_exports_by_cvat_project_ids(
+                session, [project.cvat_id]
+            )
+            if e.status == AnnotationExportStatuses.requested
+        ]
+        escrow_address = project.escrow_address
+
+    # Requesting an export also reports whether it is ready
+    request_results = map_concurrently(
+        _request_annotation_export,
+        [export for _, export in pending_exports],
+        max_workers=cvat_workers,
+    )
+
+    ready_export_ids = []
+    for (export_id, (cvat_project_id, cvat_job_id, _)), result in zip(
+        pending_exports, request_results
+    ):
+        if isinstance(result, BaseException):
+            logger.warning(
+                f"Failed to check the annotation export (project {cvat_project_id}, "
+                f"job {cvat_job_id}): {result}"
+            )
+        elif result:
+            ready_export_ids.append(export_id)
+
+    if len(ready_export_ids) < len(pending_exports):
+        if ready_export_ids:
+            with SessionLocal.begin() as session:
+                cvat_service.update_annotation_exports_status(
+                    session, ready_export_ids, AnnotationExportStatuses.ready
+                )
+
+        logger.debug(
+            f"Waiting for annotation exports of the project (escrow_address={escrow_address})"
+        )
+        return AnnotationRetrievalStages.exports_requested
+
+    with SessionLocal.begin() as session:
+        cvat_service.update_annotation_exports_status(
+            session, ready_export_ids, AnnotationExportStatuses.ready
+        )
+        cvat_service.update_project_annotation_retrieval_stage(
+            session, project_id, AnnotationRetrievalStages.exports_ready
+        )
+
+    return AnnotationRetrievalStages.exports_ready
+
+
+def _upload_annotations(
+    project_id: str, *, cvat_workers: int, logger: logging.Logger
+) -> Optional[AnnotationRetrievalStages]:
+    """
+    Downloads the prepared annotations from CVAT, with up to "cvat_workers" concurrent
+    requests, postprocesses them and stores them in the results bucket.
+    Returns the new retrieval stage of the project.
+    """
+
+    # The objects are used after the transaction ends, no rows are locked meanwhile
+    with SessionLocal(expire_on_commit=False) as session, session.begin():
+        project = cvat_service.get_project_by_id(
+            session, project_id, status_in=[ProjectStatuses.completed]
+        )
+        if not project:
+            _cancel_annotation_retrieval(session, project_id)
+            return None
+
+        jobs = cvat_service.get_jobs_by_cvat_project_id(session, project.cvat_id)
+        for job in jobs:
+            job.latest_assignment.user  # loads the relationships
+        project_images = cvat_service.get_project_images(session, project.cvat_id)
+
+    validate_escrow(project.chain_id, project.escrow_address)
+
+    manifest = parse_manifest(get_escrow_manifest(project.chain_id, project.escrow_address))
+
+    logger.debug(f"Downloading results for the project (escrow_address={project.escrow_address})")
+
+    annotation_format = CVAT_EXPORT_FORMAT_MAPPING[project.job_type]
+    job_annotations: Dict[int, FileDescriptor] = {}
+
+    # Collect raw annotations from CVAT, validate and convert them
+    # into a recording oracle suitable format. The exports are prepared already.
+    def _get_annotations(cvat_job_id: Optional[int]) -> IO[bytes]:
+        if cvat_job_id is None:
+            return cvat_api.get_project_annotations(project.cvat_id, format_name=annotation_format)
+        else:
+            return cvat_api.get_job_annotations(cvat_job_id, format_name=annotation_format)
+
+    annotations_files = map_concurrently(
+        _get_annotations,
+        [None] + [job.cvat_id for job in jobs],
+        max_workers=cvat_workers,
+    )
+    download_errors = [f for f in annotations_files if isinstance(f, BaseException)]
+    if download_errors:
+        for annotations_file in annotations_files:
+            if not isinstance(annotations_file, BaseException):
+                annotations_file.close()
+
+        raise download_errors[0]
+
+    project_annotations_file, *job_annotations_files = annotations_files
+
+    for job, job_annotations_file in zip(jobs, job_annotations_files):
+        job_assignment = job.latest_assignment
+        job_annotations[job.cvat_id] = FileDescriptor(
+            filename="project_{}-task_{}-job_{}-user_{}-assignment_{}.zip".format(
+                project.cvat_id,
+                job.cvat_task_id,
+                job.cvat_id,
+                job_assignment.user.cvat_id,
+                job_assignment.id,
+            ),
+            file=job_annotations_file,
+        )
+
+    project_annotations_file_desc = FileDescriptor(
+        filename=RESULTING_ANNOTATIONS_FILE,
+        file=project_annotations_file,
+    )
+
+    annotation_files: List[FileDescriptor] = []
+    annotation_files.append(project_annotations_file_desc)
+    annotation_files.extend(job_annotations.values())
 
     try:
-        logger.debug("Starting cron job")
-        with SessionLocal.begin() as session:
-            # Get completed projects from db
-            projects = cvat_service.get_projects_by_status(
-                session,
-                ProjectStatuses.completed,
-                limit=CronConfig.retrieve_annotations_chunk_size,
-                for_update=ForUpdateParams(skip_locked=True),
+        annotation_metafile = prepare_annotation_metafile(
+            jobs=jobs, job_annotations=job_annotations
+        )
+        postprocess_annotations(
+            annotation_files,
+            project_annotations_file_desc,
+            manifest=manifest,
+            project_images=project_images,
+        )
+
+        annotation_files.append(annotation_metafile)
+
+        storage_client = cloud_client.S3Client(
+            StorageConfig.provider_endpoint_url(),
+            access_key=StorageConfig.access_key,
+            secret_key=StorageConfig.secret_key,
+        )
+        existing_storage_files = set(
+            f.key
+            for f in storage_client.list_files(
+                StorageConfig.results_bucket_name,
+                path=compose_output_annotation_filename(
+                    project.escrow_address,
+                    project.chain_id,
+                    "",
+                ),
             )
+        )
+        for file_descriptor in annotation_files:
+            if file_descriptor.filename in existing_storage_files:
+                continue
+
+            storage_client.create_file(
+                StorageConfig.results_bucket_name,
+                compose_output_annotation_filename(
+                    project.escrow_address,
+                    project.chain_id,
+                    file_descriptor.filename,
+                ),
+                file_descriptor.file,
+            )
+    finally:
+        # Removes the downloaded files from disk
+        for file_descriptor in annotation_files:
+            file_descriptor.file.close()
 
-            for project in projects:
-                # Check if all jobs within the project are completed
-                if not cvat_service.is_project_completed(session, project.id):
-                    cvat_service.update_project_status(
-                        session, project.id, ProjectStatuses.annotation
-                    )
-                    continue
+    with SessionLocal.begin() as session:
+        cvat_service.update_project_annotation_retrieval_stage(
+            session, project_id, AnnotationRetrievalStages.uploaded
+        )
 
-                validate_escrow(project.chain_id, project.escrow_address)
+    return AnnotationRetrievalStages.uploaded
 
-                manifest = parse_manifest(
-                    get_escrow_manifest(project.chain_id, project.escrow_address)
-                )
 
-                logger.debug(
-                    f"Downloading results for the project (escrow_address={project.escrow_address})"
-                )
+def _finish_annotation_retrieval(project_id: str, *, logger: logging.Logger) -> None:
+    """
+    Notifies the recording oracle about the stored annotations and finishes the project
+    """
 
-                jobs = cvat_service.get_jobs_by_cvat_project_id(session, project.cvat_id)
+    with SessionLocal.begin() as session:
+        project = cvat_service.get_project_by_id(
+            session, project_id, for_update=True, status_in=[ProjectStatuses.completed]
+        )
+        if not project:
+            return
+
+        oracle_db_service.outbox.create_webhook(
+            session,
+            project.escrow_address,
+            project.chain_id,
+            OracleWebhookTypes.recording_oracle,
+            event=ExchangeOracleEvent_TaskFinished(),
+        )
+
+        cvat_service.update_project_status(session, project.id, ProjectStatuses.validation)
+        cvat_service.update_project_annotation_retrieval_stage(session, project.id, None)
+        cvat_service.delete_annotation_exports_by_cvat_project_id(session, project.cvat_id)
+
+        logger.info(
+            f"The project (escrow_address={project.escrow_address}) "
+            "is finished, resulting annotations are processed successfully"
+        )
+
+
+def _retrieve_project_annotations(
+    project_id: str, *, cvat_workers: int, logger: logging.Logger
+) -> None:
+    """
+    Runs the annotation retrieval of the project, starting from the last finished stage.
+    Each stage is committed separately, so the project rows are only locked for a short time,
+    and a failed or interrupted retrieval is continued in the next runs.
+    """
 
-                annotation_format = CVAT_EXPORT_FORMAT_MAPPING[project.job_type]
-                job_annotations: Dict[int, FileDescriptor] = {}
+    stage = _start_annotation_retrieval(project_id)
 
-                # Request dataset preparation beforehand
-                for job in jobs:
-                    cvat_api.request_job_annotations(job.cvat_id, format_name=annotation_format)
-                cvat_api.request_project_annotations(project.cvat_id, format_name=annotation_format)
+    if stage == AnnotationRetrievalStages.exports_requested:
+        stage = _check_annotation_exports(project_id, cvat_workers=cvat_workers, logger=logger)
 
-                # Collect raw annotations from CVAT, validate and convert them
-                # into a recording oracle suitable format
-                for job in jobs:
-                    job_annotations_file = cvat_api.get_job_annotations(
-                        job.cvat_id, format_name=annotation_format
-                    )
-                    job_assignment = job.latest_assignment
-                    job_annotations[job.cvat_id] = FileDescriptor(
-                        filename="project_{}-task_{}-job_{}-user_{}-assignment_{}.zip".format(
-                            project.cvat_id,
-                            job.cvat_task_id,
-                            job.cvat_id,
-                            job_assignment.user.cvat_id,
-                            job_assignment.id,
-                        ),
-                        file=job_annotations_file,
-                    )
+    if stage == AnnotationRetrievalStages.exports_ready:
+        stage = _upload_annotations(project_id, cvat_workers=cvat_workers, logger=logger)
 
-                project_annotations_file = cvat_api.get_project_annotations(
-                    project.cvat_id, format_name=annotation_format
-                )
-                project_annotations_file_desc = FileDescriptor(
-                    filename=RESULTING_ANNOTATIONS_FILE,
-                    file=project_annotations_file,
-                )
+    if stage == AnnotationRetrievalStages.uploaded:
+        _finish_annotation_retrieval(project_id, logger=logger)
 
-                annotation_files: List[FileDescriptor] = []
-                annotation_files.append(project_annotations_file_desc)
 
-                annotation_metafile = prepare_annotation_metafile(
-                    jobs=jobs, job_annotations=job_annotations
-                )
-                annotation_files.extend(job_annotations.values())
-                postprocess_annotations(
-                    annotation_files,
-                    project_annotations_file_desc,
-                    manifest=manifest,
-                    project_images=cvat_service.get_project_images(session, project.cvat_id),
-                )
+def _retrieve_locked_project_annotations(
+    project_id: str,
+    *,
+    remaining_projects: threading.Semaphore,
+    cvat_workers: int,
+    logger: logging.Logger,
+) -> None:
+    """
+    Runs the annotation retrieval of the project with its lock held, unless the project
+    is processed by another process or enough projects are processed already.
+    """
 
-                annotation_files.append(annotation_metafile)
+    lock = AdvisoryLock(f"retrieve_annotations:{project_id}")
+    if not lock.try_acquire():
+        return
 
-                storage_client = cloud_client.S3Client(
-                    StorageConfig.provider_endpoint_url(),
-                    access_key=StorageConfig.access_key,
-                    secret_key=StorageConfig.secret_key,
-                )
-                existing_storage_files = set(
-                    f.key
-                    for f in storage_client.list_files(
-                        StorageConfig.results_bucket_name,
-                        path=compose_output_annotation_filename(
-                            project.escrow_address,
-                            project.chain_id,
-                            "",
-                        ),
-                    )
-                )
-                for file_descriptor in annotation_files:
-                    if file_descriptor.filename in existing_storage_files:
-                        continue
-
-                    storage_client.create_file(
-                        StorageConfig.results_bucket_name,
-                        compose_output_annotation_filename(
-                            project.escrow_address,
-                            project.chain_id,
-                            file_descriptor.filename,
-                        ),
-                        file_descriptor.file.read(),
-                    )
+    try:
+        if remaining_projects.acquire(blocking=False):
+            _retrieve_project_annotations(project_id, cvat_workers=cvat_workers, logger=logger)
+    finally:
+        lock.release()
 
-                oracle_db_service.outbox.create_webhook(
-                    session,
-                    project.escrow_address,
-                    project.chain_id,
-                    OracleWebhookTypes.recording_oracle,
-                    event=ExchangeOracleEvent_TaskFinished(),
-                )
 
-                cvat_service.update_project_status(session, project.id, ProjectStatuses.validation)
+def retrieve_annotations() -> None:
+    """
+    Retrieves and stores completed annotations:
+    1. Requests annotation exports for projects with "completed" status
+    2. Checks the readiness of the exports, the projects with pending exports
+       are checked again in the next runs
+    3. Retrieves annotations from projects with all the exports ready
+    4. Postprocesses them
+    5. Stores annotations in s3 bucket
+    6. Prepares a webhook to recording oracle
+
+    The projects are processed concurrently. The progress of each project is saved
+    after each step, so the interrupted projects are continued from the last saved step.
+    """
+    logger = get_function_logger(module_logger)
 
-                logger.info(
-                    f"The project (escrow_address={project.escrow_address}) "
-                    "is finished, resulting annotations are processed successfully"
+    try:
+        logger.debug("Starting cron job")
+        chunk_size = CronConfig.retrieve_annotations_chunk_size
+        with SessionLocal.begin() as session:
+            # Get completed projects from db. Some of them can be processed by other processes,
+            # so more projects are selected than processed
+            candidate_ids = [
+                project.id
+                for project in cvat_service.get_projects_by_status(
+                    session,
+                    ProjectStatuses.completed,
+                    limit=2 * chunk_size,
+                    shard=get_escrow_shard(),
+                )
+            ]
+
+        # The projects are locked by the workers, so that at most one lock connection
+        # is open per worker. Up to chunk_size of the locked projects are processed.
+        remaining_projects = threading.Semaphore(chunk_size)
+        concurrency = max(
+            1, min(CronConfig.retrieve_annotations_concurrency, chunk_size, len(candidate_ids))
+        )
+        # The CVAT connections are shared between the projects processed at the same time
+        cvat_workers = max(1, CvatConfig.cvat_api_pool_size // concurrency)
+        results = map_concurrently(
+            partial(
+                _retrieve_locked_project_annotations,
+                remaining_projects=remaining_projects,
+                cvat_workers=cvat_workers,
+                logger=logger,
+            ),
+            candidate_ids,
+            max_workers=concurrency,
+        )
+
+        for project_id, result in zip(candidate_ids, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"Failed to retrieve annotations of the project (id={project_id})",
+                    exc_info=result,
                 )
     except Exception as error:
         logger.exception(error)
@@ -327,6 +649,9 @@ def retrieve_annotations() -> None:
 def track_task_creation() -> None:
     """
     Checks task creation status to report failed tasks and continue task creation process.
+
+    The escrows are checked in turns, so an escrow with many tasks doesn't delay the others.
+    The uploads still in progress are checked again after an increasing delay.
     """
 
     logger = get_function_logger(module_logger)
@@ -335,25 +660,83 @@ def track_task_creation() -> None:
         logger.debug("Starting cron job")
 
         with SessionLocal.begin() as session:
-            # TODO: maybe add load balancing (e.g. round-robin queue, shuffling)
-            # to avoid blocking new tasks
             uploads = cvat_service.get_active_task_uploads(
                 session,
                 limit=CronConfig.track_creating_tasks_chunk_size,
                 for_update=ForUpdateParams(skip_locked=True),
+                shard=get_escrow_shard(),
             )
+            upload_task_ids = [u.task_id for u in uploads]
 
-            logger.debug(
-                "Checking the data uploading status of CVAT tasks: {}".format(
-                    ", ".join(str(u.task_id) for u in uploads)
+            # The finished uploads are removed below, the others are checked again later.
+            # Other processes don't check the uploads meanwhile.
+            cvat_service.postpone_task_uploads(
+                session,
+                [u.id for u in uploads],
+                min_delay=CronConfig.track_creating_tasks_min_delay,
+                max_delay=CronConfig.track_creating_tasks_max_delay,
+            )
+
+        if not upload_task_ids:
+            return
+
+        logger.debug(
+            "Checking the data uploading status of CVAT tasks: {}".format(
+                ", ".join(str(task_id) for task_id in upload_task_ids)
+            )
+        )
+
+        upload_statuses = map_concurrently(
+            cvat_api.get_task_upload_status,
+            upload_task_ids,
+            max_workers=CvatConfig.cvat_api_pool_size,
+        )
+
+        failure_reasons: Dict[int, str] = {}
+        finished_task_ids: List[int] = []
+        for task_id, result in zip(upload_task_ids, upload_statuses):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f"Failed to check the data uploading status of the CVAT task {task_id}: "
+                    f"{result}"
                 )
+                continue
+
+            status, reason = result
+            if not status or status == cvat_api.UploadStatus.FAILED:
+                failure_reasons[task_id] = reason
+            elif status == cvat_api.UploadStatus.FINISHED:
+                finished_task_ids.append(task_id)
+
+        task_jobs = map_concurrently(
+            cvat_api.fetch_task_jobs,
+            finished_task_ids,
+            max_workers=CvatConfig.cvat_api_pool_size,
+        )
+
+        finished_task_jobs: Dict[int, list] = {}
+        for task_id, result in zip(finished_task_ids, task_jobs):
+            if isinstance(result, cvat_api.exceptions.ApiException):
+                failure_reasons[task_id] = str(result)
+            elif isinstance(result, BaseException):
+                logger.warning(f"Failed to fetch the jobs of the CVAT task {task_id}: {result}")
+            else:
+                finished_task_jobs[task_id] = result
+
+        if not failure_reasons and not finished_task_jobs:
+            return
+
+        with SessionLocal.begin() as session:
+            uploads = cvat_service.get_active_task_uploads_by_task_id(
+                session,
+                list(failure_reasons) + list(finished_task_jobs),
+                for_update=ForUpdateParams(skip_locked=True),
             )
 
             completed: List[cvat_models.DataUpload] = []
             failed: List[cvat_models.DataUpload] = []
             for upload in uploads:
-                status, reason = cvat_api.get_task_upload_status(upload.task_id)
-                if not status or status == cvat_api.UploadStatus.FAILED:
+                if upload.task_id in failure_reasons:
                     failed.append(upload)
 
                     project = upload.task.project
@@ -363,41 +746,28 @@ def track_task_creation() -> None:
                         escrow_address=project.escrow_address,
                         chain_id=project.chain_id,
                         type=OracleWebhookTypes.job_launcher,
-                        event=ExchangeOracleEvent_TaskCreationFailed(reason=reason),
+                        event=ExchangeOracleEvent_TaskCreationFailed(
+                            reason=failure_reasons[upload.task_id]
+                        ),
                     )
-                elif status == cvat_api.UploadStatus.FINISHED:
-                    try:
-                        cvat_jobs = cvat_api.fetch_task_jobs(upload.task_id)
-
-                        existing_jobs = cvat_service.get_jobs_by_cvat_task_id(
-                            session, upload.task_id
-                        )
-                        existing_job_ids = set(j.cvat_id for j in existing_jobs)
+                else:
+                    existing_jobs = cvat_service.get_jobs_by_cvat_task_id(session, upload.task_id)
+                    existing_job_ids = set(j.cvat_id for j in existing_jobs)
 
-                        for cvat_job in cvat_jobs:
-                            if cvat_job.id in existing_job_ids:
-                                continue
+                    for cvat_job in finished_task_jobs[upload.task_id]:
+                        if cvat_job.id in existing_job_ids:
+                            continue
 
-                            cvat_service.create_job(
-                                session,
-                                cvat_job.id,
-                                upload.task_id,
-                                upload.task.cvat_project_id,
-                                status=JobStatuses(cvat_job.state),
-                            )
-
-                        completed.append(upload)
-                    except cvat_api.exceptions.ApiException as e:
-                        failed.append(upload)
-
-                        oracle_db_service.outbox.create_webhook(
+                        cvat_service.create_job(
                             session,
-                            escrow_address=project.escrow_address,
-                            chain_id=project.chain_id,
-                            type=OracleWebhookTypes.job_launcher,
-                            event=ExchangeOracleEvent_TaskCreationFailed(reason=str(e)),
+                            cvat_job.id,
+                            upload.task_id,
+                            upload.task.cvat_project_id,
+                            status=JobStatuses(cvat_job.state),
                         )
 
+                    completed.append(upload)
+
             cvat_service.finish_uploads(session, failed + completed)
 
             if completed or failed:
@@ -1,15 +1,19 @@
-import io
 import logging
+import os
+import threading
 import zipfile
+from contextlib import contextmanager
 from datetime import timedelta
 from enum import Enum
 from http import HTTPStatus
+from tempfile import SpooledTemporaryFile
 from time import sleep
-from typing import List, Optional, Tuple
+from typing import IO, Dict, Generator, List, Optional, Tuple
 
 from cvat_sdk.api_client import ApiClient, Configuration, exceptions, models
 from cvat_sdk.api_client.api_client import Endpoint
 from cvat_sdk.core.helpers import get_paginated_collection
+from urllib3 import HTTPResponse
 
 from src.core.config import Config
 from src.utils.enums import BetterEnumMeta
@@ -36,6 +40,8 @@ def _request_annotations(endpoint: Endpoint, cvat_id: int, format_name: str) ->
         _parse_response=False,
     )
 
+    response.drain_conn()
+
     assert response.status in [HTTPStatus.ACCEPTED, HTTPStatus.CREATED]
     return response.status == HTTPStatus.CREATED
 
@@ -47,7 +53,7 @@ def _get_annotations(
     format_name: str,
     attempt_interval: int = 5,
     timeout: Optional[int] = _NOTSET,
-) -> io.RawIOBase:
+) -> IO[bytes]:
     """
     Downloads annotations.
     The dataset preparation can take some time (e.g. 10 min), so it should be used like this:
@@ -77,30 +83,147 @@ def _get_annotations(
         if response.status == HTTPStatus.OK:
             break
 
+        response.drain_conn()
+
         if timeout is not None and timedelta(seconds=timeout) < (utcnow() - time_begin):
             raise Exception("Failed to retrieve the dataset from CVAT within the timeout interval")
 
         sleep(attempt_interval)
 
-    file_buffer = io.BytesIO(response.data)
-    assert zipfile.is_zipfile(file_buffer)
-    file_buffer.seek(0)
-    return file_buffer
+    return _download_zip_archive(response, chunk_size=Config.cvat_config.cvat_download_chunk_size)
 
 
-def get_api_client() -> ApiClient:
-    configuration = Configuration(
-        host=Config.cvat_config.cvat_url,
-        username=Config.cvat_config.cvat_admin,
-        password=Config.cvat_config.cvat_admin_pass,
-    )
+_ZIP_LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+
+
+def _download_zip_archive(response: HTTPResponse, *, chunk_size: int) -> IO[bytes]:
+    """
+    Reads a zip archive from the response by chunks. The archive is kept in memory
+    only if it fits into a chunk, otherwise it is written to a temporary file.
+    The file is removed when closed.
+    """
+
+    file = SpooledTemporaryFile(max_size=chunk_size)
+
+    try:
+        for chunk_index, chunk in enumerate(response.stream(chunk_size)):
+            if chunk_index == 0 and not chunk.startswith(_ZIP_LOCAL_FILE_HEADER_SIGNATURE):
+                raise Exception("The downloaded annotations are not a zip archive")
+
+            file.write(chunk)
+
+        if not zipfile.is_zipfile(file):
+            raise Exception("The downloaded annotations are not a zip archive")
+
+        file.seek(0)
+        return file
+    except BaseException:
+        file.close()
+        response.close()  # the rest of the body is not read
+        raise
+    finally:
+        response.release_conn()
+
+
+_api_client: Optional[ApiClient] = None
+_api_client_pid: Optional[int] = None
+_api_client_lock = threading.Lock()
+# Client -> number of calls using it. A replaced client is closed by its last user.
+_api_client_users: Dict[ApiClient, int] = {}
+
+
+def _create_api_client() -> ApiClient:
+    configuration = Configuration(host=Config.cvat_config.cvat_url)
+    # The client is shared by all the threads of the process
+    configuration.connection_pool_maxsize = Config.cvat_config.cvat_api_pool_size
 
     api_client = ApiClient(configuration=configuration)
     api_client.set_default_header("X-organization", Config.cvat_config.cvat_org_slug)
 
+    # Log in once and reuse the token, instead of sending the credentials,
+    # which are slow to check, with every request
+    (auth, _) = api_client.auth_api.create_login(
+        models.LoginSerializerExRequest(
+            username=Config.cvat_config.cvat_admin,
+            password=Config.cvat_config.cvat_admin_pass,
+        )
+    )
+    api_client.set_default_header("Authorization", "Token " + auth.key)
+
     return api_client
 
 
+def _close_api_client(api_client: ApiClient) -> None:
+    api_client.close()
+    # The pooled connections are not closed by the client itself
+    api_client.rest_client.pool_manager.clear()
+
+
+def reset_api_client(api_client: Optional[ApiClient] = None) -> None:
+    """
+    Replaces the shared client, so that the next call creates a new one and logs in again.
+    The replaced client is closed once the calls using it are finished.
+
+    If api_client is passed, the shared client is only replaced if it is still this one.
+    """
+
+    global _api_client, _api_client_pid
+
+    with _api_client_lock:
+        if _api_client is None or (api_client is not None and api_client is not _api_client):
+            return
+
+        replaced_client = _api_client
+        _api_client = None
+        _api_client_pid = None
+
+        if _api_client_users.get(replaced_client):
+            return
+
+    _close_api_client(replaced_client)
+
+
+@contextmanager
+def get_api_client() -> Generator[ApiClient, None, None]:
+    """
+    Returns the client shared by the process. The client keeps its connections open
+    between the calls, and is safe to use from several threads.
+    """
+
+    global _api_client, _api_client_pid
+
+    with _api_client_lock:
+        # The connections can't be shared with a forked process
+        if _api_client is None or _api_client_pid != os.getpid():
+            if _api_client is not None:
+                # The threads using the client are not copied to the forked process
+                _api_client_users.clear()
+                _close_api_client(_api_client)
+
+            _api_client = _create_api_client()
+            _api_client_pid = os.getpid()
+
+        api_client = _api_client
+        _api_client_users[api_client] = _api_client_users.get(api_client, 0) + 1
+
+    try:
+        yield api_client
+    except exceptions.UnauthorizedException:
+        # The token can be revoked, log in again on the next call
+        reset_api_client(api_client)
+        raise
+    finally:
+        with _api_client_lock:
+            users = _api_client_users.pop(api_client, 0) - 1
+            if users > 0:
+                _api_client_users[api_client] = users
+
+            close_client = users <= 0 and api_client is not _api_client
+
+        if close_client:
+            _close_api_client(api_client)
+
+
 def create_cloudstorage(
     provider: str, bucket_host: str, bucket_name: str
 ) -> models.CloudStorageRead:
@@ -178,7 +301,7 @@ def request_project_annotations(cvat_id: int, format_name: str) -> bool:
 
 def get_project_annotations(
     cvat_id: int, format_name: str, *, timeout: Optional[int] = _NOTSET
-) -> io.RawIOBase:
+) -> IO[bytes]:
     """
     Downloads annotations.
     The dataset preparation can take some time (e.g. 10 min), so it should be used like this:
@@ -327,7 +450,7 @@ def request_task_annotations(cvat_id: int, format_name: str) -> bool:
 
 def get_task_annotations(
     cvat_id: int, format_name: str, *, timeout: Optional[int] = _NOTSET
-) -> io.RawIOBase:
+) -> IO[bytes]:
     """
     Downloads annotations.
     The dataset preparation can take some time (e.g. 10 min), so it must be used like this:
@@ -398,7 +521,7 @@ def request_job_annotations(cvat_id: int, format_name: str) -> bool:
 
 def get_job_annotations(
     cvat_id: int, format_name: str, *, timeout: Optional[int] = _NOTSET
-) -> io.RawIOBase:
+) -> IO[bytes]:
     """
     Downloads annotations.
     The dataset preparation can take some time (e.g. 10 min), so it must be used like this:
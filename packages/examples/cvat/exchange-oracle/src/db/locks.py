@@ -0,0 +1,72 @@
+import hashlib
+import threading
+from typing import Optional
+
+from sqlalchemy import Connection, func, select
+
+from src.db import engine
+
+
+class AdvisoryLock:
+    """
+    A Postgres session-level advisory lock, used to elect a single process
+    to do some work. The lock is held by a dedicated connection, until it is released
+    or the connection is lost.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._key = int.from_bytes(
+            hashlib.sha256(name.encode()).digest()[:8], byteorder="big", signed=True
+        )
+        self._connection: Optional[Connection] = None
+        self._mutex = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """
+        Tries to acquire the lock without waiting. Returns True if the lock is held.
+        """
+        with self._mutex:
+            if self._connection is not None:
+                try:
+                    self._connection.execute(select(1))
+                    return True
+                except Exception:
+                    # The lock is released together with the connection
+                    self._close(invalidate=True)
+
+            connection = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+            try:
+                acquired = connection.execute(select(func.pg_try_advisory_lock(self._key))).scalar()
+            except Exception:
+                connection.close()
+                raise
+
+            if acquired:
+                self._connection = connection
+            else:
+                connection.close()
+
+            return acquired
+
+    def release(self) -> None:
+        with self._mutex:
+            if self._connection is None:
+                return
+
+            try:
+                self._connection.execute(select(func.pg_advisory_unlock(self._key)))
+            except Exception:
+                # The connection can't be reused, as it may still hold the lock
+                self._close(invalidate=True)
+                raise
+
+            self._close()
+
+    def _close(self, *, invalidate: bool = False) -> None:
+        try:
+            if invalidate:
+                self._connection.invalidate()
+            self._connection.close()
+        finally:
+            self._connection = None
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
-from typing import TypeVar, Union
+from typing import Any, Optional, TypeVar, Union
 
-from sqlalchemy import Select
+from sqlalchemy import ColumnElement, Select, func, true
 from sqlalchemy.orm import Query
 
+from src.core.config import Config
+
 
 @dataclass
 class ForUpdateParams:
@@ -14,7 +16,9 @@ class ForUpdateParams:
 T = TypeVar("T", Query, Select)
 
 
-def maybe_for_update(query: T, enable: Union[bool, ForUpdateParams]) -> T:
+def maybe_for_update(
+    query: T, enable: Union[bool, ForUpdateParams], *, of: Optional[Any] = None
+) -> T:
     if not enable:
         return query
 
@@ -26,4 +30,34 @@ def maybe_for_update(query: T, enable: Union[bool, ForUpdateParams]) -> T:
     return query.with_for_update(
         skip_locked=params.skip_locked,
         nowait=False if params.skip_locked else params.nowait,  # can't be used together
+        of=of,
+    )
+
+
+@dataclass
+class ShardParams:
+    index: int = 0
+    count: int = 1
+
+
+def get_escrow_shard() -> ShardParams:
+    """
+    Returns the escrow shard processed by the current worker
+    """
+    return ShardParams(
+        index=Config.worker_config.escrow_shard_index,
+        count=Config.worker_config.escrow_shards,
     )
+
+
+def shard_filter(
+    escrow_address: ColumnElement[str], shard: Optional[ShardParams]
+) -> ColumnElement[bool]:
+    """
+    Selects the rows of the escrows belonging to the shard
+    """
+    if not shard or shard.count == 1:
+        return true()
+
+    escrow_hash = func.hashtext(func.lower(escrow_address)).op("&")(0x7FFFFFFF)
+    return escrow_hash % shard.count == shard.index
@@ -2,14 +2,15 @@ import io
 import os
 import zipfile
 from glob import glob
-from tempfile import TemporaryDirectory
-from typing import Dict, List, Sequence
+from tempfile import SpooledTemporaryFile, TemporaryDirectory
+from typing import IO, Dict, List, Sequence
 
 import datumaro as dm
 from attrs import define
 from defusedxml import ElementTree as ET
 
 from src.core.annotation_meta import ANNOTATION_METAFILE_NAME, AnnotationMeta, JobMeta
+from src.core.config import CvatConfig
 from src.core.manifest import TaskManifest
 from src.core.types import TaskType
 from src.cvat.tasks import DM_DATASET_FORMAT_MAPPING
@@ -31,7 +32,7 @@ CVAT_EXPORT_FORMAT_TO_DM_MAPPING = {
 @define
 class FileDescriptor:
     filename: str
-    file: io.RawIOBase
+    file: IO[bytes]
 
 
 def prepare_annotation_metafile(
@@ -210,8 +211,11 @@ def postprocess_annotations(
             )
             converted_dataset.export(export_dir, resulting_format, save_images=False)
 
-            converted_dataset_archive = io.BytesIO()
+            converted_dataset_archive = SpooledTemporaryFile(
+                max_size=CvatConfig.cvat_download_chunk_size
+            )
             write_dir_to_zip_archive(export_dir, converted_dataset_archive)
             converted_dataset_archive.seek(0)
 
+            ann_descriptor.file.close()
             ann_descriptor.file = converted_dataset_archive
@@ -5,7 +5,8 @@ from dateutil.parser import parse as parse_aware_datetime
 import src.cvat.api_calls as cvat_api
 import src.models.cvat as models
 import src.services.cvat as cvat_service
-from src.core.types import AssignmentStatus, CvatEventTypes, JobStatuses
+import src.services.events as events_service
+from src.core.types import AssignmentStatus, CvatEventTypes, EventTopics, JobStatuses
 from src.db import SessionLocal
 from src.log import ROOT_LOGGER_NAME
 from src.utils.logging import get_function_logger
@@ -88,6 +89,7 @@ def handle_update_job_event(payload: dict) -> None:
                         session, matching_assignment.id, completed_at=webhook_time
                     )
                     cvat_service.update_job_status(session, job.id, new_status)
+                    events_service.notify(session, EventTopics.job_completed)
 
                     cvat_api.update_job_assignee(job.cvat_id, assignee_id=None)
 
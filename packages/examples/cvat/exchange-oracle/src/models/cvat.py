@@ -3,11 +3,22 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, relationship
 from sqlalchemy.sql import func
 
 from src.core.types import (
+    AnnotationExportStatuses,
+    AnnotationRetrievalStages,
     AssignmentStatus,
     JobStatuses,
     Networks,
@@ -32,6 +43,8 @@ class Project(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     cvat_webhook_id = Column(Integer, nullable=True)
+    # The last finished stage of the annotation retrieval, for completed projects
+    annotation_retrieval_stage = Column(String, Enum(AnnotationRetrievalStages), nullable=True)
 
     images: Mapped[List["Image"]] = relationship(
         back_populates="project", cascade="all, delete", passive_deletes=True
@@ -49,6 +62,12 @@ class Project(Base):
         passive_deletes=True,
     )
 
+    annotation_exports: Mapped[List["AnnotationExport"]] = relationship(
+        back_populates="project",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+
     def __repr__(self):
         return f"Project. id={self.id}"
 
@@ -76,6 +95,8 @@ class Task(Base):
         back_populates="task", cascade="all, delete", passive_deletes=True
     )
 
+    __table_args__ = (Index("ix_tasks_cvat_project_id_status", "cvat_project_id", "status"),)
+
     def __repr__(self):
         return f"Task. id={self.id}"
 
@@ -90,6 +111,9 @@ class DataUpload(Base):
         index=True,
         nullable=False,
     )
+    attempts = Column(Integer, server_default="0", nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    next_check_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
     task: Mapped["Task"] = relationship(back_populates="data_upload")
 
@@ -120,6 +144,11 @@ class Job(Base):
         order_by="desc(Assignment.created_at)",
     )
 
+    __table_args__ = (
+        Index("ix_jobs_cvat_task_id_status", "cvat_task_id", "status"),
+        Index("ix_jobs_cvat_project_id_status", "cvat_project_id", "status"),
+    )
+
     @property
     def latest_assignment(self) -> Optional[Assignment]:
         assignments = self.assignments
@@ -195,3 +224,28 @@ class Image(Base):
         return (
             f"Image. id={self.id} cvat_project_id={self.cvat_project_id} filename={self.filename}"
         )
+
+
+class AnnotationExport(Base):
+    __tablename__ = "annotation_exports"
+    id = Column(String, primary_key=True, index=True)
+    cvat_project_id = Column(
+        Integer,
+        ForeignKey("projects.cvat_id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+    )
+    # The project annotations are exported without a job
+    cvat_job_id = Column(Integer, ForeignKey("jobs.cvat_id", ondelete="CASCADE"), nullable=True)
+    format_name = Column(String, nullable=False)
+    status = Column(String, Enum(AnnotationExportStatuses), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    project: Mapped["Project"] = relationship(back_populates="annotation_exports")
+
+    def __repr__(self):
+        return (
+            f"AnnotationExport. id={self.id} cvat_project_id={self.cvat_project_id} "
+            f"cvat_job_id={self.cvat_job_id}"
+        )
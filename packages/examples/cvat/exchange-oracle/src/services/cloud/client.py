@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: MIT
 
 from io import BytesIO
-from typing import List, Optional
+from typing import IO, List, Optional, Union
 
 import boto3
 from botocore.exceptions import ClientError
@@ -31,7 +31,7 @@ class S3Client:
         if not access_key and not secret_key:
             self.client.meta.events.register("choose-signer.s3.*", disable_signing)
 
-    def create_file(self, bucket: str, filename: str, data: bytes = b""):
+    def create_file(self, bucket: str, filename: str, data: Union[bytes, IO[bytes]] = b""):
         self.client.put_object(Body=data, Bucket=bucket, Key=filename)
 
     def remove_file(self, bucket: str, filename: str):
@@ -1,17 +1,40 @@
 import uuid
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
-from sqlalchemy import delete, insert, update
+from sqlalchemy import ColumnElement, delete, exists, func, insert, select, update
 from sqlalchemy.orm import Session
 
-from src.core.types import AssignmentStatus, JobStatuses, ProjectStatuses, TaskStatus
-from src.db.utils import ForUpdateParams
+from src.core.types import (
+    AnnotationExportStatuses,
+    AnnotationRetrievalStages,
+    AssignmentStatus,
+    JobStatuses,
+    ProjectStatuses,
+    TaskStatus,
+)
+from src.db.utils import ForUpdateParams, ShardParams
 from src.db.utils import maybe_for_update as _maybe_for_update
-from src.models.cvat import Assignment, DataUpload, Image, Job, Project, Task, User
+from src.db.utils import shard_filter
+from src.models.cvat import (
+    AnnotationExport,
+    Assignment,
+    DataUpload,
+    Image,
+    Job,
+    Project,
+    Task,
+    User,
+)
 from src.utils.time import utcnow
 
 
+def _all_jobs_completed(job_filter: ColumnElement[bool]) -> ColumnElement[bool]:
+    return exists().where(job_filter) & ~exists().where(
+        job_filter & (Job.status != JobStatuses.completed.value)
+    )
+
+
 # Project
 def create_project(
     session: Session,
@@ -79,16 +102,32 @@ def get_projects_by_status(
     *,
     limit: int = 5,
     for_update: Union[bool, ForUpdateParams] = False,
+    shard: Optional[ShardParams] = None,
 ) -> List[Project]:
     projects = (
         _maybe_for_update(session.query(Project), enable=for_update)
         .where(Project.status == status.value)
+        .where(shard_filter(Project.escrow_address, shard))
+        # The least recently updated projects first
+        .order_by(func.coalesce(Project.updated_at, Project.created_at))
         .limit(limit)
         .all()
     )
     return projects
 
 
+def get_projects_by_cvat_ids(
+    session: Session, cvat_ids: List[int], *, for_update: Union[bool, ForUpdateParams] = False
+) -> List[Project]:
+    return (
+        _maybe_for_update(session.query(Project), enable=for_update)
+        .where(Project.cvat_id.in_(cvat_ids))
+        # The rows are locked in the same order by all the callers
+        .order_by(Project.id)
+        .all()
+    )
+
+
 def get_available_projects(
     session: Session, *, limit: int = 10, for_update: Union[bool, ForUpdateParams] = False
 ) -> List[Project]:
@@ -141,18 +180,58 @@ def update_project_status(session: Session, project_id: str, status: ProjectStat
     session.execute(upd)
 
 
+def update_project_annotation_retrieval_stage(
+    session: Session, project_id: str, stage: Optional[AnnotationRetrievalStages]
+) -> None:
+    upd = (
+        update(Project)
+        .where(Project.id == project_id)
+        .values(annotation_retrieval_stage=stage.value if stage else None)
+    )
+    session.execute(upd)
+
+
 def delete_project(session: Session, project_id: str) -> None:
     project = session.query(Project).filter_by(id=project_id).first()
     session.delete(project)
 
 
 def is_project_completed(session: Session, project_id: str) -> bool:
-    project = get_project_by_id(session, project_id)
-    jobs = get_jobs_by_cvat_project_id(session, project.cvat_id)
-    if len(jobs) > 0 and all(job.status == JobStatuses.completed.value for job in jobs):
-        return True
-    else:
-        return False
+    return session.query(
+        exists().where(
+            (Project.id == project_id) & _all_jobs_completed(Job.cvat_project_id == Project.cvat_id)
+        )
+    ).scalar()
+
+
+def complete_projects_with_completed_tasks(session: Session, *, limit: int = 10) -> List[int]:
+    """
+    Marks the "annotation" projects with all the tasks completed as completed.
+    Returns the CVAT ids of the updated projects.
+    """
+    project_tasks = exists().where(Task.cvat_project_id == Project.cvat_id)
+    unfinished_project_tasks = exists().where(
+        (Task.cvat_project_id == Project.cvat_id) & (Task.status != TaskStatus.completed.value)
+    )
+
+    completed_projects = (
+        select(Project.id)
+        .where(
+            (Project.status == ProjectStatuses.annotation.value)
+            & project_tasks
+            & ~unfinished_project_tasks
+        )
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+    statement = (
+        update(Project)
+        .where(Project.id.in_(completed_projects))
+        .values(status=ProjectStatuses.completed.value)
+        .returning(Project.cvat_id)
+    )
+    return session.execute(statement).scalars().all()
 
 
 # Task
@@ -201,6 +280,23 @@ def get_tasks_by_status(
     )
 
 
+def complete_tasks_with_completed_jobs(session: Session) -> List[int]:
+    """
+    Marks the "annotation" tasks with all the jobs completed as completed.
+    Returns the CVAT ids of the updated tasks.
+    """
+    statement = (
+        update(Task)
+        .where(
+            (Task.status == TaskStatus.annotation.value)
+            & _all_jobs_completed(Job.cvat_task_id == Task.cvat_id)
+        )
+        .values(status=TaskStatus.completed.value)
+        .returning(Task.cvat_id)
+    )
+    return session.execute(statement).scalars().all()
+
+
 def update_task_status(session: Session, task_id: int, status: TaskStatus) -> None:
     upd = update(Task).where(Task.id == task_id).values(status=status.value)
     session.execute(upd)
@@ -242,9 +338,58 @@ def get_active_task_uploads_by_task_id(
 
 
 def get_active_task_uploads(
-    session: Session, *, limit: int = 10, for_update: Union[bool, ForUpdateParams] = False
+    session: Session,
+    *,
+    limit: int = 10,
+    for_update: Union[bool, ForUpdateParams] = False,
+    shard: Optional[ShardParams] = None,
 ) -> List[DataUpload]:
-    return _maybe_for_update(session.query(DataUpload), enable=for_update).limit(limit).all()
+    """
+    Returns the uploads due for a status check. The escrows are served in turns, starting
+    from their oldest uploads, so an escrow with many tasks doesn't delay the others.
+    """
+    ranked_uploads = (
+        select(
+            DataUpload.id,
+            func.row_number()
+            .over(partition_by=Project.escrow_address, order_by=DataUpload.created_at)
+            .label("escrow_rank"),
+        )
+        .join(Task, Task.cvat_id == DataUpload.task_id)
+        .join(Project, Project.cvat_id == Task.cvat_project_id)
+        .where(DataUpload.next_check_at <= utcnow(), shard_filter(Project.escrow_address, shard))
+        .subquery()
+    )
+
+    # Window functions can't be used in a locking query, so they are computed in a subquery
+    return (
+        _maybe_for_update(session.query(DataUpload), enable=for_update, of=DataUpload)
+        .join(ranked_uploads, ranked_uploads.c.id == DataUpload.id)
+        .order_by(ranked_uploads.c.escrow_rank, DataUpload.created_at)
+        .limit(limit)
+        .all()
+    )
+
+
+def postpone_task_uploads(
+    session: Session, upload_ids: List[str], *, min_delay: int, max_delay: int
+) -> None:
+    """
+    Postpones the next status check of the uploads. The delay, in seconds, is doubled
+    after each check, up to the max_delay.
+    """
+    # The exponent is bounded, so that power() can't overflow for long-running uploads
+    delay = func.least(min_delay * func.power(2, func.least(DataUpload.attempts, 16)), max_delay)
+    upd = (
+        update(DataUpload)
+        .where(DataUpload.id.in_(upload_ids))
+        .values(
+            attempts=DataUpload.attempts + 1,
+            # make_interval(years, months, weeks, days, hours, mins, secs)
+            next_check_at=utcnow() + func.make_interval(0, 0, 0, 0, 0, 0, delay),
+        )
+    )
+    session.execute(upd)
 
 
 def finish_uploads(session: Session, uploads: list[DataUpload]) -> None:
@@ -399,6 +544,29 @@ def get_latest_assignment_by_cvat_job_id(
     )
 
 
+def get_latest_assignments_by_cvat_job_ids(
+    session: Session, cvat_job_ids: List[int]
+) -> Dict[int, Assignment]:
+    assignment_rank = (
+        func.row_number()
+        .over(partition_by=Assignment.cvat_job_id, order_by=Assignment.created_at.desc())
+        .label("rank")
+    )
+    ranked_assignments = (
+        select(Assignment.id, assignment_rank)
+        .where(Assignment.cvat_job_id.in_(cvat_job_ids))
+        .subquery()
+    )
+
+    assignments = (
+        session.query(Assignment)
+        .join(ranked_assignments, Assignment.id == ranked_assignments.c.id)
+        .where(ranked_assignments.c.rank == 1)
+        .all()
+    )
+    return {assignment.cvat_job_id: assignment for assignment in assignments}
+
+
 def get_unprocessed_expired_assignments(
     session: Session, *, limit: int = 10, for_update: Union[bool, ForUpdateParams] = False
 ) -> List[Assignment]:
@@ -444,6 +612,19 @@ def update_assignment(
     session.execute(statement)
 
 
+def update_assignments_status(
+    session: Session,
+    ids: List[str],
+    status: AssignmentStatus,
+    *,
+    current_status: Optional[AssignmentStatus] = None,
+):
+    statement = update(Assignment).where(Assignment.id.in_(ids)).values(status=status.value)
+    if current_status is not None:
+        statement = statement.where(Assignment.status == current_status.value)
+    session.execute(statement)
+
+
 def cancel_assignment(session: Session, assignment_id: str):
     update_assignment(session, assignment_id, status=AssignmentStatus.canceled)
 
@@ -452,6 +633,14 @@ def expire_assignment(session: Session, assignment_id: str):
     update_assignment(session, assignment_id, status=AssignmentStatus.expired)
 
 
+def expire_assignments(session: Session, assignment_ids: List[str]):
+    update_assignments_status(session, assignment_ids, AssignmentStatus.expired)
+
+
+def cancel_assignments(session: Session, assignment_ids: List[str]):
+    update_assignments_status(session, assignment_ids, AssignmentStatus.canceled)
+
+
 def complete_assignment(session: Session, assignment_id: str, completed_at: datetime):
     update_assignment(
         session,
@@ -501,3 +690,56 @@ def get_project_images(
         .where(Image.cvat_project_id == cvat_project_id)
         .all()
     )
+
+
+# AnnotationExport
+def create_annotation_exports(
+    session: Session, cvat_project_id: int, cvat_job_ids: List[int], format_name: str
+) -> None:
+    """
+    Registers the exports of the project annotations and of the job annotations.
+    The project export is the one without a job.
+    """
+    session.execute(
+        insert(AnnotationExport),
+        [
+            dict(
+                id=str(uuid.uuid4()),
+                cvat_project_id=cvat_project_id,
+                cvat_job_id=cvat_job_id,
+                format_name=format_name,
+                status=AnnotationExportStatuses.requested.value,
+            )
+            for cvat_job_id in [None] + cvat_job_ids
+        ],
+    )
+
+
+def get_annotation_exports_by_cvat_project_ids(
+    session: Session,
+    cvat_project_ids: List[int],
+    *,
+    for_update: Union[bool, ForUpdateParams] = False,
+) -> List[AnnotationExport]:
+    return (
+        _maybe_for_update(session.query(AnnotationExport), enable=for_update)
+        .where(AnnotationExport.cvat_project_id.in_(cvat_project_ids))
+        .all()
+    )
+
+
+def update_annotation_exports_status(
+    session: Session, export_ids: List[str], status: AnnotationExportStatuses
+) -> None:
+    upd = (
+        update(AnnotationExport)
+        .where(AnnotationExport.id.in_(export_ids))
+        .values(status=status.value)
+    )
+    session.execute(upd)
+
+
+def delete_annotation_exports_by_cvat_project_id(session: Session, cvat_project_id: int) -> None:
+    session.execute(
+        delete(AnnotationExport).where(AnnotationExport.cvat_project_id == cvat_project_id)
+    )
@@ -0,0 +1,14 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.core.types import EventTopics
+
+EVENTS_CHANNEL = "exchange_oracle_events"
+
+
+def notify(session: Session, topic: EventTopics) -> None:
+    """
+    Publishes an event to the processes listening on the events channel.
+    The event is delivered when the transaction is committed, and discarded on rollback.
+    """
+    session.execute(select(func.pg_notify(EVENTS_CHANNEL, topic.value)))
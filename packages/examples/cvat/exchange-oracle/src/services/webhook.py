@@ -10,9 +10,12 @@ from sqlalchemy.sql import select
 
 from src.core.config import Config
 from src.core.oracle_events import OracleEvent, validate_event
-from src.core.types import OracleWebhookStatuses, OracleWebhookTypes
+from src.core.types import EventTopics, OracleWebhookStatuses, OracleWebhookTypes
+from src.db.utils import ShardParams
 from src.db.utils import maybe_for_update as _maybe_for_update
+from src.db.utils import shard_filter
 from src.models.webhook import Webhook
+from src.services.events import notify
 from src.utils.enums import BetterEnumMeta
 from src.utils.time import utcnow
 
@@ -83,6 +86,10 @@ class OracleWebhookQueue:
 
             session.add(webhook)
 
+            topic = f"{self.direction.value}_{type.value}_webhook"
+            if topic in EventTopics:
+                notify(session, EventTopics(topic))
+
             return webhook_id
         return existing_webhook.id
 
@@ -93,6 +100,7 @@ class OracleWebhookQueue:
         *,
         limit: int = 10,
         for_update: bool = False,
+        shard: Optional[ShardParams] = None,
     ) -> List[Webhook]:
         webhooks = (
             _maybe_for_update(session.query(Webhook), enable=for_update)
@@ -101,6 +109,7 @@ class OracleWebhookQueue:
                 Webhook.type == sender_type.value,
                 Webhook.status == OracleWebhookStatuses.pending.value,
                 Webhook.wait_until <= utcnow(),
+                shard_filter(Webhook.escrow_address, shard),
             )
             .limit(limit)
             .all()
@@ -0,0 +1,25 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar, Union
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def map_concurrently(
+    fn: Callable[[_T], _R], items: Iterable[_T], *, max_workers: int
+) -> List[Union[_R, BaseException]]:
+    """
+    Calls the function for each item in a bounded thread pool.
+
+    The results are returned in the order of the items. If a call fails, its exception
+    is returned in place of the result, so a failed call doesn't discard the others.
+    """
+
+    items = list(items)
+    if not items:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(fn, item) for item in items]
+
+    return [f.exception() or f.result() for f in futures]
@@ -0,0 +1,61 @@
+"""
+Runs the cron jobs in a dedicated process, separately from the API.
+
+Usage: python -m src.worker [--jobs job1,job2]
+"""
+import argparse
+import logging
+import signal
+import threading
+from typing import List, Optional
+
+from src.core.config import Config
+from src.crons import parse_job_names, start_cron_jobs
+from src.db.utils import get_escrow_shard
+from src.log import ROOT_LOGGER_NAME, setup_logging
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Runs the Exchange Oracle cron jobs")
+    parser.add_argument(
+        "--jobs",
+        default=Config.worker_config.jobs,
+        help="Comma-separated names of the jobs to run. All jobs are run by default",
+    )
+    args = parser.parse_args(argv)
+
+    job_names = parse_job_names(args.jobs)
+
+    shard = get_escrow_shard()
+    if not 0 <= shard.index < shard.count:
+        raise ValueError(
+            f"Escrow shard index must be in the range [0; {shard.count}), got {shard.index}"
+        )
+
+    setup_logging()
+    logger = logging.getLogger(ROOT_LOGGER_NAME).getChild("worker")
+
+    stopped = threading.Event()
+
+    def _stop(signum, frame):
+        stopped.set()
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    scheduler, listener = start_cron_jobs(job_names)
+    logger.info(
+        f"Exchange Oracle worker is up and running. Escrow shard: {shard.index + 1}/{shard.count}, "
+        f"jobs: {', '.join(job_names)}"
+    )
+
+    stopped.wait()
+
+    logger.info("Stopping the worker")
+    if listener:
+        listener.stop()
+    scheduler.shutdown()
+
+
+if __name__ == "__main__":
+    main()
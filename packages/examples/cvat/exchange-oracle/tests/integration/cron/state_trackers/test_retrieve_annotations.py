@@ -6,6 +6,8 @@ from io import RawIOBase
 from unittest.mock import Mock, patch
 
 from src.core.types import (
+    AnnotationExportStatuses,
+    AnnotationRetrievalStages,
     ExchangeOracleEventType,
     JobStatuses,
     Networks,
@@ -13,9 +15,10 @@ from src.core.types import (
     TaskStatus,
     TaskType,
 )
-from src.crons.state_trackers import retrieve_annotations
+from src.crons.state_trackers import _check_annotation_exports, retrieve_annotations
 from src.db import SessionLocal
-from src.models.cvat import Assignment, Job, Project, Task, User
+from src.db.locks import AdvisoryLock
+from src.models.cvat import AnnotationExport, Assignment, Job, Project, Task, User
 from src.models.webhook import Webhook
 
 
@@ -313,3 +316,258 @@ class ServiceIntegrationTest(unittest.TestCase):
         db_project = self.session.query(Project).filter_by(id=project_id).first()
 
         self.assertEqual(db_project.status, ProjectStatuses.completed.value)
+
+    def test_retrieve_annotations_pending_exports(self):
+        cvat_project_id = 1
+        escrow_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+        project_id = str(uuid.uuid4())
+        cvat_project = Project(
+            id=project_id,
+            cvat_id=cvat_project_id,
+            cvat_cloudstorage_id=1,
+            status=ProjectStatuses.completed.value,
+            job_type=TaskType.image_label_binary.value,
+            escrow_address=escrow_address,
+            chain_id=Networks.localhost.value,
+            bucket_url="https://test.storage.googleapis.com/",
+        )
+        self.session.add(cvat_project)
+
+        cvat_task_id = 1
+        cvat_task = Task(
+            id=str(uuid.uuid4()),
+            cvat_id=cvat_task_id,
+            cvat_project_id=cvat_project_id,
+            status=TaskStatus.completed.value,
+        )
+        self.session.add(cvat_task)
+
+        cvat_job = Job(
+            id=str(uuid.uuid4()),
+            cvat_id=1,
+            cvat_project_id=cvat_project_id,
+            cvat_task_id=cvat_task_id,
+            status=JobStatuses.completed,
+        )
+        self.session.add(cvat_job)
+        wallet_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+        user = User(
+            wallet_address=wallet_address,
+            cvat_email="test@hmt.ai",
+            cvat_id=1,
+        )
+        self.session.add(user)
+        assignment = Assignment(
+            id=str(uuid.uuid4()),
+            user_wallet_address=wallet_address,
+            cvat_job_id=cvat_job.cvat_id,
+            expires_at=datetime.now() + timedelta(days=1),
+        )
+        self.session.add(assignment)
+        self.session.commit()
+
+        with (
+            open("tests/utils/manifest.json") as data,
+            patch("src.crons.state_trackers.get_escrow_manifest") as mock_get_manifest,
+            patch("src.crons.state_trackers.cvat_api") as mock_cvat_api,
+            patch("src.crons.state_trackers.validate_escrow"),
+            patch("src.crons.state_trackers.cloud_client.S3Client"),
+        ):
+            manifest = json.load(data)
+            mock_get_manifest.return_value = manifest
+            mock_cvat_api.request_job_annotations.return_value = False
+            mock_cvat_api.request_project_annotations.return_value = True
+
+            retrieve_annotations()
+
+            self.session.commit()
+            db_project = self.session.query(Project).filter_by(id=project_id).first()
+            self.assertEqual(db_project.status, ProjectStatuses.completed.value)
+
+            exports = self.session.query(AnnotationExport).filter_by(
+                cvat_project_id=cvat_project_id
+            )
+            self.assertEqual(
+                {(e.cvat_job_id, e.status) for e in exports},
+                {
+                    (None, AnnotationExportStatuses.ready.value),
+                    (cvat_job.cvat_id, AnnotationExportStatuses.requested.value),
+                },
+            )
+            mock_cvat_api.get_job_annotations.assert_not_called()
+
+            # Only the pending exports are checked again
+            mock_cvat_api.request_project_annotations.reset_mock()
+            mock_cvat_api.request_job_annotations.return_value = True
+
+            retrieve_annotations()
+
+            mock_cvat_api.request_project_annotations.assert_not_called()
+            mock_cvat_api.request_job_annotations.assert_called_once()
+
+        self.session.commit()
+        db_project = self.session.query(Project).filter_by(id=project_id).first()
+        self.assertEqual(db_project.status, ProjectStatuses.validation.value)
+        self.assertEqual(
+            self.session.query(AnnotationExport).filter_by(cvat_project_id=cvat_project_id).count(),
+            0,
+        )
+
+    def test_retrieve_annotations_continues_after_error(self):
+        cvat_project_id = 1
+        escrow_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+        project_id = str(uuid.uuid4())
+        cvat_project = Project(
+            id=project_id,
+            cvat_id=cvat_project_id,
+            cvat_cloudstorage_id=1,
+            status=ProjectStatuses.completed.value,
+            job_type=TaskType.image_label_binary.value,
+            escrow_address=escrow_address,
+            chain_id=Networks.localhost.value,
+            bucket_url="https://test.storage.googleapis.com/",
+        )
+        self.session.add(cvat_project)
+
+        cvat_task_id = 1
+        cvat_task = Task(
+            id=str(uuid.uuid4()),
+            cvat_id=cvat_task_id,
+            cvat_project_id=cvat_project_id,
+            status=TaskStatus.completed.value,
+        )
+        self.session.add(cvat_task)
+
+        cvat_job = Job(
+            id=str(uuid.uuid4()),
+            cvat_id=1,
+            cvat_project_id=cvat_project_id,
+            cvat_task_id=cvat_task_id,
+            status=JobStatuses.completed,
+        )
+        self.session.add(cvat_job)
+        wallet_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+        user = User(
+            wallet_address=wallet_address,
+            cvat_email="test@hmt.ai",
+            cvat_id=1,
+        )
+        self.session.add(user)
+        assignment = Assignment(
+            id=str(uuid.uuid4()),
+            user_wallet_address=wallet_address,
+            cvat_job_id=cvat_job.cvat_id,
+            expires_at=datetime.now() + timedelta(days=1),
+        )
+        self.session.add(assignment)
+        self.session.commit()
+
+        with (
+            open("tests/utils/manifest.json") as data,
+            patch("src.crons.state_trackers.get_escrow_manifest") as mock_get_manifest,
+            patch("src.crons.state_trackers.cvat_api") as mock_cvat_api,
+            patch("src.crons.state_trackers.validate_escrow"),
+            patch("src.crons.state_trackers.cloud_client.S3Client") as mock_S3Client,
+        ):
+            manifest = json.load(data)
+            mock_get_manifest.return_value = manifest
+            mock_S3Client.return_value.create_file.side_effect = Exception("Connection error")
+
+            retrieve_annotations()
+
+            self.session.commit()
+            db_project = self.session.query(Project).filter_by(id=project_id).first()
+            self.assertEqual(db_project.status, ProjectStatuses.completed.value)
+            self.assertEqual(
+                db_project.annotation_retrieval_stage, AnnotationRetrievalStages.exports_ready.value
+            )
+
+            # The exports are not requested again
+            mock_cvat_api.reset_mock()
+            mock_S3Client.return_value.create_file.side_effect = None
+
+            retrieve_annotations()
+
+            mock_cvat_api.request_project_annotations.assert_not_called()
+            mock_cvat_api.request_job_annotations.assert_not_called()
+            mock_cvat_api.get_job_annotations.assert_called_once()
+
+        self.session.commit()
+        db_project = self.session.query(Project).filter_by(id=project_id).first()
+        self.assertEqual(db_project.status, ProjectStatuses.validation.value)
+        self.assertIsNone(db_project.annotation_retrieval_stage)
+
+    def test_retrieve_annotations_skips_locked_projects(self):
+        project_id = str(uuid.uuid4())
+        cvat_project = Project(
+            id=project_id,
+            cvat_id=1,
+            cvat_cloudstorage_id=1,
+            status=ProjectStatuses.completed.value,
+            job_type=TaskType.image_label_binary.value,
+            escrow_address="0x86e83d346041E8806e352681f3F14549C0d2BC67",
+            chain_id=Networks.localhost.value,
+            bucket_url="https://test.storage.googleapis.com/",
+        )
+        self.session.add(cvat_project)
+        self.session.commit()
+
+        # The project is processed by another process
+        lock = AdvisoryLock(f"retrieve_annotations:{project_id}")
+        self.assertTrue(lock.try_acquire())
+        try:
+            with patch("src.crons.state_trackers.cvat_api") as mock_cvat_api:
+                retrieve_annotations()
+
+                mock_cvat_api.request_project_annotations.assert_not_called()
+                mock_cvat_api.request_job_annotations.assert_not_called()
+        finally:
+            lock.release()
+
+        self.session.commit()
+        db_project = self.session.query(Project).filter_by(id=project_id).first()
+        self.assertEqual(db_project.status, ProjectStatuses.completed.value)
+        self.assertIsNone(db_project.annotation_retrieval_stage)
+
+    def test_check_annotation_exports_project_not_completed(self):
+        cvat_project_id = 1
+        project_id = str(uuid.uuid4())
+        cvat_project = Project(
+            id=project_id,
+            cvat_id=cvat_project_id,
+            cvat_cloudstorage_id=1,
+            status=ProjectStatuses.annotation.value,
+            job_type=TaskType.image_label_binary.value,
+            escrow_address="0x86e83d346041E8806e352681f3F14549C0d2BC67",
+            chain_id=Networks.localhost.value,
+            bucket_url="https://test.storage.googleapis.com/",
+            annotation_retrieval_stage=AnnotationRetrievalStages.exports_requested.value,
+        )
+        self.session.add(cvat_project)
+        self.session.add(
+            AnnotationExport(
+                id=str(uuid.uuid4()),
+                cvat_project_id=cvat_project_id,
+                cvat_job_id=None,
+                format_name="CVAT for images 1.1",
+                status=AnnotationExportStatuses.requested.value,
+            )
+        )
+        self.session.commit()
+
+        # The project is not completed anymore, the retrieval is stopped
+        with patch("src.crons.state_trackers.cvat_api") as mock_cvat_api:
+            stage = _check_annotation_exports(project_id, cvat_workers=1, logger=Mock())
+
+            mock_cvat_api.request_project_annotations.assert_not_called()
+
+        self.assertIsNone(stage)
+
+        self.session.commit()
+        db_project = self.session.query(Project).filter_by(id=project_id).first()
+        self.assertEqual(db_project.status, ProjectStatuses.annotation.value)
+        self.assertIsNone(db_project.annotation_retrieval_stage)
+        self.assertEqual(
+            self.session.query(AnnotationExport).filter_by(cvat_project_id=cvat_project_id).count(),
+            0,
+        )
@@ -6,6 +6,7 @@ from unittest.mock import patch
 from sqlalchemy import update
 from sqlalchemy.sql import select
 
+import src.services.cvat as cvat_service
 from src.core.types import (
     AssignmentStatus,
     JobStatuses,
@@ -82,10 +83,95 @@ class ServiceIntegrationTest(unittest.TestCase):
         self.assertEqual(db_assignments[0].status, AssignmentStatus.created.value)
         self.assertEqual(db_assignments[1].status, AssignmentStatus.expired.value)
 
+    def test_track_expired_assignments_cvat_error(self):
+        (_, _, cvat_job) = create_project_task_and_job(
+            self.session, "0x86e83d346041E8806e352681f3F14549C0d2BC67", 1
+        )
+        wallet_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+        user = User(
+            wallet_address=wallet_address,
+            cvat_email="test@hmt.ai",
+            cvat_id=1,
+        )
+        self.session.add(user)
+        assignment = Assignment(
+            id=str(uuid.uuid4()),
+            user_wallet_address=wallet_address,
+            cvat_job_id=cvat_job.cvat_id,
+            expires_at=datetime.now() - timedelta(days=1),
+        )
+        self.session.add(assignment)
+        self.session.commit()
+
+        with patch("src.crons.state_trackers.cvat_api.update_job_assignee") as mock_cvat_api:
+            mock_cvat_api.side_effect = Exception("Connection error")
+
+            track_assignments()
+
+        self.session.commit()
+
+        # The assignment is expired again in the next run
+        db_assignment = self.session.query(Assignment).filter_by(id=assignment.id).first()
+        self.assertEqual(db_assignment.status, AssignmentStatus.created.value)
+
+    def test_track_expired_assignments_job_assigned_again(self):
+        (_, _, cvat_job) = create_project_task_and_job(
+            self.session, "0x86e83d346041E8806e352681f3F14549C0d2BC67", 1
+        )
+        wallet_address_1 = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+        self.session.add(User(wallet_address=wallet_address_1, cvat_email="test@hmt.ai", cvat_id=1))
+        wallet_address_2 = "0x86e83d346041E8806e352681f3F14549C0d2BC68"
+        self.session.add(
+            User(wallet_address=wallet_address_2, cvat_email="test2@hmt.ai", cvat_id=2)
+        )
+        assignment = Assignment(
+            id=str(uuid.uuid4()),
+            user_wallet_address=wallet_address_1,
+            cvat_job_id=cvat_job.cvat_id,
+            expires_at=datetime.now() - timedelta(days=1),
+        )
+        self.session.add(assignment)
+        self.session.commit()
+
+        new_assignment_id = str(uuid.uuid4())
+        get_jobs_by_cvat_id = cvat_service.get_jobs_by_cvat_id
+
+        def assign_job_again(*args, **kwargs):
+            # The job is assigned to another user after the assignment is expired
+            with SessionLocal.begin() as session:
+                session.add(
+                    Assignment(
+                        id=new_assignment_id,
+                        user_wallet_address=wallet_address_2,
+                        cvat_job_id=cvat_job.cvat_id,
+                        expires_at=datetime.now() + timedelta(days=1),
+                        created_at=datetime.now() + timedelta(hours=1),
+                    )
+                )
+            return get_jobs_by_cvat_id(*args, **kwargs)
+
+        with (
+            patch(
+                "src.crons.state_trackers.cvat_service.get_jobs_by_cvat_id",
+                side_effect=assign_job_again,
+            ),
+            patch("src.crons.state_trackers.cvat_api.update_job_assignee") as mock_cvat_api,
+        ):
+            track_assignments()
+
+        # The new assignee is kept
+        mock_cvat_api.assert_not_called()
+
+        self.session.commit()
+        db_assignment = self.session.query(Assignment).filter_by(id=assignment.id).first()
+        self.assertEqual(db_assignment.status, AssignmentStatus.expired.value)
+        db_assignment = self.session.query(Assignment).filter_by(id=new_assignment_id).first()
+        self.assertEqual(db_assignment.status, AssignmentStatus.created.value)
+
     # TODO:
     # Fix src/crons/state_trackers.py
     # Where in `cvat_service.get_active_assignments()` return value will be empty
-    # because it actually looking for the expired assignments 
+    # because it actually looking for the expired assignments
 
     # def test_track_canceled_assignments(self):
     #     (_, _, cvat_job) = create_project_task_and_job(
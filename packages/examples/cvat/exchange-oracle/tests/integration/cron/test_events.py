@@ -0,0 +1,47 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from src.core.types import EventTopics
+from src.crons.events import EventListener
+from src.db import SessionLocal
+from src.services.events import notify
+
+
+class EventListenerTest(unittest.TestCase):
+    def setUp(self):
+        self.triggered = threading.Event()
+        self.job = MagicMock()
+        self.job.name = "track_completed_tasks"
+        self.job.trigger.side_effect = self.triggered.set
+
+        self.listener = EventListener({EventTopics.job_completed: [self.job]}, poll_interval=0.1)
+        self.listener.start()
+
+        # The jobs are triggered once listening, to catch up on the missed events
+        self.assertTrue(self.triggered.wait(timeout=5))
+        self.triggered.clear()
+
+    def tearDown(self):
+        self.listener.stop()
+        self.listener.join(timeout=5)
+
+    def test_committed_event_triggers_jobs(self):
+        with SessionLocal.begin() as session:
+            notify(session, EventTopics.job_completed)
+
+        self.assertTrue(self.triggered.wait(timeout=5))
+
+    def test_rolled_back_event_is_discarded(self):
+        session = SessionLocal()
+        notify(session, EventTopics.job_completed)
+        session.rollback()
+        session.close()
+
+        self.assertFalse(self.triggered.wait(timeout=1))
+
+    def test_other_events_are_ignored(self):
+        with SessionLocal.begin() as session:
+            notify(session, EventTopics.project_completed)
+
+        self.assertFalse(self.triggered.wait(timeout=1))
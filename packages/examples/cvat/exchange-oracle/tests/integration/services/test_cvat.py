@@ -15,6 +15,7 @@ from src.core.types import (
     TaskType,
 )
 from src.db import SessionLocal
+from src.db.utils import ShardParams
 from src.models.cvat import Assignment, DataUpload, Image, Job, Project, Task, User
 
 from tests.utils.db_helper import (
@@ -340,6 +341,27 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         self.assertEqual(len(projects), 1)
 
+    def test_get_projects_by_status_in_shards(self):
+        escrow_addresses = [f"0x86e83d346041E8806e352681f3F14549C0d2BC{i:02}" for i in range(10)]
+        for cvat_id, escrow_address in enumerate(escrow_addresses, start=1):
+            create_project(self.session, escrow_address, cvat_id)
+
+        shard_projects = [
+            cvat_service.get_projects_by_status(
+                self.session,
+                ProjectStatuses.annotation,
+                limit=len(escrow_addresses),
+                shard=ShardParams(index=index, count=3),
+            )
+            for index in range(3)
+        ]
+
+        shard_escrow_addresses = [
+            {p.escrow_address for p in projects} for projects in shard_projects
+        ]
+        self.assertEqual(sum(len(addresses) for addresses in shard_escrow_addresses), 10)
+        self.assertEqual(set().union(*shard_escrow_addresses), set(escrow_addresses))
+
     def test_get_available_projects(self):
         cvat_id_1 = 456
         (cvat_project, cvat_task, cvat_job) = create_project_task_and_job(
@@ -602,6 +624,28 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         self.assertEqual(len(tasks), 0)
 
+    def test_complete_projects_with_completed_tasks(self):
+        (cvat_project_1, cvat_task_1) = create_project_and_task(
+            self.session, "0x86e83d346041E8806e352681f3F14549C0d2BC67", 1
+        )
+        (cvat_project_2, _) = create_project_and_task(
+            self.session, "0x86e83d346041E8806e352681f3F14549C0d2BC68", 2
+        )
+        cvat_project_3 = create_project(
+            self.session, "0x86e83d346041E8806e352681f3F14549C0d2BC69", 3
+        )
+        cvat_task_1.status = TaskStatus.completed.value
+        self.session.commit()
+
+        completed_project_ids = cvat_service.complete_projects_with_completed_tasks(self.session)
+
+        self.assertEqual(completed_project_ids, [cvat_project_1.cvat_id])
+
+        self.session.expire_all()
+        self.assertEqual(cvat_project_1.status, ProjectStatuses.completed.value)
+        self.assertEqual(cvat_project_2.status, ProjectStatuses.annotation.value)
+        self.assertEqual(cvat_project_3.status, ProjectStatuses.annotation.value)
+
     def test_get_tasks_by_status(self):
         cvat_project = create_project(self.session, "0x86e83d346041E8806e352681f3F14549C0d2BC67", 1)
 
@@ -617,6 +661,28 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         self.assertEqual(len(tasks), 1)
 
+    def test_complete_tasks_with_completed_jobs(self):
+        (_, cvat_task_1, cvat_job_1) = create_project_task_and_job(
+            self.session, "0x86e83d346041E8806e352681f3F14549C0d2BC67", 1
+        )
+        (_, cvat_task_2, _) = create_project_task_and_job(
+            self.session, "0x86e83d346041E8806e352681f3F14549C0d2BC68", 2
+        )
+        (_, cvat_task_3) = create_project_and_task(
+            self.session, "0x86e83d346041E8806e352681f3F14549C0d2BC69", 3
+        )
+        cvat_job_1.status = JobStatuses.completed.value
+        self.session.commit()
+
+        completed_task_ids = cvat_service.complete_tasks_with_completed_jobs(self.session)
+
+        self.assertEqual(completed_task_ids, [cvat_task_1.cvat_id])
+
+        self.session.expire_all()
+        self.assertEqual(cvat_task_1.status, TaskStatus.completed.value)
+        self.assertEqual(cvat_task_2.status, TaskStatus.annotation.value)
+        self.assertEqual(cvat_task_3.status, TaskStatus.annotation.value)
+
     def test_update_task_status(self):
         cvat_project = create_project(self.session, "0x86e83d346041E8806e352681f3F14549C0d2BC67", 1)
 
@@ -745,6 +811,85 @@ class ServiceIntegrationTest(unittest.TestCase):
         data_uploads = self.session.query(DataUpload).all()
         self.assertEqual(len(data_uploads), 0)
 
+    def test_get_active_task_uploads_in_turns(self):
+        (cvat_project, cvat_task) = create_project_and_task(
+            self.session, "0x86e83d346041E8806e352681f3F14549C0d2BC67", 1
+        )
+        cvat_task_ids = [cvat_task.cvat_id]
+        for cvat_task_id in [2, 3]:
+            self.session.add(
+                Task(
+                    id=str(uuid.uuid4()),
+                    cvat_id=cvat_task_id,
+                    cvat_project_id=cvat_project.cvat_id,
+                    status=TaskStatus.annotation.value,
+                )
+            )
+            cvat_task_ids.append(cvat_task_id)
+
+        (_, cvat_task_2) = create_project_and_task(
+            self.session, "0x86e83d346041E8806e352681f3F14549C0d2BC68", 4
+        )
+        cvat_task_ids.append(cvat_task_2.cvat_id)
+
+        # The uploads of the second escrow are the newest
+        now = datetime.now().astimezone()
+        for i, cvat_task_id in enumerate(cvat_task_ids):
+            self.session.add(
+                DataUpload(
+                    id=str(uuid.uuid4()),
+                    task_id=cvat_task_id,
+                    created_at=now - timedelta(minutes=len(cvat_task_ids) - i),
+                )
+            )
+
+        data_uploads = cvat_service.get_active_task_uploads(self.session, limit=2)
+        self.assertEqual([u.task_id for u in data_uploads], [1, 4])
+
+        data_uploads = cvat_service.get_active_task_uploads(self.session, limit=4)
+        self.assertEqual([u.task_id for u in data_uploads], [1, 4, 2, 3])
+
+    def test_postpone_task_uploads(self):
+        (_, cvat_task) = create_project_and_task(
+            self.session, "0x86e83d346041E8806e352681f3F14549C0d2BC67", 1
+        )
+        data_upload_id = cvat_service.create_data_upload(self.session, cvat_task.cvat_id)
+        self.session.commit()
+
+        cvat_service.postpone_task_uploads(
+            self.session, [data_upload_id], min_delay=60, max_delay=100
+        )
+        self.session.commit()
+
+        data_upload = self.session.query(DataUpload).filter_by(id=data_upload_id).first()
+        self.assertEqual(data_upload.attempts, 1)
+        first_delay = data_upload.next_check_at - datetime.now().astimezone()
+        self.assertTrue(timedelta(seconds=50) < first_delay <= timedelta(seconds=60))
+        self.assertEqual(cvat_service.get_active_task_uploads(self.session), [])
+
+        cvat_service.postpone_task_uploads(
+            self.session, [data_upload_id], min_delay=60, max_delay=100
+        )
+        self.session.commit()
+
+        data_upload = self.session.query(DataUpload).filter_by(id=data_upload_id).first()
+        self.assertEqual(data_upload.attempts, 2)
+        second_delay = data_upload.next_check_at - datetime.now().astimezone()
+        self.assertTrue(timedelta(seconds=90) < second_delay <= timedelta(seconds=100))
+
+        data_upload.attempts = 5000
+        self.session.commit()
+
+        cvat_service.postpone_task_uploads(
+            self.session, [data_upload_id], min_delay=60, max_delay=100
+        )
+        self.session.commit()
+
+        data_upload = self.session.query(DataUpload).filter_by(id=data_upload_id).first()
+        self.assertEqual(data_upload.attempts, 5001)
+        last_delay = data_upload.next_check_at - datetime.now().astimezone()
+        self.assertTrue(timedelta(seconds=90) < last_delay <= timedelta(seconds=100))
+
     def test_create_job(self):
         (cvat_project, cvat_task) = create_project_and_task(
             self.session, "0x86e83d346041E8806e352681f3F14549C0d2BC67", 1
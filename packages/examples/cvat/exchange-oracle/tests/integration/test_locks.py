@@ -0,0 +1,42 @@
+import unittest
+
+from src.db.locks import AdvisoryLock
+
+
+class AdvisoryLockTest(unittest.TestCase):
+    def setUp(self):
+        self.lock = AdvisoryLock("test:lock")
+        self.other_lock = AdvisoryLock("test:lock")
+
+    def tearDown(self):
+        self.lock.release()
+        self.other_lock.release()
+
+    def test_lock_is_held_by_a_single_owner(self):
+        self.assertTrue(self.lock.try_acquire())
+        self.assertTrue(self.lock.try_acquire())
+        self.assertFalse(self.other_lock.try_acquire())
+
+    def test_lock_can_be_acquired_after_release(self):
+        self.assertTrue(self.lock.try_acquire())
+        self.lock.release()
+
+        self.assertTrue(self.other_lock.try_acquire())
+        self.assertFalse(self.lock.try_acquire())
+
+    def test_different_locks_dont_conflict(self):
+        another_lock = AdvisoryLock("test:another_lock")
+
+        self.assertTrue(self.lock.try_acquire())
+        try:
+            self.assertTrue(another_lock.try_acquire())
+        finally:
+            another_lock.release()
+
+    def test_released_connection_is_reused(self):
+        self.assertTrue(self.lock.try_acquire())
+        dbapi_connection = self.lock._connection.connection.dbapi_connection
+        self.lock.release()
+
+        # The connection is returned to the pool instead of being closed
+        self.assertFalse(dbapi_connection.closed)
@@ -0,0 +1,45 @@
+import threading
+import unittest
+
+from src.utils.concurrency import map_concurrently
+
+
+class MapConcurrentlyTest(unittest.TestCase):
+    def test_results_are_ordered(self):
+        results = map_concurrently(lambda x: x * 2, range(10), max_workers=4)
+
+        self.assertEqual(results, [x * 2 for x in range(10)])
+
+    def test_exceptions_are_returned(self):
+        def fn(x):
+            if x == 1:
+                raise ValueError(x)
+            return x
+
+        results = map_concurrently(fn, [0, 1, 2], max_workers=2)
+
+        self.assertEqual(results[0], 0)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[2], 2)
+
+    def test_workers_are_bounded(self):
+        lock = threading.Lock()
+        active = 0
+        max_active = 0
+        barrier = threading.Barrier(2)
+
+        def fn(x):
+            nonlocal active, max_active
+            with lock:
+                active += 1
+                max_active = max(max_active, active)
+            barrier.wait(timeout=5)
+            with lock:
+                active -= 1
+
+        map_concurrently(fn, range(6), max_workers=2)
+
+        self.assertEqual(max_active, 2)
+
+    def test_no_items(self):
+        self.assertEqual(map_concurrently(lambda x: x, [], max_workers=2), [])
@@ -0,0 +1,117 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from cvat_sdk.api_client import exceptions
+
+import src.cvat.api_calls as cvat_api
+
+
+class CvatApiClientTest(unittest.TestCase):
+    def setUp(self):
+        cvat_api.reset_api_client()
+
+        self.create_login = MagicMock(return_value=(MagicMock(key="token"), None))
+        patcher = patch(
+            "cvat_sdk.api_client.apis.AuthApi.create_login",
+            self.create_login,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(cvat_api.reset_api_client)
+
+    def test_client_is_shared(self):
+        with cvat_api.get_api_client() as api_client_1:
+            pass
+        with cvat_api.get_api_client() as api_client_2:
+            pass
+
+        self.assertIs(api_client_1, api_client_2)
+        self.create_login.assert_called_once()
+        self.assertEqual(api_client_1.default_headers["Authorization"], "Token token")
+
+    def test_client_is_shared_between_threads(self):
+        api_clients = []
+
+        def get_api_client():
+            with cvat_api.get_api_client() as api_client:
+                api_clients.append(api_client)
+
+        threads = [threading.Thread(target=get_api_client) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(api_clients), 4)
+        self.assertTrue(all(api_client is api_clients[0] for api_client in api_clients))
+        self.create_login.assert_called_once()
+
+    def test_client_is_recreated_after_unauthorized_error(self):
+        with (
+            self.assertRaises(exceptions.UnauthorizedException),
+            patch("cvat_sdk.api_client.ApiClient.close") as close,
+        ):
+            with cvat_api.get_api_client() as api_client_1:
+                raise exceptions.UnauthorizedException(status=401)
+
+        close.assert_called_once()
+
+        with cvat_api.get_api_client() as api_client_2:
+            pass
+
+        self.assertIsNot(api_client_1, api_client_2)
+        self.assertEqual(self.create_login.call_count, 2)
+
+    def test_client_is_closed_after_its_last_user(self):
+        with patch("src.cvat.api_calls._close_api_client") as close_api_client:
+            with cvat_api.get_api_client() as api_client_1:
+                with (
+                    self.assertRaises(exceptions.UnauthorizedException),
+                    cvat_api.get_api_client() as api_client,
+                ):
+                    raise exceptions.UnauthorizedException(status=401)
+
+                # Still used by the first call
+                close_api_client.assert_not_called()
+
+                with cvat_api.get_api_client() as api_client_2:
+                    pass
+
+            close_api_client.assert_called_once_with(api_client_1)
+
+        self.assertIs(api_client, api_client_1)
+        self.assertIsNot(api_client_1, api_client_2)
+
+    def test_unauthorized_error_does_not_reset_newer_client(self):
+        with cvat_api.get_api_client() as api_client_1:
+            pass
+        cvat_api.reset_api_client()
+
+        with cvat_api.get_api_client() as api_client_2:
+            pass
+
+        with patch("src.cvat.api_calls._close_api_client") as close_api_client:
+            cvat_api.reset_api_client(api_client_1)
+
+        close_api_client.assert_not_called()
+        with cvat_api.get_api_client() as api_client_3:
+            pass
+
+        self.assertIsNot(api_client_1, api_client_2)
+        self.assertIs(api_client_2, api_client_3)
+        self.assertEqual(self.create_login.call_count, 2)
+
+    def test_client_is_recreated_in_forked_process(self):
+        with cvat_api.get_api_client() as api_client_1:
+            pass
+
+        with (
+            patch("src.cvat.api_calls.os.getpid", return_value=-1),
+            patch.object(api_client_1, "close") as close,
+        ):
+            with cvat_api.get_api_client() as api_client_2:
+                pass
+
+        self.assertIsNot(api_client_1, api_client_2)
+        close.assert_called_once()
@@ -0,0 +1,83 @@
+import io
+import unittest
+import zipfile
+from http import HTTPStatus
+from tempfile import SpooledTemporaryFile
+from unittest.mock import MagicMock, patch
+
+from urllib3 import HTTPResponse
+
+import src.cvat.api_calls as cvat_api
+
+
+def make_zip_archive(size: int) -> bytes:
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_STORED) as zip_file:
+        zip_file.writestr("annotations.xml", b"a" * size)
+    return archive.getvalue()
+
+
+def make_response(body: bytes, status: int = HTTPStatus.OK) -> HTTPResponse:
+    return HTTPResponse(body=io.BytesIO(body), status=status, preload_content=False)
+
+
+class CvatApiDownloadTest(unittest.TestCase):
+    def test_can_download_zip_archive(self):
+        data = make_zip_archive(100)
+        response = make_response(data)
+
+        with cvat_api._download_zip_archive(response, chunk_size=16) as file:
+            self.assertEqual(file.read(), data)
+            self.assertTrue(file._rolled)  # written to disk
+
+    def test_small_archive_is_kept_in_memory(self):
+        data = make_zip_archive(10)
+        response = make_response(data)
+
+        with cvat_api._download_zip_archive(response, chunk_size=len(data) + 1) as file:
+            self.assertEqual(file.read(), data)
+            self.assertFalse(file._rolled)
+
+    def test_download_reads_by_chunks(self):
+        data = make_zip_archive(100)
+        response = make_response(data)
+        response.stream = MagicMock(wraps=response.stream)
+
+        with cvat_api._download_zip_archive(response, chunk_size=16):
+            pass
+
+        response.stream.assert_called_once_with(16)
+
+    def test_download_fails_for_non_zip_data(self):
+        for data in [b"", b"not a zip file", make_zip_archive(100)[:-10]]:
+            with self.subTest(data=data[:10]):
+                response = make_response(data)
+                files = []
+
+                def make_file(*args, **kwargs):
+                    files.append(SpooledTemporaryFile(*args, **kwargs))
+                    return files[-1]
+
+                with (
+                    patch("src.cvat.api_calls.SpooledTemporaryFile", make_file),
+                    self.assertRaisesRegex(Exception, "not a zip archive"),
+                ):
+                    cvat_api._download_zip_archive(response, chunk_size=16)
+
+                self.assertEqual(len(files), 1)
+                self.assertTrue(files[0].closed)
+
+    def test_get_annotations_waits_for_export(self):
+        data = make_zip_archive(100)
+        endpoint = MagicMock()
+        endpoint.call_with_http_info.side_effect = [
+            (None, make_response(b"", status=HTTPStatus.ACCEPTED)),
+            (None, make_response(data)),
+        ]
+
+        with patch("src.cvat.api_calls.sleep"):
+            file = cvat_api._get_annotations(endpoint, cvat_id=1, format_name="COCO 1.0")
+
+        with file:
+            self.assertEqual(file.read(), data)
+        self.assertEqual(endpoint.call_with_http_info.call_count, 2)
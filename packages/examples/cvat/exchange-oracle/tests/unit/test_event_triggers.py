@@ -0,0 +1,64 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from src.crons.events import EventTriggeredJob
+
+
+class EventTriggeredJobTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = MagicMock()
+
+    def test_trigger_schedules_a_run(self):
+        def fn():
+            pass
+
+        job = EventTriggeredJob(fn, self.scheduler)
+
+        job.trigger()
+        job.trigger()
+
+        self.assertEqual(self.scheduler.add_job.call_count, 2)
+        self.assertEqual(
+            {c.kwargs["id"] for c in self.scheduler.add_job.call_args_list}, {"fn:triggered"}
+        )
+        self.assertTrue(
+            all(c.kwargs["replace_existing"] for c in self.scheduler.add_job.mock_calls)
+        )
+
+    def test_job_is_rerun_if_triggered_while_running(self):
+        calls = []
+
+        def fn():
+            calls.append(1)
+            if len(calls) == 1:
+                job.trigger()
+
+        job = EventTriggeredJob(fn, self.scheduler)
+
+        job()
+
+        self.assertEqual(len(calls), 2)
+
+    def test_runs_do_not_overlap(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+
+        job = EventTriggeredJob(fn, self.scheduler)
+
+        thread = threading.Thread(target=job)
+        thread.start()
+        started.wait(timeout=5)
+
+        job()  # returns immediately, the job is already running
+
+        release.set()
+        thread.join()
+
+        self.assertEqual(len(calls), 1)
@@ -0,0 +1,18 @@
+import unittest
+
+from src.crons import CRON_JOBS, parse_job_names
+
+
+class ParseJobNamesTest(unittest.TestCase):
+    def test_can_parse_job_names(self):
+        self.assertEqual(
+            parse_job_names(" retrieve_annotations,track_task_creation ,"),
+            ["retrieve_annotations", "track_task_creation"],
+        )
+
+    def test_all_jobs_are_selected_by_default(self):
+        self.assertEqual(parse_job_names(""), list(CRON_JOBS))
+
+    def test_raises_on_unknown_job_names(self):
+        with self.assertRaisesRegex(ValueError, "unknown_job"):
+            parse_job_names("retrieve_annotations,unknown_job")
@@ -1,47 +1,51 @@
 import json
+from functools import lru_cache
 from typing import Any
 
 from eth_account.messages import encode_defunct
 from web3 import Web3
-from web3.middleware import construct_sign_and_send_raw_middleware
+from web3.middleware import (
+    construct_sign_and_send_raw_middleware,
+    construct_simple_cache_middleware,
+)
 from web3.providers.rpc import HTTPProvider
+from web3.types import RPCEndpoint
 
 from src.core.config import Config
 from src.core.types import Networks
 
 
+@lru_cache(maxsize=None)
+def _create_web3(rpc_api: str, private_key: str) -> Web3:
+    w3 = Web3(HTTPProvider(rpc_api))
+    gas_payer = w3.eth.account.from_key(private_key)
+    w3.middleware_onion.add(
+        construct_sign_and_send_raw_middleware(gas_payer),
+        "construct_sign_and_send_raw_middleware",
+    )
+    # The chain id is requested for every signed transaction
+    w3.middleware_onion.add(
+        construct_simple_cache_middleware(rpc_whitelist=[RPCEndpoint("eth_chainId")]),
+        "simple_cache",
+    )
+    w3.eth.default_account = gas_payer.address
+    return w3
+
+
 def get_web3(chain_id: Networks):
     match chain_id:
         case Config.polygon_mainnet.chain_id:
-            w3 = Web3(HTTPProvider(Config.polygon_mainnet.rpc_api))
-            gas_payer = w3.eth.account.from_key(Config.polygon_mainnet.private_key)
-            w3.middleware_onion.add(
-                construct_sign_and_send_raw_middleware(gas_payer),
-                "construct_sign_and_send_raw_middleware",
-            )
-            w3.eth.default_account = gas_payer.address
-            return w3
+            network_config = Config.polygon_mainnet
         case Config.polygon_mumbai.chain_id:
-            w3 = Web3(HTTPProvider(Config.polygon_mumbai.rpc_api))
-            gas_payer = w3.eth.account.from_key(Config.polygon_mumbai.private_key)
-            w3.middleware_onion.add(
-                construct_sign_and_send_raw_middleware(gas_payer),
-                "construct_sign_and_send_raw_middleware",
-            )
-            w3.eth.default_account = gas_payer.address
-            return w3
+            network_config = Config.polygon_mumbai
         case Config.localhost.chain_id:
-            w3 = Web3(HTTPProvider(Config.localhost.rpc_api))
-            gas_payer = w3.eth.account.from_key(Config.localhost.private_key)
-            w3.middleware_onion.add(
-                construct_sign_and_send_raw_middleware(gas_payer),
-                "construct_sign_and_send_raw_middleware",
-            )
-            w3.eth.default_account = gas_payer.address
-            return w3
+            network_config = Config.localhost
         case _:
             raise ValueError(f"{chain_id} is not in available list of networks.")
 
+    # The instance is shared by all the calls for the same network
+    return _create_web3(network_config.rpc_api, network_config.private_key)
+
 
 def serialize_message(message: Any) -> str:
     return json.dumps(message, separators=(",", ":"))
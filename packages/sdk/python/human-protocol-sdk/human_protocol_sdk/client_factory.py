@@ -0,0 +1,258 @@
+"""
+This class creates the clients of the SDK for several networks, while sharing
+one Web3 instance per network.
+
+Creating a Web3 instance and a client is not free: each client injects its
+middlewares, asks the node for its chain id and builds its contracts. The
+factory builds the Web3 instance of a network once, with a pooled HTTP
+session, the signing middleware and a cache for the chain id, and keeps the
+clients it hands out, so that hot paths can ask for a client on every call.
+
+Code Example
+------------
+
+.. code-block:: python
+
+    from human_protocol_sdk.client_factory import ClientFactory
+    from human_protocol_sdk.constants import ChainId
+
+    factory = ClientFactory(
+        rpc_urls={
+            ChainId.POLYGON: "https://polygon-rpc.com",
+            ChainId.POLYGON_MUMBAI: "https://rpc-mumbai.maticvigil.com",
+        },
+        private_key="YOUR_PRIVATE_KEY",
+    )
+
+    escrow_client = factory.get_escrow_client(ChainId.POLYGON)
+    w3 = factory.get_web3(ChainId.POLYGON_MUMBAI)
+
+Module
+------
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+from web3.middleware import (
+    construct_sign_and_send_raw_middleware,
+    construct_simple_cache_middleware,
+    geth_poa_middleware,
+)
+from web3.providers.rpc import HTTPProvider
+from web3.types import RPCEndpoint
+
+from human_protocol_sdk.constants import ChainId
+from human_protocol_sdk.escrow import EscrowClient
+from human_protocol_sdk.kvstore import KVStoreClient
+from human_protocol_sdk.signer import LocalSigner
+from human_protocol_sdk.staking import StakingClient
+
+DEFAULT_REQUEST_TIMEOUT = 30
+DEFAULT_POOL_SIZE = 10
+
+# Requests whose responses never change for a given node
+CACHED_RPC_METHODS = (RPCEndpoint("eth_chainId"), RPCEndpoint("net_version"))
+
+
+class ClientFactoryError(Exception):
+    """
+    Raises when some error happens when creating a client.
+    """
+
+    pass
+
+
+class ClientFactory:
+    """
+    A class used to create and share the clients of several networks.
+    """
+
+    def __init__(
+        self,
+        rpc_urls: Optional[Dict[Union[ChainId, int], str]] = None,
+        private_key: Optional[str] = None,
+        request_timeout: Optional[float] = DEFAULT_REQUEST_TIMEOUT,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        local_signer: bool = False,
+    ):
+        """
+        Initializes a ClientFactory instance.
+
+        :param rpc_urls: RPC URL of each network
+        :param private_key: (Optional) Private key used to sign the
+            transactions sent on every network
+        :param request_timeout: (Optional) Timeout of the RPC requests, in seconds
+        :param pool_size: Maximum number of connections kept open per network
+        :param local_signer: Sign the transactions with a ``LocalSigner``
+            instead of the signing middleware
+        """
+        self.request_timeout = request_timeout
+        self.pool_size = pool_size
+        self.local_signer = local_signer
+
+        self._networks: Dict[ChainId, Dict[str, Optional[str]]] = {}
+        self._web3: Dict[ChainId, Web3] = {}
+        self._clients: Dict[ChainId, Dict[type, Any]] = {}
+        self._lock = threading.RLock()
+
+        for chain_id, rpc_url in (rpc_urls or {}).items():
+            self.add_network(chain_id, rpc_url, private_key)
+
+    @property
+    def chain_ids(self) -> List[ChainId]:
+        """Networks known by the factory."""
+        return list(self._networks)
+
+    def add_network(
+        self,
+        chain_id: Union[ChainId, int],
+        rpc_url: str,
+        private_key: Optional[str] = None,
+    ) -> None:
+        """
+        Adds or replaces a network.
+
+        The clients already created for the network are discarded.
+
+        :param chain_id: Network chain id
+        :param rpc_url: RPC URL of the network
+        :param private_key: (Optional) Private key used to sign the
+            transactions sent on the network
+
+        :raise ClientFactoryError: If the chain id is not supported
+        """
+        chain_id = self._get_chain_id(chain_id)
+
+        with self._lock:
+            self._networks[chain_id] = {"rpc_url": rpc_url, "private_key": private_key}
+            self._web3.pop(chain_id, None)
+            self._clients.pop(chain_id, None)
+
+    def get_web3(self, chain_id: Union[ChainId, int]) -> Web3:
+        """
+        Gets the Web3 instance of a network.
+
+        The instance is created on the first call, and shared afterwards.
+
+        :param chain_id: Network chain id
+
+        :return: The Web3 instance of the network
+
+        :raise ClientFactoryError: If the network was not added to the factory
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.client_factory import ClientFactory
+                from human_protocol_sdk.constants import ChainId
+
+                factory = ClientFactory({ChainId.POLYGON: "https://polygon-rpc.com"})
+
+                w3 = factory.get_web3(ChainId.POLYGON)
+        """
+        chain_id = self._get_chain_id(chain_id)
+
+        w3 = self._web3.get(chain_id)
+        if w3 is not None:
+            return w3
+
+        with self._lock:
+            if chain_id not in self._web3:
+                if chain_id not in self._networks:
+                    raise ClientFactoryError(
+                        f"Network is not configured: {chain_id.name}"
+                    )
+                self._web3[chain_id] = self._create_web3(**self._networks[chain_id])
+            return self._web3[chain_id]
+
+    def get_escrow_client(self, chain_id: Union[ChainId, int]) -> EscrowClient:
+        """
+        Gets the escrow client of a network.
+
+        :param chain_id: Network chain id
+
+        :return: The escrow client of the network
+
+        :raise ClientFactoryError: If the network was not added to the factory
+        """
+        return self._get_client(chain_id, EscrowClient)
+
+    def get_staking_client(self, chain_id: Union[ChainId, int]) -> StakingClient:
+        """
+        Gets the staking client of a network.
+
+        :param chain_id: Network chain id
+
+        :return: The staking client of the network
+
+        :raise ClientFactoryError: If the network was not added to the factory
+        """
+        return self._get_client(chain_id, StakingClient)
+
+    def get_kvstore_client(self, chain_id: Union[ChainId, int]) -> KVStoreClient:
+        """
+        Gets the KVStore client of a network.
+
+        :param chain_id: Network chain id
+
+        :return: The KVStore client of the network
+
+        :raise ClientFactoryError: If the network was not added to the factory
+        """
+        return self._get_client(chain_id, KVStoreClient)
+
+    def _get_client(self, chain_id: Union[ChainId, int], client_class: Callable):
+        chain_id = self._get_chain_id(chain_id)
+
+        client = self._clients.get(chain_id, {}).get(client_class)
+        if client is not None:
+            return client
+
+        w3 = self.get_web3(chain_id)
+        with self._lock:
+            clients = self._clients.setdefault(chain_id, {})
+            if client_class not in clients:
+                clients[client_class] = client_class(w3)
+            return clients[client_class]
+
+    def _create_web3(self, rpc_url: str, private_key: Optional[str]) -> Web3:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size, pool_maxsize=self.pool_size
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        request_kwargs = {}
+        if self.request_timeout is not None:
+            request_kwargs["timeout"] = self.request_timeout
+
+        w3 = Web3(HTTPProvider(rpc_url, request_kwargs=request_kwargs, session=session))
+        w3.middleware_onion.inject(geth_poa_middleware, "geth_poa", layer=0)
+        w3.middleware_onion.add(
+            construct_simple_cache_middleware(rpc_whitelist=CACHED_RPC_METHODS),
+            "simple_cache",
+        )
+
+        if private_key and self.local_signer:
+            LocalSigner(w3, private_key).attach()
+        elif private_key:
+            gas_payer = w3.eth.account.from_key(private_key)
+            w3.middleware_onion.add(
+                construct_sign_and_send_raw_middleware(gas_payer),
+                "construct_sign_and_send_raw_middleware",
+            )
+            w3.eth.default_account = gas_payer.address
+
+        return w3
+
+    @staticmethod
+    def _get_chain_id(chain_id: Union[ChainId, int]) -> ChainId:
+        try:
+            return ChainId(chain_id)
+        except ValueError:
+            raise ClientFactoryError(f"Invalid ChainId: {chain_id}")
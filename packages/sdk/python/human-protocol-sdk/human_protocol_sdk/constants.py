@@ -253,6 +253,9 @@ ARTIFACTS_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), "art
 
 GAS_LIMIT = int(os.getenv("GAS_LIMIT", 4712388))
 
+# Multicall3 is deployed at the same address on all supported networks
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
 
 class KVStoreKeys(Enum):
     """Enum for KVStore keys"""
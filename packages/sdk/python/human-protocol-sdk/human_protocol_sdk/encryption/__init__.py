@@ -2,5 +2,6 @@
 Encryption utility to encrypt/decrypt and sign/verify messages and secure protocol.
 """
 
-from .encryption import Encryption
+from .encryption import Encryption, EncryptionResult
 from .encryption_utils import EncryptionUtils
+from .keyring import Keyring
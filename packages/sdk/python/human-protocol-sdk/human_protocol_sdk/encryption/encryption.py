@@ -40,10 +40,38 @@ Module
 ------
 """
 
-from typing import Optional, List
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Callable, Optional, List, Union
 from pgpy import PGPKey, PGPMessage
 from pgpy.constants import SymmetricKeyAlgorithm
-from pgpy.errors import PGPError
+from pgpy.errors import PGPDecryptionError, PGPError
+
+from human_protocol_sdk.encryption import streaming
+from human_protocol_sdk.encryption.keyring import Keyring, PublicKey, default_keyring
+
+
+class EncryptionResult:
+    """
+    A class that represents the result of processing one message of a batch.
+    """
+
+    def __init__(
+        self, message: Optional[str] = None, error: Optional[Exception] = None
+    ):
+        """
+        Initializes an EncryptionResult instance.
+
+        :param message: Processed message. None if the processing failed.
+        :param error: Error raised while processing the message. Defaults to None.
+        """
+        self.message = message
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """True if the message was processed successfully."""
+        return self.error is None
 
 
 class Encryption:
@@ -74,12 +102,20 @@ class Encryption:
             else:
                 raise ValueError("Private key locked. Passphrase needed")
 
-    def sign_and_encrypt(self, message: str, public_keys: List[str]) -> str:
+    def sign_and_encrypt(
+        self,
+        message: str,
+        public_keys: Union[List[PublicKey], Keyring],
+        keyring: Optional[Keyring] = None,
+    ) -> str:
         """
         Signs and encrypts a message using the private key and recipient's public keys.
 
         :param message: Message to sign and encrypt
-        :param public_keys: List of armored public keys of the recipients
+        :param public_keys: List of armored public keys of the recipients,
+            or a keyring with the public keys of the recipients
+        :param keyring: Keyring used to resolve the public keys. Defaults to
+            a shared keyring which caches the recently used keys.
 
         :return: Armored and signed/encrypted message
 
@@ -152,19 +188,25 @@ class Encryption:
         cipher = SymmetricKeyAlgorithm.AES256
         sessionkey = cipher.gen_key()
 
-        for public_key in public_keys:
-            recipient_key, _ = PGPKey.from_blob(public_key)
+        for recipient_key in (keyring or default_keyring).get_many(public_keys):
             pgp_message = recipient_key.encrypt(pgp_message, sessionkey)
 
         del sessionkey
         return pgp_message.__str__()
 
-    def decrypt(self, message: str, public_key: Optional[str] = None) -> str:
+    def decrypt(
+        self,
+        message: str,
+        public_key: Optional[PublicKey] = None,
+        keyring: Optional[Keyring] = None,
+    ) -> str:
         """
         Decrypts a message using the private key.
 
         :param message: Armored message to decrypt
         :param public_key: Armored public key used for signature verification. Defaults to None.
+        :param keyring: Keyring used to resolve the public key. Defaults to
+            a shared keyring which caches the recently used keys.
 
         :return: Decrypted message
 
@@ -206,7 +248,7 @@ class Encryption:
             else:
                 decrypted_message = self.private_key.decrypt(pgp_message)
             if public_key:
-                public_key, _ = PGPKey.from_blob(public_key)
+                public_key = (keyring or default_keyring).get(public_key)
                 public_key.verify(decrypted_message)
 
             return decrypted_message.message.__str__()
@@ -221,6 +263,40 @@ class Encryption:
                 )
             raise ValueError("Failed to decrypt message: {}".format(str(e)))
 
+    def decrypt_stream(self, source: BinaryIO, output: BinaryIO) -> None:
+        """
+        Decrypts a stream using the private key.
+
+        The stream is read and decrypted in chunks, so the memory usage does
+        not depend on its size. Only streams written by
+        ``EncryptionUtils.encrypt_stream`` are supported. The integrity of each
+        chunk is checked before it is written, but the output is incomplete
+        and must be discarded if an error is raised.
+
+        :param source: Binary stream with the encrypted stream, binary or armored
+        :param output: Binary stream the decrypted data is written to
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.encryption import Encryption
+
+                encryption = Encryption(private_key, passphrase)
+
+                with open("results.zip.pgp", "rb") as source, open(
+                    "results.zip", "wb"
+                ) as output:
+                    encryption.decrypt_stream(source, output)
+        """
+        try:
+            if not self.private_key.is_unlocked:
+                with self.private_key.unlock(self.passphrase):
+                    streaming.decrypt_stream(source, output, self.private_key)
+            else:
+                streaming.decrypt_stream(source, output, self.private_key)
+        except (PGPError, PGPDecryptionError) as e:
+            raise ValueError("Failed to decrypt message: {}".format(str(e)))
+
     def sign(self, message: str) -> str:
         """
         Signs a message using the private key.
@@ -265,3 +341,159 @@ class Encryption:
         else:
             message |= self.private_key.sign(message)
         return message.__str__()
+
+    def encrypt_many(
+        self,
+        messages: List[str],
+        public_keys: Union[List[PublicKey], Keyring],
+        keyring: Optional[Keyring] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[EncryptionResult]:
+        """
+        Signs and encrypts many messages in parallel, using a pool of processes.
+
+        The keys are parsed once per process. A message which fails does not
+        stop the others: its error is returned in its result instead.
+
+        :param messages: Messages to sign and encrypt
+        :param public_keys: List of armored public keys of the recipients,
+            or a keyring with the public keys of the recipients
+        :param keyring: Keyring used to resolve the public keys. Defaults to
+            a shared keyring which caches the recently used keys.
+        :param max_workers: Maximum number of processes. Defaults to the number
+            of CPUs. Messages are processed in the current process when 1.
+
+        :return: Results in the order of the messages
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.encryption import Encryption
+
+                encryption = Encryption(private_key, passphrase)
+                results = encryption.encrypt_many(
+                    ["message 1", "message 2"], [public_key2, public_key3]
+                )
+
+                for result in results:
+                    if result.ok:
+                        print(result.message)
+                    else:
+                        print(result.error)
+        """
+        recipient_keys = (keyring or default_keyring).get_many(public_keys)
+
+        return self._process_many(
+            _sign_and_encrypt_message, messages, recipient_keys, max_workers
+        )
+
+    def decrypt_many(
+        self,
+        messages: List[str],
+        public_key: Optional[PublicKey] = None,
+        keyring: Optional[Keyring] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[EncryptionResult]:
+        """
+        Decrypts many messages in parallel, using a pool of processes.
+
+        The keys are parsed once per process. A message which fails does not
+        stop the others: its error is returned in its result instead.
+
+        :param messages: Armored messages to decrypt
+        :param public_key: Armored public key used for signature verification. Defaults to None.
+        :param keyring: Keyring used to resolve the public key. Defaults to
+            a shared keyring which caches the recently used keys.
+        :param max_workers: Maximum number of processes. Defaults to the number
+            of CPUs. Messages are processed in the current process when 1.
+
+        :return: Results in the order of the messages
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.encryption import Encryption
+
+                encryption = Encryption(private_key, passphrase)
+                results = encryption.decrypt_many(encrypted_messages)
+
+                decrypted_messages = [result.message for result in results]
+        """
+        public_keys = (
+            [(keyring or default_keyring).get(public_key)] if public_key else []
+        )
+
+        return self._process_many(_decrypt_message, messages, public_keys, max_workers)
+
+    def _process_many(
+        self,
+        process: Callable[["Encryption", List[PGPKey], str], str],
+        messages: List[str],
+        public_keys: List[PGPKey],
+        max_workers: Optional[int],
+    ) -> List[EncryptionResult]:
+        if max_workers == 1 or len(messages) <= 1:
+            return [
+                _process_message(process, self, public_keys, message)
+                for message in messages
+            ]
+
+        max_workers = min(max_workers or os.cpu_count() or 1, len(messages))
+        # Keys are sent armored, as parsed keys are expensive to pickle
+        initargs = (
+            str(self.private_key),
+            getattr(self, "passphrase", None),
+            [str(public_key) for public_key in public_keys],
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=initargs
+        ) as executor:
+            return list(
+                executor.map(
+                    _process_worker_message,
+                    [process] * len(messages),
+                    messages,
+                    chunksize=max(1, len(messages) // (max_workers * 4)),
+                )
+            )
+
+
+_worker_encryption: Optional[Encryption] = None
+_worker_public_keys: List[PGPKey] = []
+
+
+def _init_worker(
+    private_key_armored: str, passphrase: Optional[str], public_keys: List[str]
+) -> None:
+    global _worker_encryption, _worker_public_keys
+
+    _worker_encryption = Encryption(private_key_armored, passphrase)
+    _worker_public_keys = [
+        PGPKey.from_blob(public_key)[0] for public_key in public_keys
+    ]
+
+
+def _process_worker_message(process, message: str) -> EncryptionResult:
+    return _process_message(process, _worker_encryption, _worker_public_keys, message)
+
+
+def _process_message(
+    process, encryption: Encryption, public_keys: List[PGPKey], message: str
+) -> EncryptionResult:
+    try:
+        return EncryptionResult(message=process(encryption, public_keys, message))
+    except Exception as e:
+        return EncryptionResult(error=e)
+
+
+def _sign_and_encrypt_message(
+    encryption: Encryption, public_keys: List[PGPKey], message: str
+) -> str:
+    return encryption.sign_and_encrypt(message, public_keys)
+
+
+def _decrypt_message(
+    encryption: Encryption, public_keys: List[PGPKey], message: str
+) -> str:
+    return encryption.decrypt(message, public_keys[0] if public_keys else None)
@@ -45,11 +45,14 @@ Module
 ------
 """
 
-from typing import List
-from pgpy import PGPKey, PGPMessage
+from typing import BinaryIO, List, Optional, Union
+from pgpy import PGPMessage
 from pgpy.constants import SymmetricKeyAlgorithm
 from pgpy.errors import PGPError
 
+from human_protocol_sdk.encryption import streaming
+from human_protocol_sdk.encryption.keyring import Keyring, PublicKey, default_keyring
+
 
 class EncryptionUtils:
     """
@@ -57,12 +60,19 @@ class EncryptionUtils:
     """
 
     @staticmethod
-    def encrypt(message: str, public_keys: List[str]) -> str:
+    def encrypt(
+        message: str,
+        public_keys: Union[List[PublicKey], Keyring],
+        keyring: Optional[Keyring] = None,
+    ) -> str:
         """
         Encrypts a message using the recipient's public keys.
 
         :param message: Message to encrypt
-        :param public_keys: List of armored public keys of the recipients
+        :param public_keys: List of armored public keys of the recipients,
+            or a keyring with the public keys of the recipients
+        :param keyring: Keyring used to resolve the public keys. Defaults to
+            a shared keyring which caches the recently used keys.
 
         :return: Armored and encrypted message
 
@@ -108,20 +118,66 @@ class EncryptionUtils:
         cipher = SymmetricKeyAlgorithm.AES256
         sessionkey = cipher.gen_key()
 
-        for public_key in public_keys:
-            recipient_key, _ = PGPKey.from_blob(public_key)
+        for recipient_key in (keyring or default_keyring).get_many(public_keys):
             pgp_message = recipient_key.encrypt(pgp_message, sessionkey)
 
         del sessionkey
         return pgp_message.__str__()
 
     @staticmethod
-    def verify(message: str, public_key: str) -> bool:
+    def encrypt_stream(
+        source: BinaryIO,
+        output: BinaryIO,
+        public_keys: Union[List[PublicKey], Keyring],
+        keyring: Optional[Keyring] = None,
+        armor: bool = False,
+    ) -> None:
+        """
+        Encrypts a stream using the recipient's public keys.
+
+        The stream is read and encrypted in chunks, so the memory usage does
+        not depend on its size. Each chunk is encrypted as a separate OpenPGP
+        message. The stream is binary unless ``armor`` is set, and can be
+        decrypted with ``Encryption.decrypt_stream``.
+
+        :param source: Binary stream with the data to encrypt
+        :param output: Binary stream the encrypted stream is written to
+        :param public_keys: List of armored public keys of the recipients,
+            or a keyring with the public keys of the recipients
+        :param keyring: Keyring used to resolve the public keys. Defaults to
+            a shared keyring which caches the recently used keys.
+        :param armor: Write an ASCII armored stream. Defaults to False.
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.encryption import EncryptionUtils
+
+                with open("results.zip", "rb") as source, open(
+                    "results.zip.pgp", "wb"
+                ) as output:
+                    EncryptionUtils.encrypt_stream(
+                        source, output, [public_key2, public_key3]
+                    )
+        """
+        streaming.encrypt_stream(
+            source,
+            output,
+            (keyring or default_keyring).get_many(public_keys),
+            armor=armor,
+        )
+
+    @staticmethod
+    def verify(
+        message: str, public_key: PublicKey, keyring: Optional[Keyring] = None
+    ) -> bool:
         """
         Verifies the signature of a message using the corresponding public key.
 
         :param message: Armored message to verify
         :param public_key: Armored public key
+        :param keyring: Keyring used to resolve the public key. Defaults to
+            a shared keyring which caches the recently used keys.
 
         :return: True if the signature is valid, False otherwise
 
@@ -173,7 +229,7 @@ class EncryptionUtils:
             signed_message = (
                 PGPMessage().from_blob(message) if isinstance(message, str) else message
             )
-            public_key, _ = PGPKey.from_blob(public_key)
+            public_key = (keyring or default_keyring).get(public_key)
             public_key.verify(signed_message)
             return True
         except PGPError as e:
@@ -0,0 +1,193 @@
+"""
+This class keeps parsed PGP public keys, so that each armored key is only
+parsed once.
+
+Parsing an armored key with pgpy is slow compared to using it, and the
+same recipient keys are usually used for many messages. The keys added to a
+keyring are kept for its whole lifetime, while the keys which are only looked
+up are kept in a bounded LRU cache.
+
+A keyring can be passed to the encryption and verification methods of
+``Encryption`` and ``EncryptionUtils``, either instead of the list of
+recipients or to resolve them. The methods use a default keyring when none
+is given.
+
+Code Example
+------------
+
+.. code-block:: python
+
+    from human_protocol_sdk.encryption import EncryptionUtils, Keyring
+
+    public_key2 = \"\"\"-----BEGIN PGP PUBLIC KEY BLOCK-----
+
+    xjMEZKKJZRYJKwYBBAHaRw8BAQdAiy9Cvf7Stb5uGaPWTxhk2kEWgwHI75PK
+    JAN1Re+mZ/7NFEh1bWFuIDxodW1hbkBobXQuYWk+wowEEBYKAD4FAmSiiWUE
+    CwkHCAkQLJTUgF16PUcDFQgKBBYAAgECGQECGwMCHgEWIQRHZsSFAPBxClHV
+    TEYslNSAXXo9RwAAUYYA+gJKoCHiEl/1AUNKZrWBmvS3J9BRAFgvGHFmUKSQ
+    qvCJAP9+M55C/K0QjO1B9N14TPsnENaB0IIlvavhNUgKow9sBc44BGSiiWUS
+    CisGAQQBl1UBBQEBB0DWVuH+76KUCwGbLNnrTAGxysoo6TWpkG1upYQvZztB
+    cgMBCAfCeAQYFggAKgUCZKKJZQkQLJTUgF16PUcCGwwWIQRHZsSFAPBxClHV
+    TEYslNSAXXo9RwAA0dMBAJ0cd1OM/yWJdaVQcPp4iQOFh7hAOZlcOPF2NTRr
+    1AvDAQC4Xx6swMIiu2Nx/2JYXr3QdUO/tBtC/QvU8LPQETo9Cg==
+    =4PJh
+    -----END PGP PUBLIC KEY BLOCK-----\"\"\"
+
+    keyring = Keyring([public_key2])
+
+    encrypted_message = EncryptionUtils.encrypt("MESSAGE", keyring)
+
+Module
+------
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Union
+
+from pgpy import PGPKey
+
+DEFAULT_KEY_CACHE_SIZE = 128
+
+# 40 hexadecimal characters, optionally grouped by 4 with spaces
+FINGERPRINT_MAX_LENGTH = 50
+
+PublicKey = Union[str, PGPKey]
+
+
+class Keyring:
+    """
+    A set of parsed PGP public keys.
+    """
+
+    def __init__(
+        self,
+        public_keys: Optional[Iterable[PublicKey]] = None,
+        cache_size: int = DEFAULT_KEY_CACHE_SIZE,
+    ):
+        """
+        Initializes a Keyring instance.
+
+        :param public_keys: Armored or parsed public keys to add to the keyring
+        :param cache_size: Maximum number of keys kept for the keys which are
+            looked up without being added to the keyring
+        """
+        self.cache_size = cache_size
+
+        # Public key fingerprint -> key
+        self._keys: "OrderedDict[str, PGPKey]" = OrderedDict()
+        # Armored key digest -> key
+        self._armored: Dict[str, PGPKey] = {}
+        self._cache: "OrderedDict[str, PGPKey]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        for public_key in public_keys or []:
+            self.add(public_key)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return self._normalize_fingerprint(fingerprint) in self._keys
+
+    @property
+    def public_keys(self) -> List[PGPKey]:
+        """Public keys added to the keyring, in the order they were added."""
+        with self._lock:
+            return list(self._keys.values())
+
+    def add(self, public_key: PublicKey) -> PGPKey:
+        """
+        Parses, validates and adds a public key to the keyring.
+
+        :param public_key: Armored or parsed public key
+
+        :return: The parsed public key
+
+        :raise ValueError: If the key is invalid or expired
+        """
+        key = self._parse(public_key)
+        if key.is_expired:
+            raise ValueError(f"Expired public key: {key.fingerprint}")
+
+        with self._lock:
+            self._keys[self._normalize_fingerprint(key.fingerprint)] = key
+            if isinstance(public_key, str):
+                self._armored[self._digest(public_key)] = key
+
+        return key
+
+    def get(self, public_key: PublicKey) -> PGPKey:
+        """
+        Gets the parsed version of a public key.
+
+        The key is parsed only if it was neither added to the keyring nor
+        recently looked up.
+
+        :param public_key: Armored or parsed public key, or the fingerprint
+            of a key added to the keyring
+
+        :return: The parsed public key
+
+        :raise ValueError: If the key is invalid
+        """
+        if isinstance(public_key, PGPKey):
+            return public_key if public_key.is_public else public_key.pubkey
+
+        digest = self._digest(public_key)
+        with self._lock:
+            if len(public_key) <= FINGERPRINT_MAX_LENGTH:
+                fingerprint = self._normalize_fingerprint(public_key)
+                if fingerprint in self._keys:
+                    return self._keys[fingerprint]
+            if digest in self._armored:
+                return self._armored[digest]
+            if digest in self._cache:
+                self._cache.move_to_end(digest)
+                return self._cache[digest]
+
+        key = self._parse(public_key)
+
+        with self._lock:
+            self._cache[digest] = key
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return key
+
+    def get_many(
+        self, public_keys: Union["Keyring", Iterable[PublicKey]]
+    ) -> List[PGPKey]:
+        """
+        Gets the parsed versions of a list of public keys.
+
+        :param public_keys: Armored or parsed public keys, or a keyring whose
+            keys are all returned
+
+        :return: The parsed public keys
+        """
+        if isinstance(public_keys, Keyring):
+            return public_keys.public_keys
+
+        return [self.get(public_key) for public_key in public_keys]
+
+    @staticmethod
+    def _parse(public_key: PublicKey) -> PGPKey:
+        if isinstance(public_key, PGPKey):
+            key = public_key
+        else:
+            key, _ = PGPKey.from_blob(public_key)
+
+        return key if key.is_public else key.pubkey
+
+    @staticmethod
+    def _digest(armored_key: str) -> str:
+        return hashlib.sha256(armored_key.strip().encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _normalize_fingerprint(fingerprint: str) -> str:
+        return fingerprint.replace(" ", "").upper()
+
+
+default_keyring = Keyring()
@@ -0,0 +1,257 @@
+"""
+Streaming encryption and decryption of large messages.
+
+pgpy keeps whole messages in memory, which does not work for large files.
+This module splits the data into chunks of ``CHUNK_SIZE`` bytes, and
+encrypts each chunk as a separate OpenPGP message with pgpy, so that the
+memory usage does not depend on the size of the data.
+
+Each chunk starts with a header holding a random stream id, the index of the
+chunk and whether it is the last one. The chunks can't be reordered, dropped
+or mixed between streams without the decryption failing, and a truncated
+stream is detected.
+
+The encrypted stream is a sequence of frames, each made of the length of a
+binary OpenPGP message, on 4 bytes, followed by the message. An armored stream
+is the base64 encoding of the frames, between ``ARMOR_HEADER`` and
+``ARMOR_FOOTER`` lines.
+
+The functions are used by ``EncryptionUtils.encrypt_stream`` and
+``Encryption.decrypt_stream``.
+
+Module
+------
+"""
+
+import base64
+import os
+import struct
+from typing import BinaryIO, List
+
+from pgpy import PGPKey, PGPMessage
+from pgpy.constants import CompressionAlgorithm, SymmetricKeyAlgorithm
+from pgpy.errors import PGPDecryptionError
+
+CHUNK_SIZE = 1024 * 1024
+
+# Room for the session keys of the recipients in addition to the chunk
+MAX_FRAME_SIZE = CHUNK_SIZE + 1024 * 1024
+
+ARMOR_HEADER = b"-----BEGIN PGP MESSAGE STREAM-----"
+ARMOR_FOOTER = b"-----END PGP MESSAGE STREAM-----"
+
+# Number of bytes encoded on each line of base64
+ARMOR_LINE_SIZE = 57
+
+# Stream id, chunk index and last chunk flag
+CHUNK_HEADER = struct.Struct(">16sQ?")
+
+FRAME_LENGTH = struct.Struct(">I")
+
+
+def _read_exact(source, size: int) -> bytes:
+    """Reads up to size bytes, less only at the end of the stream."""
+    data = bytearray()
+    while len(data) < size:
+        chunk = source.read(size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return bytes(data)
+
+
+def _encrypt_chunk(data: bytes, public_keys: List[PGPKey]) -> bytes:
+    pgp_message = PGPMessage.new(data, compression=CompressionAlgorithm.Uncompressed)
+    cipher = SymmetricKeyAlgorithm.AES256
+    sessionkey = cipher.gen_key()
+
+    for public_key in public_keys:
+        pgp_message = public_key.encrypt(pgp_message, sessionkey, cipher=cipher)
+
+    del sessionkey
+    return bytes(pgp_message)
+
+
+class _ArmorWriter:
+    """Writes the base64 encoding of the data between the armor lines."""
+
+    def __init__(self, output):
+        self.output = output
+        self.buffer = bytearray()
+        self.output.write(ARMOR_HEADER + b"\n")
+
+    def write(self, data: bytes) -> None:
+        self.buffer += data
+        size = len(self.buffer) - len(self.buffer) % ARMOR_LINE_SIZE
+        if size:
+            self.output.write(base64.encodebytes(self.buffer[:size]))
+            del self.buffer[:size]
+
+    def close(self) -> None:
+        if self.buffer:
+            self.output.write(base64.encodebytes(self.buffer))
+        self.output.write(ARMOR_FOOTER + b"\n")
+
+
+def encrypt_stream(
+    source: BinaryIO,
+    output: BinaryIO,
+    public_keys: List[PGPKey],
+    armor: bool = False,
+) -> None:
+    """Encrypts a stream for the given recipients.
+
+    :param source: Binary stream with the data to encrypt
+    :param output: Binary stream the encrypted stream is written to
+    :param public_keys: Parsed public keys of the recipients
+    :param armor: Write an ASCII armored stream instead of a binary one
+    """
+    if armor:
+        output = _ArmorWriter(output)
+
+    stream_id = os.urandom(16)
+    chunk = _read_exact(source, CHUNK_SIZE)
+    index = 0
+    while True:
+        # The last chunk is only known once the next one is read
+        next_chunk = (
+            _read_exact(source, CHUNK_SIZE) if len(chunk) == CHUNK_SIZE else b""
+        )
+        last = not next_chunk
+
+        message = _encrypt_chunk(
+            CHUNK_HEADER.pack(stream_id, index, last) + chunk, public_keys
+        )
+        output.write(FRAME_LENGTH.pack(len(message)) + message)
+
+        if last:
+            break
+        chunk = next_chunk
+        index += 1
+
+    if armor:
+        output.close()
+
+
+class _ArmorReader:
+    """Reads the data of an ASCII armored stream."""
+
+    def __init__(self, source):
+        self.lines = iter(source.readline, b"")
+        self.buffer = bytearray()
+        self.eof = False
+
+        if next(self.lines, b"").strip() != ARMOR_HEADER:
+            raise ValueError("Invalid armored stream")
+
+    def read(self, size: int) -> bytes:
+        while len(self.buffer) < size and not self.eof:
+            lines = []
+            encoded_size = 0
+            # Decodes many lines at once, base64 lines are multiples of 4 characters
+            while encoded_size < size * 4 // 3 + 4:
+                line = next(self.lines, b"").strip()
+                if not line or line == ARMOR_FOOTER:
+                    self.eof = True
+                    break
+                lines.append(line)
+                encoded_size += len(line)
+            self.buffer += base64.b64decode(b"".join(lines), validate=True)
+
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+
+class _PrefixedReader:
+    """Reads some already read bytes before the rest of a stream."""
+
+    def __init__(self, prefix: bytes, source):
+        self.prefix = prefix
+        self.source = source
+
+    def read(self, size: int) -> bytes:
+        if self.prefix:
+            data, self.prefix = self.prefix[:size], self.prefix[size:]
+            return data
+        return self.source.read(size)
+
+    def readline(self) -> bytes:
+        if self.prefix:
+            data, self.prefix = self.prefix, b""
+            return data + self.source.readline()
+        return self.source.readline()
+
+
+def _decrypt_chunk(data: bytes, private_key: PGPKey) -> bytes:
+    # The same error for any invalid chunk, the reason is not disclosed
+    try:
+        pgp_message = PGPMessage.from_blob(data)
+        is_encrypted = pgp_message.is_encrypted
+    except Exception:
+        raise PGPDecryptionError("Message modification detected")
+    if not is_encrypted:
+        raise PGPDecryptionError("Message modification detected")
+
+    try:
+        decrypted = private_key.decrypt(pgp_message)
+    except PGPDecryptionError:
+        raise PGPDecryptionError("Message modification detected")
+
+    try:
+        if decrypted.is_encrypted or decrypted.type != "literal":
+            raise ValueError
+        return bytes(decrypted.message)
+    except Exception:
+        raise PGPDecryptionError("Message modification detected")
+
+
+def decrypt_stream(source: BinaryIO, output: BinaryIO, private_key: PGPKey) -> None:
+    """Decrypts a stream with an unlocked private key.
+
+    Each chunk is verified before it is written. If an error is raised,
+    the output is incomplete and must be discarded.
+
+    :param source: Binary stream written by ``encrypt_stream``, binary or armored
+    :param output: Binary stream the decrypted data is written to
+    :param private_key: Unlocked private key of one of the recipients
+
+    :raise PGPError: If the stream cannot be decrypted with the key
+    :raise PGPDecryptionError: If the stream was modified or truncated
+    :raise ValueError: If the stream is not armored properly
+    """
+    prefix = source.read(len(ARMOR_HEADER))
+    source = _PrefixedReader(prefix, source)
+    if prefix == ARMOR_HEADER:
+        source = _ArmorReader(source)
+
+    stream_id = None
+    index = 0
+    while True:
+        frame_length = _read_exact(source, FRAME_LENGTH.size)
+        if len(frame_length) < FRAME_LENGTH.size:
+            # The last chunk is flagged, the stream was truncated
+            raise PGPDecryptionError("Message modification detected")
+
+        (length,) = FRAME_LENGTH.unpack(frame_length)
+        message = _read_exact(source, length) if length <= MAX_FRAME_SIZE else b""
+        if len(message) != length:
+            raise PGPDecryptionError("Message modification detected")
+
+        data = _decrypt_chunk(message, private_key)
+        if len(data) < CHUNK_HEADER.size:
+            raise PGPDecryptionError("Message modification detected")
+
+        chunk_stream_id, chunk_index, last = CHUNK_HEADER.unpack_from(data)
+        if stream_id is None:
+            stream_id = chunk_stream_id
+        if chunk_stream_id != stream_id or chunk_index != index:
+            raise PGPDecryptionError("Message modification detected")
+
+        output.write(data[CHUNK_HEADER.size :])
+
+        if last:
+            if source.read(1):
+                raise PGPDecryptionError("Message modification detected")
+            return
+        index += 1
@@ -56,6 +56,7 @@ from decimal import Decimal
 from typing import List, Optional
 
 from human_protocol_sdk.constants import NETWORKS, ChainId, Status
+from human_protocol_sdk.event_index import EventIndex
 from human_protocol_sdk.utils import (
     get_escrow_interface,
     get_factory_interface,
@@ -188,6 +189,7 @@ class EscrowClient:
         self.factory_contract = self.w3.eth.contract(
             address=self.network["factory_address"], abi=factory_interface["abi"]
         )
+        self.factory_events = EventIndex.from_interface(factory_interface)
 
     def create_escrow(
         self,
@@ -260,10 +262,10 @@ class EscrowClient:
             tx_options,
         )
         return next(
-            (
-                self.factory_contract.events.LaunchedV2().process_log(log)
-                for log in transaction_receipt["logs"]
-                if log["address"] == self.network["factory_address"]
+            self.factory_events.decode_logs(
+                transaction_receipt["logs"],
+                address=self.network["factory_address"],
+                event_name="LaunchedV2",
             ),
             None,
         ).args.escrow
@@ -752,19 +754,14 @@ class EscrowClient:
         amount_transferred = None
         token_address = self.get_token_address(escrow_address)
 
-        erc20_interface = get_erc20_interface()
-        token_contract = self.w3.eth.contract(token_address, abi=erc20_interface["abi"])
+        erc20_events = EventIndex.from_interface(get_erc20_interface())
 
-        for log in transaction_receipt["logs"]:
-            if log["address"] == token_address:
-                processed_log = token_contract.events.Transfer().process_log(log)
-
-                if (
-                    processed_log["event"] == "Transfer"
-                    and processed_log["args"]["from"] == escrow_address
-                ):
-                    amount_transferred = processed_log["args"]["value"]
-                    break
+        for event in erc20_events.decode_logs(
+            transaction_receipt["logs"], address=token_address, event_name="Transfer"
+        ):
+            if event["args"]["from"] == escrow_address:
+                amount_transferred = event["args"]["value"]
+                break
 
         if amount_transferred is None:
             raise EscrowClientError("Transfer Event Not Found in Transaction Logs")
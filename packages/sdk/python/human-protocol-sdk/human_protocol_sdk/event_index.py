@@ -0,0 +1,146 @@
+"""
+This class decodes the logs of a transaction receipt with a precompiled
+index of the events of a contract.
+
+Decoding a log with ``contract.events.Event().process_log(log)`` builds the
+event object and processes its ABI again for every log. The index computes
+the topic of each event of an ABI once, so that finding the event of a log
+is a dictionary lookup.
+
+Code Example
+------------
+
+.. code-block:: python
+
+    from human_protocol_sdk.event_index import EventIndex
+    from human_protocol_sdk.utils import get_factory_interface
+
+    factory_events = EventIndex.from_interface(get_factory_interface())
+
+    for event in factory_events.decode_logs(
+        transaction_receipt["logs"], event_name="LaunchedV2"
+    ):
+        print(event.args.escrow)
+
+Module
+------
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from eth_abi.abi import default_codec
+from eth_utils import event_abi_to_log_topic
+from hexbytes import HexBytes
+from web3._utils.events import get_event_data
+from web3.types import ABIEvent, EventData, LogReceipt
+
+INTERFACE_CACHE_SIZE = 16
+""" Number of contract interfaces whose index is kept by ``from_interface``. """
+
+
+class EventIndex:
+    """
+    A class used to decode the logs emitted by a contract.
+    """
+
+    # ABI digest -> index
+    _interface_cache: "OrderedDict[str, EventIndex]" = OrderedDict()
+    _interface_cache_lock = threading.Lock()
+
+    def __init__(self, abi: List[Dict[str, Any]]):
+        """
+        Initializes an EventIndex instance.
+
+        :param abi: Contract ABI
+        """
+        self._events: Dict[bytes, ABIEvent] = {}
+        for item in abi:
+            if item.get("type") == "event" and not item.get("anonymous"):
+                self._events[bytes(event_abi_to_log_topic(item))] = item
+
+    @classmethod
+    def from_interface(cls, interface: Dict[str, Any]) -> "EventIndex":
+        """
+        Gets the index of a contract interface.
+
+        The index is built once per ABI, so the interfaces returned by
+        ``get_*_interface`` are indexed once. The indexes of the recently used
+        ABIs are kept.
+
+        :param interface: Contract interface containing the contract abi
+
+        :return: The index of the events of the contract
+        """
+        digest = hashlib.sha256(
+            json.dumps(interface["abi"], sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+        with cls._interface_cache_lock:
+            index = cls._interface_cache.get(digest)
+            if index is not None:
+                cls._interface_cache.move_to_end(digest)
+                return index
+
+        index = cls(interface["abi"])
+        with cls._interface_cache_lock:
+            cls._interface_cache[digest] = index
+            while len(cls._interface_cache) > INTERFACE_CACHE_SIZE:
+                cls._interface_cache.popitem(last=False)
+        return index
+
+    @property
+    def event_names(self) -> List[str]:
+        """Names of the indexed events."""
+        return [event["name"] for event in self._events.values()]
+
+    def decode_log(self, log: LogReceipt) -> Optional[EventData]:
+        """
+        Decodes a log.
+
+        :param log: Log of a transaction receipt
+
+        :return: The decoded event, or None if the log is not an event of the
+            contract
+        """
+        event_abi = self._get_event_abi(log)
+        if event_abi is None:
+            return None
+
+        return get_event_data(default_codec, event_abi, log)
+
+    def decode_logs(
+        self,
+        logs: Iterable[LogReceipt],
+        address: Optional[str] = None,
+        event_name: Optional[str] = None,
+    ) -> Iterator[EventData]:
+        """
+        Decodes the logs of a transaction receipt, skipping the logs which are
+        not events of the contract.
+
+        :param logs: Logs of a transaction receipt
+        :param address: (Optional) Only decode the logs emitted by this address
+        :param event_name: (Optional) Only decode the events with this name
+
+        :return: The decoded events
+        """
+        for log in logs:
+            if address is not None and log["address"] != address:
+                continue
+
+            event_abi = self._get_event_abi(log)
+            if event_abi is None:
+                continue
+            if event_name is not None and event_abi["name"] != event_name:
+                continue
+
+            yield get_event_data(default_codec, event_abi, log)
+
+    def _get_event_abi(self, log: LogReceipt) -> Optional[ABIEvent]:
+        if not log["topics"]:
+            return None
+        return self._events.get(bytes(HexBytes(log["topics"][0])))
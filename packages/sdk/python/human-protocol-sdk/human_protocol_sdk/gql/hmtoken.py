@@ -5,9 +5,17 @@ fragment HolderFields on Holder {
 }
 """
 
-get_holders_query = """
-query GetHolders {{
-    holders {{
+get_holders_page_query = """
+query GetHoldersPage($cursor: String!, $first: Int!) {{
+    holders(
+        where: {{
+            id_gt: $cursor
+        }},
+        orderBy: id,
+        orderDirection: asc,
+        first: $first
+    ) {{
+        id
         ...HolderFields
     }}
 }}
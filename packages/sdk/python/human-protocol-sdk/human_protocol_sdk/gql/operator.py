@@ -44,6 +44,26 @@ query GetLeaders(
     )
 
 
+get_leaders_page_query = """
+query GetLeadersPage(
+    $cursor: String!
+    $first: Int!
+) {{
+    leaders(
+      where: {{
+        id_gt: $cursor
+      }},
+      orderBy: id,
+      orderDirection: asc,
+      first: $first
+    ) {{
+      ...LeaderFields
+    }}
+}}
+{leader_fragment}
+""".format(leader_fragment=leader_fragment)
+
+
 get_leader_query = """
 query getLeader($address: String!) {{
     leader(id: $address) {{
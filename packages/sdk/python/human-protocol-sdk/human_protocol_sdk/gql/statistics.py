@@ -94,3 +94,22 @@ query GetEscrowDayData($from: Int, $to: Int) {{
         to_clause="timestamp_lte: $to" if param.date_to else "",
         limit_clause="first: $limit" if param.limit else "first: 1000",
     )
+
+
+get_event_day_data_since_query = """
+query GetEventDayDataSince($from: Int!, $first: Int!) {{
+    eventDayDatas(
+        where: {{
+            timestamp_gt: $from
+        }},
+        orderBy: timestamp,
+        orderDirection: asc,
+        first: $first
+    ) {{
+      ...EventDayDataFields
+    }}
+}}
+{event_day_data_fragment}
+""".format(
+    event_day_data_fragment=event_day_data_fragment,
+)
@@ -50,24 +50,76 @@ Module
 ------
 """
 
+import json
 import logging
 import os
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 import requests
 
-from human_protocol_sdk.constants import NETWORKS, ChainId, KVStoreKeys
+from human_protocol_sdk.constants import (
+    MULTICALL3_ADDRESS,
+    NETWORKS,
+    ChainId,
+    KVStoreKeys,
+)
 from human_protocol_sdk.utils import (
     get_kvstore_interface,
     handle_transaction,
     validate_url,
 )
 from web3 import Web3
+from web3._utils.request import make_post_request
+from web3.exceptions import BadFunctionCallOutput
 from web3.middleware import geth_poa_middleware
+from web3.providers.rpc import HTTPProvider
 from web3.types import TxParams
 
 LOG = logging.getLogger("human_protocol_sdk.kvstore")
 
+FILE_DOWNLOAD_TIMEOUT = int(os.getenv("KVSTORE_FILE_DOWNLOAD_TIMEOUT", 30))
+
+FILE_CACHE_SIZE = 256
+
+# Verified file contents indexed by their on-chain hash, shared by all clients.
+# Content is immutable for a given hash, so entries never need revalidation.
+_file_cache: "OrderedDict[str, str]" = OrderedDict()
+_file_cache_lock = threading.Lock()
+
+# Chains where Multicall3 is not deployed, so the bulk reads skip it.
+_multicall3_unavailable_chains = set()
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+
 
 class KVStoreClientError(Exception):
     """
@@ -82,11 +134,19 @@ class KVStoreClient:
     A class used to manage kvstore on the HUMAN network.
     """
 
-    def __init__(self, web3: Web3, gas_limit: Optional[int] = None):
+    def __init__(
+        self,
+        web3: Web3,
+        gas_limit: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+    ):
         """
         Initializes a KVStore instance.
 
         :param web3: The Web3 object
+        :param gas_limit: (Optional) Gas limit for transactions
+        :param cache_dir: (Optional) Directory where verified files, such as
+            public keys, are cached by their on-chain hash
         """
 
         # Initialize web3 instance
@@ -98,7 +158,8 @@ class KVStoreClient:
         # Load network configuration based on chainId
         try:
             chain_id = self.w3.eth.chain_id
-            self.network = NETWORKS[ChainId(chain_id)]
+            self.chain_id = ChainId(chain_id)
+            self.network = NETWORKS[self.chain_id]
         except:
             if chain_id is not None:
                 raise KVStoreClientError(f"Invalid ChainId: {chain_id}")
@@ -111,6 +172,7 @@ class KVStoreClient:
             address=self.network["kvstore_address"], abi=kvstore_interface["abi"]
         )
         self.gas_limit = gas_limit
+        self.cache_dir = cache_dir
 
     def set(self, key: str, value: str, tx_options: Optional[TxParams] = None) -> None:
         """
@@ -302,6 +364,131 @@ class KVStoreClient:
         result = self.kvstore_contract.functions.get(address, key).call()
         return result
 
+    def get_bulk(
+        self, address_key_pairs: List[Tuple[str, str]], batch_size: int = 100
+    ) -> Dict[str, Dict[str, str]]:
+        """Gets the values of many key-value pairs in the contract.
+
+        The reads are packed into Multicall3 ``aggregate3`` calls of
+        ``batch_size`` reads each. If Multicall3 is not available on the
+        network, the reads are sent as JSON-RPC batches instead, or one by one
+        if the provider does not support batching.
+
+        :param address_key_pairs: List of (address, key) pairs to get
+        :param batch_size: Maximum number of reads sent in one request
+
+        :return: Values of the key-value pairs, indexed by address and key
+
+        :example:
+            .. code-block:: python
+
+                from eth_typing import URI
+                from web3 import Web3
+                from web3.providers.auto import load_provider_from_uri
+
+                from human_protocol_sdk.kvstore import KVStoreClient
+
+                w3 = Web3(load_provider_from_uri(URI("http://localhost:8545")))
+                kvstore_client = KVStoreClient(w3)
+
+                values = kvstore_client.get_bulk(
+                    [
+                        ('0x62dD51230A30401C455c8398d06F85e4EaB6309f', 'role'),
+                        ('0x62dD51230A30401C455c8398d06F85e4EaB6309f', 'webhook_url'),
+                    ]
+                )
+                role = values['0x62dD51230A30401C455c8398d06F85e4EaB6309f']['role']
+        """
+
+        for address, key in address_key_pairs:
+            if not key:
+                raise KVStoreClientError("Key can not be empty")
+            if not Web3.is_address(address):
+                raise KVStoreClientError(f"Invalid address: {address}")
+
+        results = {}
+        for start in range(0, len(address_key_pairs), batch_size):
+            batch = address_key_pairs[start : start + batch_size]
+            calls_data = [
+                self.kvstore_contract.encodeABI(
+                    fn_name="get", args=[Web3.to_checksum_address(address), key]
+                )
+                for address, key in batch
+            ]
+
+            return_data = None
+            if self.chain_id not in _multicall3_unavailable_chains:
+                try:
+                    return_data = self._multicall(calls_data)
+                except BadFunctionCallOutput as e:
+                    # There is no contract at the Multicall3 address
+                    LOG.debug(f"Multicall3 is not available: {e}")
+                    _multicall3_unavailable_chains.add(self.chain_id)
+                except Exception as e:
+                    LOG.debug(f"Multicall3 failed, using JSON-RPC batch: {e}")
+
+            if return_data is None:
+                return_data = self._rpc_batch_call(calls_data)
+
+            for (address, key), data in zip(batch, return_data):
+                results.setdefault(address, {})[key] = self.w3.codec.decode(
+                    ["string"], data
+                )[0]
+
+        return results
+
+    def _multicall(self, calls_data: List[str]) -> List[bytes]:
+        multicall_contract = self.w3.eth.contract(
+            address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI
+        )
+        results = multicall_contract.functions.aggregate3(
+            [
+                (self.kvstore_contract.address, False, call_data)
+                for call_data in calls_data
+            ]
+        ).call()
+
+        return [return_data for _, return_data in results]
+
+    def _rpc_batch_call(self, calls_data: List[str]) -> List[bytes]:
+        calls = [
+            {"to": self.kvstore_contract.address, "data": call_data}
+            for call_data in calls_data
+        ]
+
+        provider = self.w3.provider
+        if not isinstance(provider, HTTPProvider):
+            # Only HTTP providers support batching
+            return [bytes(self.w3.eth.call(call)) for call in calls]
+
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "eth_call",
+                "params": [call, "latest"],
+            }
+            for request_id, call in enumerate(calls)
+        ]
+        # Sent with the session and the request options of the provider
+        raw_response = make_post_request(
+            provider.endpoint_uri,
+            json.dumps(payload).encode("utf-8"),
+            **provider.get_request_kwargs(),
+        )
+        responses = {item["id"]: item for item in json.loads(raw_response)}
+
+        return_data = []
+        for request in payload:
+            item = responses.get(request["id"], {})
+            if "result" not in item:
+                raise KVStoreClientError(
+                    f"Get Bulk failed: {item.get('error', 'missing response')}"
+                )
+            return_data.append(Web3.to_bytes(hexstr=item["result"]))
+
+        return return_data
+
     def get_file_url_and_verify_hash(
         self, address: str, key: Optional[str] = "url"
     ) -> str:
@@ -333,6 +520,13 @@ class KVStoreClient:
                 )
         """
 
+        url, _ = self._get_file_url_and_content(address, key)
+
+        return url
+
+    def _get_file_url_and_content(
+        self, address: str, key: str
+    ) -> Tuple[str, Optional[str]]:
         if not Web3.is_address(address):
             raise KVStoreClientError(f"Invalid address: {address}")
 
@@ -340,19 +534,63 @@ class KVStoreClient:
         hash = self.kvstore_contract.functions.get(address, key + "_hash").call()
 
         if len(url) == 0:
-            return url
+            return url, None
 
-        content = requests.get(url).text
-        content_hash = self.w3.keccak(text=content).hex()
+        content = self._get_cached_file(hash)
+        if content is None:
+            content = requests.get(url, timeout=FILE_DOWNLOAD_TIMEOUT).text
+            content_hash = self.w3.keccak(text=content).hex()
 
-        if hash != content_hash:
-            raise KVStoreClientError(f"Invalid hash")
+            if hash != content_hash:
+                raise KVStoreClientError(f"Invalid hash")
 
-        return url
+            self._cache_file(hash, content)
+
+        return url, content
+
+    def _get_cached_file(self, hash: str) -> Optional[str]:
+        with _file_cache_lock:
+            if hash in _file_cache:
+                _file_cache.move_to_end(hash)
+                return _file_cache[hash]
+
+        if not self.cache_dir:
+            return None
+
+        path = os.path.join(self.cache_dir, hash)
+        if not os.path.isfile(path):
+            return None
+
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+
+        if self.w3.keccak(text=content).hex() != hash:
+            LOG.warning(f"Ignoring corrupted cache file {path}")
+            return None
+
+        self._cache_file(hash, content, persist=False)
+        return content
+
+    def _cache_file(self, hash: str, content: str, persist: bool = True) -> None:
+        with _file_cache_lock:
+            _file_cache[hash] = content
+            _file_cache.move_to_end(hash)
+            while len(_file_cache) > FILE_CACHE_SIZE:
+                _file_cache.popitem(last=False)
+
+        if persist and self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = os.path.join(self.cache_dir, f".{hash}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, os.path.join(self.cache_dir, hash))
 
     def get_public_key(self, address: str) -> str:
         """Gets the public key of the given entity, and verify its hash.
 
+        The key file is downloaded once and cached by its on-chain hash, so
+        subsequent lookups of the same key do not need any HTTP request.
+
         :param address: Address from which to get the public key.
 
         :return public_key: The public key of the given address if exists, and the content is valid
@@ -374,13 +612,11 @@ class KVStoreClient:
                 )
         """
 
-        public_key_url = self.get_file_url_and_verify_hash(
+        public_key_url, public_key = self._get_file_url_and_content(
             address, KVStoreKeys.public_key.value
         )
 
         if public_key_url == "":
             return ""
 
-        public_key = requests.get(public_key_url).text
-
         return public_key
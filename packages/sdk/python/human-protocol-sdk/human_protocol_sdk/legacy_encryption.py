@@ -6,9 +6,12 @@ Learn more about [encryption](human_protocol_sdk.encryption.md#human_protocol_sd
 import hashlib
 import os
 import struct
+import threading
 import typing as t
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
-from cryptography.hazmat.primitives import hashes, hmac
+from cryptography.hazmat.primitives import hashes, hmac, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives.ciphers import Cipher
 from cryptography.hazmat.primitives.ciphers.algorithms import AES
@@ -20,6 +23,24 @@ from eth_keys import (
 )
 from eth_utils import int_to_big_endian
 
+from human_protocol_sdk.encryption import EncryptionResult
+
+try:
+    import coincurve
+except ImportError:
+    coincurve = None
+
+BACKEND_COINCURVE = "coincurve"
+""" ECDH computed by libsecp256k1, requires the ``coincurve`` package. """
+
+BACKEND_CRYPTOGRAPHY = "cryptography"
+""" ECDH computed by OpenSSL. """
+
+DEFAULT_BACKEND = BACKEND_COINCURVE if coincurve else BACKEND_CRYPTOGRAPHY
+
+DEFAULT_KEY_CACHE_SIZE = 4
+""" Number of loaded private keys kept by an Encryption instance. """
+
 
 class InvalidPublicKey(Exception):
     """
@@ -61,6 +82,31 @@ class Encryption:
     format byte
     """
 
+    def __init__(
+        self,
+        backend: str = DEFAULT_BACKEND,
+        key_cache_size: int = DEFAULT_KEY_CACHE_SIZE,
+    ):
+        """
+        Initializes an Encryption instance.
+
+        :param backend: Backend used for the elliptic curve operations,
+            ``coincurve`` when it is installed, ``cryptography`` otherwise.
+        :param key_cache_size: Maximum number of private keys kept loaded
+            by the instance. Keys are loaded on every use when 0.
+        """
+        if backend not in (BACKEND_COINCURVE, BACKEND_CRYPTOGRAPHY):
+            raise ValueError(f"Unsupported backend: {backend}")
+        if backend == BACKEND_COINCURVE and coincurve is None:
+            raise ValueError("coincurve backend requires the coincurve package")
+
+        self.backend = backend
+        self.key_cache_size = key_cache_size
+
+        # Public key -> backend private key
+        self._private_keys: "OrderedDict[bytes, t.Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
     @staticmethod
     def is_encrypted(data: bytes) -> bool:
         """
@@ -115,11 +161,11 @@ class Encryption:
         """
 
         # 1) generate r = random value
-        ephemeral = self.generate_private_key()
+        ephemeral = self._generate_ephemeral_key()
 
         # 2) generate shared-secret = key_derivation( key_exchange(r, P) )
         try:
-            key_material = self._process_key_exchange(ephemeral, public_key)
+            key_material = self._exchange(ephemeral, public_key.to_bytes())
         except InvalidPublicKey as exc:
             raise DecryptionError(
                 "Failed to generate shared secret with" f" pubkey {public_key!r}: {exc}"
@@ -133,7 +179,7 @@ class Encryption:
         key_mac = hashlib.sha256(key_mac).digest()
 
         # 3) generate R = rG [same op as generating a public key]
-        ephem_pub_key = ephemeral.public_key
+        ephem_pub_key = self._get_public_key_bytes(ephemeral)
 
         # Encrypt
         algo = self.CIPHER(key_enc)
@@ -143,7 +189,7 @@ class Encryption:
         ciphertext = cipher_context.update(data) + cipher_context.finalize()
 
         # 4) 0x04 || R || AsymmetricEncrypt(shared-secret, plaintext) || tag
-        msg = b"\x04" + ephem_pub_key.to_bytes() + block_size + ciphertext
+        msg = b"\x04" + ephem_pub_key + block_size + ciphertext
 
         # the MAC of a message (called the tag) as per SEC 1, 3.5.
         msg_start = 1 + self.PUBLIC_KEY_LEN
@@ -192,9 +238,7 @@ class Encryption:
         shared = data[1 : 1 + self.PUBLIC_KEY_LEN]
 
         try:
-            key_material = self._process_key_exchange(
-                private_key, eth_keys.PublicKey(shared)
-            )
+            key_material = self._exchange(self._load_private_key(private_key), shared)
         except InvalidPublicKey as exc:
             raise DecryptionError(
                 "Failed to generate shared secret with" f" pubkey {shared!r}: {exc}"
@@ -229,6 +273,62 @@ class Encryption:
 
         return cipher_context.update(ciphertext) + cipher_context.finalize()
 
+    def decrypt_many(
+        self,
+        data: t.List[bytes],
+        private_key: eth_datatypes.PrivateKey,
+        shared_mac_data: bytes = b"",
+        max_workers: t.Optional[int] = None,
+    ) -> t.List[EncryptionResult]:
+        """
+        Decrypts many messages addressed to the same private key, in parallel.
+
+        The messages are split between a pool of processes, each one keeping
+        its backend objects for the private key. A message which fails does
+        not stop the others: its error is returned in its result instead.
+
+        :param data: Data to be decrypted
+        :param private_key: Private key to be used in agreement.
+        :param shared_mac_data: shared mac additional data as suffix.
+        :param max_workers: Maximum number of processes. Defaults to the number
+            of CPUs. Messages are decrypted in the current process when 1.
+
+        :return: Results in the order of the messages, with decrypted byte strings
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.legacy_encryption import Encryption
+                from eth_keys import datatypes
+
+                private_key_str = "9822f95dd945e373300f8c8459a831846eda97f314689e01f7cf5b8f1c2298b3"
+                private_key = datatypes.PrivateKey(bytes.fromhex(private_key_str))
+
+                encryption = Encryption()
+                results = encryption.decrypt_many(encrypted_messages, private_key)
+
+                decrypted_messages = [result.message for result in results]
+        """
+        if max_workers == 1 or len(data) <= 1:
+            return [
+                _decrypt_message(self, private_key, shared_mac_data, message)
+                for message in data
+            ]
+
+        max_workers = min(max_workers or os.cpu_count() or 1, len(data))
+        initargs = (self.backend, private_key.to_bytes(), shared_mac_data)
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=initargs
+        ) as executor:
+            return list(
+                executor.map(
+                    _decrypt_worker_message,
+                    data,
+                    chunksize=max(1, len(data) // (max_workers * 4)),
+                )
+            )
+
     def _process_key_exchange(
         self, private_key: eth_datatypes.PrivateKey, public_key: eth_datatypes.PublicKey
     ) -> bytes:
@@ -254,19 +354,39 @@ class Encryption:
             that they derive the same key material
         """
 
-        private_key_int = int(t.cast(int, private_key))
-        ec_private_key = ec.derive_private_key(private_key_int, self.ELLIPTIC_CURVE)
+        return self._exchange(
+            self._load_private_key(private_key), public_key.to_bytes()
+        )
 
-        public_key_bytes = b"\x04" + public_key.to_bytes()
+    def _exchange(self, private_key: t.Any, public_key: bytes) -> bytes:
+        """
+        Performs the ECDH key exchange with the selected backend.
+
+        :param private_key: Private key object of the backend
+        :param public_key: 64 bytes public key, without format byte
+
+        :return: X coordinate of the shared point
+        """
+        if len(public_key) != self.PUBLIC_KEY_LEN:
+            raise InvalidPublicKey(
+                f"Unexpected public key length: {len(public_key)} bytes"
+            )
+
+        public_key_bytes = b"\x04" + public_key
 
         try:
+            if self.backend == BACKEND_COINCURVE:
+                shared_point = coincurve.PublicKey(public_key_bytes).multiply(
+                    private_key.secret
+                )
+                return shared_point.format(compressed=False)[1 : 1 + self.KEY_LEN]
+
             # either of these can raise a ValueError:
-            elliptic_pub_nums = ec.EllipticCurvePublicKey.from_encoded_point(
+            ec_pub_key = ec.EllipticCurvePublicKey.from_encoded_point(
                 self.ELLIPTIC_CURVE, public_key_bytes
             )
-            ec_pub_key = elliptic_pub_nums.public_numbers().public_key()
 
-            return ec_private_key.exchange(ec.ECDH(), ec_pub_key)
+            return private_key.exchange(ec.ECDH(), ec_pub_key)
 
         except ValueError as error:
             # Not all bytes can be made into valid public keys, see the warning
@@ -274,6 +394,71 @@ class Encryption:
             # under EllipticCurvePublicNumbers(x, y)
             raise InvalidPublicKey(str(error)) from error
 
+    def clear_key_cache(self) -> None:
+        """
+        Removes the private keys kept loaded by the instance.
+
+        :return: None
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.legacy_encryption import Encryption
+
+                encryption = Encryption()
+                decrypted_message = encryption.decrypt(encrypted_message, private_key)
+                encryption.clear_key_cache()
+        """
+        with self._lock:
+            self._private_keys.clear()
+
+    def _load_private_key(self, private_key: eth_datatypes.PrivateKey) -> t.Any:
+        """
+        Loads a private key into an object of the backend.
+
+        Loading a key computes its public key, so the recently used keys are
+        kept by the instance, looked up by their public key.
+        """
+        public_key = private_key.public_key.to_bytes()
+        with self._lock:
+            if public_key in self._private_keys:
+                self._private_keys.move_to_end(public_key)
+                return self._private_keys[public_key]
+
+        if self.backend == BACKEND_COINCURVE:
+            loaded_key = coincurve.PrivateKey(private_key.to_bytes())
+        else:
+            loaded_key = ec.derive_private_key(
+                int.from_bytes(private_key.to_bytes(), "big"), self.ELLIPTIC_CURVE
+            )
+
+        if self.key_cache_size > 0:
+            with self._lock:
+                self._private_keys[public_key] = loaded_key
+                while len(self._private_keys) > self.key_cache_size:
+                    self._private_keys.popitem(last=False)
+
+        return loaded_key
+
+    def _generate_ephemeral_key(self) -> t.Any:
+        """Generates a random private key as an object of the backend"""
+
+        if self.backend == BACKEND_COINCURVE:
+            return coincurve.PrivateKey()
+
+        return ec.generate_private_key(curve=self.ELLIPTIC_CURVE)
+
+    def _get_public_key_bytes(self, private_key: t.Any) -> bytes:
+        """Gets the public key of a backend private key, without format byte"""
+
+        if self.backend == BACKEND_COINCURVE:
+            return private_key.public_key.format(compressed=False)[1:]
+
+        return private_key.public_key().public_bytes(
+            serialization.Encoding.X962,
+            serialization.PublicFormat.UncompressedPoint,
+        )[1:]
+
     def generate_private_key(self) -> eth_datatypes.PrivateKey:
         """
         Generates a new SECP256K1 private key and return it
@@ -365,3 +550,36 @@ class Encryption:
         """
 
         return value.rjust(32, b"\x00")
+
+
+_worker_encryption: t.Optional[Encryption] = None
+_worker_private_key: t.Optional[eth_datatypes.PrivateKey] = None
+_worker_shared_mac_data: bytes = b""
+
+
+def _init_worker(backend: str, private_key: bytes, shared_mac_data: bytes) -> None:
+    global _worker_encryption, _worker_private_key, _worker_shared_mac_data
+
+    _worker_encryption = Encryption(backend)
+    _worker_private_key = eth_keys.PrivateKey(private_key)
+    _worker_shared_mac_data = shared_mac_data
+
+
+def _decrypt_worker_message(data: bytes) -> EncryptionResult:
+    return _decrypt_message(
+        _worker_encryption, _worker_private_key, _worker_shared_mac_data, data
+    )
+
+
+def _decrypt_message(
+    encryption: Encryption,
+    private_key: eth_datatypes.PrivateKey,
+    shared_mac_data: bytes,
+    data: bytes,
+) -> EncryptionResult:
+    try:
+        return EncryptionResult(
+            message=encryption.decrypt(data, private_key, shared_mac_data)
+        )
+    except Exception as e:
+        return EncryptionResult(error=e)
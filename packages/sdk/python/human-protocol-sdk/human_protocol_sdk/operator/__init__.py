@@ -5,8 +5,10 @@ obtain staking information from both the contracts and subgraph.
 
 from .operator_utils import (
     LeaderData,
+    LeaderDirectory,
     LeaderFilter,
     Operator,
     OperatorUtils,
+    OperatorUtilsError,
     RewardData,
 )
@@ -21,7 +21,9 @@ Module
 
 import logging
 import os
-from typing import List, Optional
+import threading
+import time
+from typing import Dict, List, Optional
 
 from human_protocol_sdk.constants import NETWORKS, ChainId
 from human_protocol_sdk.gql.reward import get_reward_added_events_query
@@ -29,6 +31,8 @@ from human_protocol_sdk.utils import get_data_from_subgraph
 from web3 import Web3
 
 GAS_LIMIT = int(os.getenv("GAS_LIMIT", 4712388))
+LEADERS_PAGE_SIZE = 1000
+MAX_REFRESH_BACKOFF = 300
 
 LOG = logging.getLogger("human_protocol_sdk.operator")
 
@@ -164,6 +168,266 @@ class Operator:
         self.role = role
 
 
+def _parse_leader_data(chain_id: ChainId, leader: dict) -> LeaderData:
+    return LeaderData(
+        chain_id=chain_id,
+        id=leader.get("id", ""),
+        address=leader.get("address", ""),
+        amount_staked=int(leader.get("amountStaked", 0)),
+        amount_allocated=int(leader.get("amountAllocated", 0)),
+        amount_locked=int(leader.get("amountLocked", 0)),
+        locked_until_timestamp=int(leader.get("lockedUntilTimestamp", 0)),
+        amount_withdrawn=int(leader.get("amountWithdrawn", 0)),
+        amount_slashed=int(leader.get("amountSlashed", 0)),
+        reputation=int(leader.get("reputation", 0)),
+        reward=int(leader.get("reward", 0)),
+        amount_jobs_launched=int(leader.get("amountJobsLaunched", 0)),
+        role=leader.get("role", None),
+        fee=int(leader.get("fee")) if leader.get("fee", None) else None,
+        public_key=leader.get("publicKey", None),
+        webhook_url=leader.get("webhookUrl", None),
+        url=leader.get("url", None),
+    )
+
+
+class LeaderDirectory:
+    """
+    An in-memory directory of the leaders of a network.
+
+    All leaders are loaded page by page from the subgraph and indexed by
+    address and role, so lookups do not require any network round trip.
+    Once the data is older than ``ttl`` seconds, the next lookup triggers
+    a refresh in a background thread and keeps serving the current data
+    until the refresh completes. A failed refresh is retried with an
+    exponential backoff.
+
+    Addresses missing from the index are looked up individually, and
+    the misses are cached for ``negative_ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        chain_id: ChainId,
+        ttl: int = 300,
+        reputation_oracle: Optional[str] = None,
+        negative_ttl: int = 60,
+        page_size: int = LEADERS_PAGE_SIZE,
+    ):
+        """
+        Initializes a LeaderDirectory instance.
+
+        :param chain_id: Network to load the leaders from
+        :param ttl: Number of seconds after which the data is refreshed
+        :param reputation_oracle: (Optional) Address of a reputation oracle
+            whose reputation network operators are loaded as well
+        :param negative_ttl: Number of seconds an unknown address is
+            not looked up again
+        :param page_size: Number of leaders requested per subgraph query
+        """
+
+        if chain_id.value not in set(chain_id.value for chain_id in ChainId):
+            raise OperatorUtilsError(f"Invalid ChainId")
+
+        if reputation_oracle and not Web3.is_address(reputation_oracle):
+            raise OperatorUtilsError(f"Invalid reputation address: {reputation_oracle}")
+
+        self.chain_id = chain_id
+        self.ttl = ttl
+        self.reputation_oracle = reputation_oracle
+        self.negative_ttl = negative_ttl
+        self.page_size = page_size
+
+        self._leaders_by_address: Dict[str, LeaderData] = {}
+        self._leaders_by_role: Dict[str, List[LeaderData]] = {}
+        self._operators: List[Operator] = []
+        self._missing_addresses: Dict[str, float] = {}
+        self._loaded_at: Optional[float] = None
+        self._refresh_failures = 0
+        self._retry_at = 0.0
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def _load_leaders(self) -> List[LeaderData]:
+        from human_protocol_sdk.gql.operator import get_leaders_page_query
+
+        network = NETWORKS[self.chain_id]
+
+        leaders = []
+        cursor = ""
+        while True:
+            leaders_data = get_data_from_subgraph(
+                network["subgraph_url"],
+                query=get_leaders_page_query,
+                params={"cursor": cursor, "first": self.page_size},
+            )
+            leaders_raw = leaders_data["data"]["leaders"]
+            leaders.extend(
+                _parse_leader_data(self.chain_id, leader) for leader in leaders_raw
+            )
+
+            if len(leaders_raw) < self.page_size:
+                return leaders
+
+            cursor = leaders_raw[-1]["id"]
+
+    def refresh(self) -> None:
+        """Loads the leaders from the subgraph and rebuilds the indexes."""
+
+        leaders = self._load_leaders()
+        operators = (
+            OperatorUtils.get_reputation_network_operators(
+                self.chain_id, self.reputation_oracle
+            )
+            if self.reputation_oracle
+            else []
+        )
+
+        leaders_by_address = {}
+        leaders_by_role = {}
+        for leader in leaders:
+            leaders_by_address[leader.address.lower()] = leader
+            if leader.role:
+                leaders_by_role.setdefault(leader.role, []).append(leader)
+
+        # Indexes are replaced, not mutated, so readers never see partial data
+        self._leaders_by_address = leaders_by_address
+        self._leaders_by_role = leaders_by_role
+        self._operators = operators
+        self._missing_addresses = {}
+        self._loaded_at = time.monotonic()
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+            self._refresh_failures = 0
+        except Exception as e:
+            self._refresh_failures += 1
+            backoff = min(2**self._refresh_failures, MAX_REFRESH_BACKOFF)
+            self._retry_at = time.monotonic() + backoff
+            LOG.warning(f"Leader directory refresh failed, retrying in {backoff}s: {e}")
+        finally:
+            self._refresh_thread = None
+
+    def _ensure_fresh(self) -> None:
+        if self._loaded_at is None:
+            with self._refresh_lock:
+                if self._loaded_at is None:
+                    self.refresh()
+            return
+
+        now = time.monotonic()
+        if now - self._loaded_at < self.ttl or now < self._retry_at:
+            return
+
+        with self._refresh_lock:
+            if self._refresh_thread is None:
+                self._refresh_thread = threading.Thread(
+                    target=self._refresh_in_background, daemon=True
+                )
+                self._refresh_thread.start()
+
+    def get_leader(self, address: str) -> Optional[LeaderData]:
+        """Get the leader details.
+
+        :param address: Address of the leader
+
+        :return: Leader data if exists, otherwise None
+        """
+
+        self._ensure_fresh()
+
+        key = address.lower()
+        leader = self._leaders_by_address.get(key)
+        if leader or not Web3.is_address(address):
+            return leader
+
+        missing_at = self._missing_addresses.get(key)
+        if missing_at is not None and time.monotonic() - missing_at < self.negative_ttl:
+            return None
+
+        # The leader may have been added after the last refresh
+        leader = OperatorUtils.get_leader(self.chain_id, address)
+        if not leader:
+            self._missing_addresses[key] = time.monotonic()
+            return None
+
+        # Indexes are replaced, not mutated, so readers never see partial data
+        self._leaders_by_address = {**self._leaders_by_address, key: leader}
+        if leader.role:
+            self._leaders_by_role = {
+                **self._leaders_by_role,
+                leader.role: self._leaders_by_role.get(leader.role, []) + [leader],
+            }
+        return leader
+
+    def get_leaders(self, role: Optional[str] = None) -> List[LeaderData]:
+        """Get the leaders, optionally filtered by role.
+
+        :param role: (Optional) Leader role
+
+        :return: List of leaders data
+        """
+
+        self._ensure_fresh()
+        if role is None:
+            return list(self._leaders_by_address.values())
+        return list(self._leaders_by_role.get(role, []))
+
+    def get_reputation_network_operators(
+        self, role: Optional[str] = None
+    ) -> List[Operator]:
+        """Get the reputation network operators of the reputation oracle.
+
+        :param role: (Optional) Role of the operator
+
+        :return: Returns an array of operator details
+        """
+
+        self._ensure_fresh()
+        return [
+            operator
+            for operator in self._operators
+            if role is None or operator.role == role
+        ]
+
+    def get_webhook_url(self, address: str) -> Optional[str]:
+        """Get the webhook url of the leader.
+
+        :param address: Address of the leader
+
+        :return: Webhook url if the leader exists, otherwise None
+        """
+
+        leader = self.get_leader(address)
+        return leader.webhook_url if leader else None
+
+    def get_public_key(self, address: str) -> Optional[str]:
+        """Get the public key of the leader.
+
+        :param address: Address of the leader
+
+        :return: Public key if the leader exists, otherwise None
+        """
+
+        leader = self.get_leader(address)
+        return leader.public_key if leader else None
+
+    def get_fee(self, address: str) -> Optional[int]:
+        """Get the fee of the leader.
+
+        :param address: Address of the leader
+
+        :return: Fee if the leader exists, otherwise None
+        """
+
+        leader = self.get_leader(address)
+        return leader.fee if leader else None
+
+
+_leader_directories: Dict[ChainId, LeaderDirectory] = {}
+_leader_directories_lock = threading.Lock()
+
+
 class OperatorUtils:
     """
     A utility class that provides additional operator-related functionalities.
@@ -206,30 +470,7 @@ class OperatorUtils:
             leaders_raw = leaders_data["data"]["leaders"]
 
             leaders.extend(
-                [
-                    LeaderData(
-                        chain_id=chain_id,
-                        id=leader.get("id", ""),
-                        address=leader.get("address", ""),
-                        amount_staked=int(leader.get("amountStaked", 0)),
-                        amount_allocated=int(leader.get("amountAllocated", 0)),
-                        amount_locked=int(leader.get("amountLocked", 0)),
-                        locked_until_timestamp=int(
-                            leader.get("lockedUntilTimestamp", 0)
-                        ),
-                        amount_withdrawn=int(leader.get("amountWithdrawn", 0)),
-                        amount_slashed=int(leader.get("amountSlashed", 0)),
-                        reputation=int(leader.get("reputation", 0)),
-                        reward=int(leader.get("reward", 0)),
-                        amount_jobs_launched=int(leader.get("amountJobsLaunched", 0)),
-                        role=leader.get("role", None),
-                        fee=int(leader.get("fee")) if leader.get("fee", None) else None,
-                        public_key=leader.get("publicKey", None),
-                        webhook_url=leader.get("webhookUrl", None),
-                        url=leader.get("url", None),
-                    )
-                    for leader in leaders_raw
-                ]
+                [_parse_leader_data(chain_id, leader) for leader in leaders_raw]
             )
 
         return leaders
@@ -278,25 +519,7 @@ class OperatorUtils:
         if not leader:
             return None
 
-        return LeaderData(
-            chain_id=chain_id,
-            id=leader.get("id", ""),
-            address=leader.get("address", ""),
-            amount_staked=int(leader.get("amountStaked", 0)),
-            amount_allocated=int(leader.get("amountAllocated", 0)),
-            amount_locked=int(leader.get("amountLocked", 0)),
-            locked_until_timestamp=int(leader.get("lockedUntilTimestamp", 0)),
-            amount_withdrawn=int(leader.get("amountWithdrawn", 0)),
-            amount_slashed=int(leader.get("amountSlashed", 0)),
-            reputation=int(leader.get("reputation", 0)),
-            reward=int(leader.get("reward", 0)),
-            amount_jobs_launched=int(leader.get("amountJobsLaunched", 0)),
-            role=leader.get("role", None),
-            fee=int(leader.get("fee")) if leader.get("fee", None) else None,
-            public_key=leader.get("publicKey", None),
-            webhook_url=leader.get("webhookUrl", None),
-            url=leader.get("url", None),
-        )
+        return _parse_leader_data(chain_id, leader)
 
     @staticmethod
     def get_reputation_network_operators(
@@ -392,3 +615,35 @@ class OperatorUtils:
             )
             for reward_added_event in reward_added_events
         ]
+
+    @staticmethod
+    def get_leader_directory(chain_id: ChainId, ttl: int = 300) -> LeaderDirectory:
+        """Get the shared leader directory of the network.
+
+        The directory is created once per network and process, so all
+        callers share the same in-memory leader data.
+
+        :param chain_id: Network to load the leaders from
+        :param ttl: Number of seconds after which the data is refreshed,
+            only used when the directory is created
+
+        :return: Leader directory of the network
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.constants import ChainId
+                from human_protocol_sdk.operator import OperatorUtils
+
+                leader_directory = OperatorUtils.get_leader_directory(
+                    ChainId.POLYGON_MUMBAI
+                )
+                webhook_url = leader_directory.get_webhook_url(
+                    '0x62dD51230A30401C455c8398d06F85e4EaB6309f'
+                )
+        """
+
+        with _leader_directories_lock:
+            if chain_id not in _leader_directories:
+                _leader_directories[chain_id] = LeaderDirectory(chain_id, ttl=ttl)
+            return _leader_directories[chain_id]
@@ -0,0 +1,243 @@
+"""
+This module signs the transactions sent by the SDK locally, with a private
+key, without relying on ``construct_sign_and_send_raw_middleware``.
+
+The middleware signs every transaction through the whole middleware stack:
+it asks the node for the chain id, the nonce and the fees before each
+transaction. A ``LocalSigner`` reads the chain id once, keeps track of the
+nonce of its account, and asks a ``FeeOracle`` for EIP-1559 fees, which
+caches the base fee for a few seconds. Building and signing a transaction
+is then done offline, and only sending it requires a request.
+
+Once attached to a Web3 instance, the signer is used by every client
+sharing that instance.
+
+Code Example
+------------
+
+.. code-block:: python
+
+    from eth_typing import URI
+    from web3 import Web3
+    from web3.providers.auto import load_provider_from_uri
+
+    from human_protocol_sdk.escrow import EscrowClient
+    from human_protocol_sdk.signer import LocalSigner
+
+    w3 = Web3(load_provider_from_uri(URI("http://localhost:8545")))
+    LocalSigner(w3, "YOUR_PRIVATE_KEY").attach()
+
+    escrow_client = EscrowClient(w3)
+
+Module
+------
+"""
+
+import threading
+import time
+import weakref
+from typing import Dict, Optional
+
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.contract.contract import ContractFunction
+from web3.types import TxParams
+
+DEFAULT_BASE_FEE_TTL = 12
+DEFAULT_BASE_FEE_MULTIPLIER = 2
+
+# Web3 instance -> signer attached to it
+_signers: "weakref.WeakKeyDictionary[Web3, LocalSigner]" = weakref.WeakKeyDictionary()
+
+
+class FeeOracle:
+    """
+    A class used to suggest the fees of the transactions.
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        base_fee_ttl: float = DEFAULT_BASE_FEE_TTL,
+        base_fee_multiplier: int = DEFAULT_BASE_FEE_MULTIPLIER,
+    ):
+        """
+        Initializes a FeeOracle instance.
+
+        :param w3: Web3 instance
+        :param base_fee_ttl: Number of seconds the base fee, the priority fee
+            and, for networks without EIP-1559, the gas price are cached for
+        :param base_fee_multiplier: Multiplier applied to the base fee to
+            compute the maximum fee, so that the transaction stays valid
+            while the base fee rises
+        """
+        self.w3 = w3
+        self.base_fee_ttl = base_fee_ttl
+        self.base_fee_multiplier = base_fee_multiplier
+
+        self._fees: Optional[Dict[str, int]] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_fees(self) -> Dict[str, int]:
+        """
+        Gets the fees of a transaction.
+
+        :return: ``maxFeePerGas`` and ``maxPriorityFeePerGas`` on networks
+            supporting EIP-1559, ``gasPrice`` otherwise
+        """
+        with self._lock:
+            if self._fees is None or time.monotonic() >= self._expires_at:
+                self._fees = self._fetch_fees()
+                self._expires_at = time.monotonic() + self.base_fee_ttl
+            return dict(self._fees)
+
+    def invalidate(self) -> None:
+        """Forgets the cached fees."""
+        with self._lock:
+            self._fees = None
+
+    def _fetch_fees(self) -> Dict[str, int]:
+        base_fee = self.w3.eth.get_block("latest").get("baseFeePerGas")
+        if base_fee is None:
+            return {"gasPrice": self.w3.eth.gas_price}
+
+        priority_fee = self.w3.eth.max_priority_fee
+        return {
+            "maxFeePerGas": base_fee * self.base_fee_multiplier + priority_fee,
+            "maxPriorityFeePerGas": priority_fee,
+        }
+
+
+class LocalSigner:
+    """
+    A class used to build, sign and send transactions with a private key.
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        private_key: str,
+        fee_oracle: Optional[FeeOracle] = None,
+    ):
+        """
+        Initializes a LocalSigner instance.
+
+        :param w3: Web3 instance
+        :param private_key: Private key of the account sending the transactions
+        :param fee_oracle: (Optional) Fee oracle suggesting the fees
+        """
+        self.w3 = w3
+        self.account: LocalAccount = Account.from_key(private_key)
+        self.fee_oracle = fee_oracle or FeeOracle(w3)
+
+        self._chain_id: Optional[int] = None
+        self._nonce: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def address(self) -> str:
+        """Address of the account."""
+        return self.account.address
+
+    @property
+    def chain_id(self) -> int:
+        """Chain id of the network, read once."""
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        return self._chain_id
+
+    def attach(self) -> "LocalSigner":
+        """
+        Makes the signer send the transactions of the SDK clients using its
+        Web3 instance, and sets its account as the default one.
+
+        :return: The signer
+        """
+        self.w3.eth.default_account = self.address
+        _signers[self.w3] = self
+        return self
+
+    def reset_nonce(self) -> None:
+        """Reads the nonce of the account from the network on the next transaction."""
+        with self._lock:
+            self._nonce = None
+
+    def build_transaction(
+        self, tx: ContractFunction, tx_options: Optional[TxParams] = None
+    ) -> TxParams:
+        """
+        Builds a transaction, without sending any request if the gas is given.
+
+        The nonce is reserved for the transaction.
+
+        :param tx: Contract function call
+        :param tx_options: (Optional) Additional transaction parameters
+
+        :return: The transaction
+        """
+        params = dict(tx_options or {})
+        params["from"] = self.address
+        params.setdefault("chainId", self.chain_id)
+        if "gasPrice" not in params and "maxFeePerGas" not in params:
+            params.update(self.fee_oracle.get_fees())
+        if params.get("gas") is None:
+            params["gas"] = tx.estimate_gas({"from": self.address})
+
+        transaction = tx.build_transaction(params)
+        if "nonce" not in transaction:
+            transaction["nonce"] = self._next_nonce()
+        return transaction
+
+    def sign_transaction(self, transaction: TxParams) -> HexBytes:
+        """
+        Signs a transaction.
+
+        :param transaction: Transaction with all its fields
+
+        :return: The raw signed transaction
+        """
+        return self.account.sign_transaction(transaction).rawTransaction
+
+    def send_transaction(
+        self, tx: ContractFunction, tx_options: Optional[TxParams] = None
+    ) -> HexBytes:
+        """
+        Builds, signs and sends a transaction.
+
+        :param tx: Contract function call
+        :param tx_options: (Optional) Additional transaction parameters
+
+        :return: The transaction hash
+        """
+        transaction = self.build_transaction(tx, tx_options)
+        raw_transaction = self.sign_transaction(transaction)
+
+        try:
+            return self.w3.eth.send_raw_transaction(raw_transaction)
+        except Exception:
+            # The reserved nonce may be unused, or the local one out of date
+            self.reset_nonce()
+            self.fee_oracle.invalidate()
+            raise
+
+    def _next_nonce(self) -> int:
+        with self._lock:
+            if self._nonce is None:
+                self._nonce = self.w3.eth.get_transaction_count(self.address, "pending")
+            nonce = self._nonce
+            self._nonce += 1
+            return nonce
+
+
+def get_signer(w3: Web3) -> Optional[LocalSigner]:
+    """
+    Gets the signer attached to a Web3 instance.
+
+    :param w3: Web3 instance
+
+    :return: The signer, if any
+    """
+    return _signers.get(w3)
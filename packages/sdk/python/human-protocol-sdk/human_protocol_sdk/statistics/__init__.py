@@ -13,6 +13,9 @@ from .statistics_client import (
     DailyPaymentData,
     PaymentStatistics,
     HMTHolder,
+    HMTHolderDistribution,
     DailyHMTData,
     HMTStatistics,
 )
+from .columnar import TableFormat
+from .statistics_sync import StatisticsSync
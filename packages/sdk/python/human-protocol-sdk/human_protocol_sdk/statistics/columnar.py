@@ -0,0 +1,144 @@
+"""
+Columnar representation of the daily statistical data.
+
+The subgraph returns one ``eventDayData`` entity per day. For long date ranges
+converting each of them into ``Daily*Data`` objects is slow and memory-heavy,
+so this module builds a single NumPy structured array out of the raw entities,
+converting one column at a time. The array can be further wrapped into a
+``pandas.DataFrame`` or a ``pyarrow.Table`` when those packages are installed.
+
+This module requires ``numpy``, which is an optional extra of the SDK:
+
+.. code-block:: bash
+
+    pip install human_protocol_sdk[statistics]
+
+Code Example
+------------
+
+.. code-block:: python
+
+    from human_protocol_sdk.constants import ChainId
+    from human_protocol_sdk.statistics import StatisticsClient, TableFormat
+
+    statistics_client = StatisticsClient(ChainId.POLYGON_MUMBAI)
+
+    daily_data = statistics_client.get_daily_statistics_table(
+        table_format=TableFormat.PANDAS
+    )
+
+Module
+------
+"""
+
+from enum import Enum
+from typing import Any, Dict, List
+
+
+class TableFormat(Enum):
+    """Enum for the supported columnar output formats."""
+
+    NUMPY = "numpy"
+    PANDAS = "pandas"
+    ARROW = "arrow"
+
+
+# (column name, eventDayData field, numpy dtype)
+# Amounts are uint256 values in wei, which do not fit into 64-bit integers,
+# so they are represented as floats.
+EVENT_DAY_DATA_COLUMNS = [
+    ("escrows_total", "dailyEscrowCount", "i8"),
+    ("escrows_pending", "dailyPendingStatusEventCount", "i8"),
+    ("escrows_solved", "dailyCompletedStatusEventCount", "i8"),
+    ("escrows_paid", "dailyPaidStatusEventCount", "i8"),
+    ("escrows_cancelled", "dailyCancelledStatusEventCount", "i8"),
+    ("active_workers", "dailyWorkerCount", "i8"),
+    ("total_amount_paid", "dailyPayoutAmount", "f8"),
+    ("payments_count", "dailyPayoutCount", "i8"),
+    ("hmt_transfer_amount", "dailyHMTTransferAmount", "f8"),
+    ("hmt_transfer_count", "dailyHMTTransferCount", "i8"),
+]
+
+
+def _get_dtype():
+    import numpy as np
+
+    return np.dtype(
+        [("timestamp", "datetime64[s]")]
+        + [(name, dtype) for name, _, dtype in EVENT_DAY_DATA_COLUMNS]
+        + [("average_amount_per_worker", "f8")]
+    )
+
+
+def event_day_datas_to_array(event_day_datas: List[Dict[str, Any]]):
+    """Converts raw ``eventDayData`` entities into a structured array.
+
+    :param event_day_datas: ``eventDayDatas`` as returned by the subgraph
+
+    :return: NumPy structured array with one record per day
+
+    :example:
+        .. code-block:: python
+
+            from human_protocol_sdk.statistics.columnar import (
+                event_day_datas_to_array,
+            )
+
+            array = event_day_datas_to_array(
+                [{"timestamp": "1683811973", "dailyWorkerCount": "4"}]
+            )
+            print(array["active_workers"])
+            # [4]
+    """
+
+    import numpy as np
+
+    table = np.zeros(len(event_day_datas), dtype=_get_dtype())
+    if not event_day_datas:
+        return table
+
+    table["timestamp"] = np.array(
+        [row.get("timestamp", 0) for row in event_day_datas], dtype="i8"
+    )
+    for name, field, dtype in EVENT_DAY_DATA_COLUMNS:
+        # Subgraph returns BigInt values as strings, so let numpy parse them
+        # for the whole column at once instead of calling int() per value.
+        table[name] = np.array(
+            [row.get(field) or 0 for row in event_day_datas], dtype=np.str_
+        ).astype(dtype)
+
+    np.divide(
+        table["total_amount_paid"],
+        table["active_workers"],
+        out=table["average_amount_per_worker"],
+        where=table["active_workers"] != 0,
+    )
+
+    return table
+
+
+def convert_table(table, table_format: TableFormat):
+    """Converts a structured array into the requested format.
+
+    :param table: Structured array built by ``event_day_datas_to_array``
+    :param table_format: Output format
+
+    :return: The table in the requested format
+
+    :raise ImportError: If the package required by the format is not installed
+    """
+
+    if table_format == TableFormat.NUMPY:
+        return table
+
+    if table_format == TableFormat.PANDAS:
+        import pandas as pd
+
+        return pd.DataFrame.from_records(table)
+
+    if table_format == TableFormat.ARROW:
+        import pyarrow as pa
+
+        return pa.table({name: table[name] for name in table.dtype.names})
+
+    raise ValueError(f"Unsupported table format: {table_format}")
@@ -15,18 +15,36 @@ Module
 ------
 """
 
+from bisect import bisect_right
+from collections import OrderedDict
 from datetime import datetime
+import heapq
+from itertools import islice
 import logging
+import time
 
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from human_protocol_sdk.constants import ChainId, NETWORKS
-from human_protocol_sdk.gql.hmtoken import get_holders_query
+from human_protocol_sdk.gql.hmtoken import get_holders_page_query
+from human_protocol_sdk.statistics.columnar import (
+    TableFormat,
+    convert_table,
+    event_day_datas_to_array,
+)
 
 from human_protocol_sdk.utils import get_data_from_subgraph
 
 LOG = logging.getLogger("human_protocol_sdk.statistics")
 
+HOLDERS_PAGE_SIZE = 1000
+
+# Maximum number of date ranges whose daily data is kept by a client
+EVENT_DAY_DATA_CACHE_SIZE = 16
+
+# Lower edges of the default holder balance buckets: 0, 1, 10, ..., 10^9 HMT
+DEFAULT_HOLDER_BALANCE_BINS = [0] + [10 ** (18 + i) for i in range(10)]
+
 
 class StatisticsClientError(Exception):
     """
@@ -219,6 +237,37 @@ class HMTHolder:
         self.balance = balance
 
 
+class HMTHolderDistribution:
+    """
+    A class used to specify the distribution of HMT holders.
+    """
+
+    def __init__(
+        self,
+        total_holders: int,
+        total_balance: int,
+        bins: List[int],
+        histogram: List[int],
+        top_holders: List[HMTHolder],
+    ):
+        """
+        Initializes a HMTHolderDistribution instance.
+
+        :param total_holders: Number of scanned holders
+        :param total_balance: Sum of the scanned balances
+        :param bins: Lower edges of the balance buckets
+        :param histogram: Number of holders in each balance bucket,
+            bucket ``i`` contains balances in ``[bins[i], bins[i + 1])``
+        :param top_holders: Holders with the highest balance, in descending order
+        """
+
+        self.total_holders = total_holders
+        self.total_balance = total_balance
+        self.bins = bins
+        self.histogram = histogram
+        self.top_holders = top_holders
+
+
 class DailyHMTData:
     """
     A class used to specify daily HMT data.
@@ -262,7 +311,7 @@ class HMTStatistics:
         :param total_transfer_amount: Total transfer amount
         :param total_transfer_count: Total transfer count
         :param total_holders: Total holders
-        :param holders: Holders
+        :param holders: Holders, up to the requested maximum number
         :param daily_hmt_data: Daily HMT data
         """
 
@@ -278,10 +327,17 @@ class StatisticsClient:
     A client used to get statistical data.
     """
 
-    def __init__(self, chain_id: ChainId = ChainId.POLYGON_MUMBAI):
+    def __init__(
+        self,
+        chain_id: ChainId = ChainId.POLYGON_MUMBAI,
+        event_day_data_ttl: int = 0,
+    ):
         """Initializes a Statistics instance
 
         :param chain_id: Chain ID to get statistical data from
+        :param event_day_data_ttl: Number of seconds the daily data fetched
+            for a date range is shared between the statistics calls.
+            By default, fresh data is always fetched.
 
         """
 
@@ -293,6 +349,104 @@ class StatisticsClient:
         if not self.network:
             raise StatisticsClientError("Empty network configuration")
 
+        self.event_day_data_ttl = event_day_data_ttl
+        self._event_day_datas_cache: "OrderedDict[Tuple, Tuple[float, List[dict]]]" = (
+            OrderedDict()
+        )
+
+    def _fetch_event_day_datas(self, param: StatisticsParam) -> List[dict]:
+        from human_protocol_sdk.gql.statistics import get_event_day_data_query
+
+        event_day_datas_data = get_data_from_subgraph(
+            self.network["subgraph_url"],
+            query=get_event_day_data_query(param),
+            params={
+                "from": int(param.date_from.timestamp()) if param.date_from else None,
+                "to": int(param.date_to.timestamp()) if param.date_to else None,
+            },
+        )
+        return event_day_datas_data["data"]["eventDayDatas"]
+
+    def _get_event_day_datas(self, param: StatisticsParam) -> List[dict]:
+        """Returns raw ``eventDayDatas`` for the given params.
+
+        The result is shared between the statistics calls made with the same
+        params during ``event_day_data_ttl`` seconds.
+        """
+
+        key = (
+            int(param.date_from.timestamp()) if param.date_from else None,
+            int(param.date_to.timestamp()) if param.date_to else None,
+            param.limit,
+        )
+
+        cache = self._event_day_datas_cache
+        cached = cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.event_day_data_ttl:
+            cache.move_to_end(key)
+            return cached[1]
+
+        event_day_datas = self._fetch_event_day_datas(param)
+        if self.event_day_data_ttl > 0:
+            now = time.monotonic()
+            for expired_key in [
+                k
+                for k, (fetched_at, _) in cache.items()
+                if now - fetched_at >= self.event_day_data_ttl
+            ]:
+                del cache[expired_key]
+
+            cache[key] = (now, event_day_datas)
+            cache.move_to_end(key)
+            while len(cache) > EVENT_DAY_DATA_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        return event_day_datas
+
+    def get_daily_statistics_table(
+        self,
+        param: StatisticsParam = StatisticsParam(),
+        table_format: TableFormat = TableFormat.NUMPY,
+    ):
+        """Get all daily statistics data for the given date range as a table.
+
+        Unlike the ``get_*_statistics`` methods, the daily data is not converted
+        into Python objects, but into a single columnar table with one row per
+        day. Requires ``numpy``, and ``pandas`` or ``pyarrow`` for the
+        corresponding formats.
+
+        :param param: Object containing the date range
+        :param table_format: Output format of the table
+
+        :return: NumPy structured array, ``pandas.DataFrame`` or ``pyarrow.Table``
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.contants import ChainId
+                from human_protocol_sdk.statistics import (
+                    StatisticsClient,
+                    StatisticsParam,
+                    TableFormat,
+                )
+
+                statistics_client = StatisticsClient(ChainId.POLYGON_MUMBAI)
+
+                table = statistics_client.get_daily_statistics_table(
+                    StatisticsParam(
+                        date_from=datetime.datetime(2021, 1, 1),
+                        date_to=datetime.datetime(2023, 6, 8),
+                    ),
+                    table_format=TableFormat.PANDAS,
+                )
+                print(table["active_workers"].sum())
+        """
+
+        return convert_table(
+            event_day_datas_to_array(self._get_event_day_datas(param)),
+            TableFormat(table_format),
+        )
+
     def get_escrow_statistics(
         self, param: StatisticsParam = StatisticsParam()
     ) -> EscrowStatistics:
@@ -322,7 +476,6 @@ class StatisticsClient:
         """
 
         from human_protocol_sdk.gql.statistics import (
-            get_event_day_data_query,
             get_escrow_statistics_query,
         )
 
@@ -332,15 +485,7 @@ class StatisticsClient:
         )
         escrow_statistics = escrow_statistics_data["data"]["escrowStatistics"]
 
-        event_day_datas_data = get_data_from_subgraph(
-            self.network["subgraph_url"],
-            query=get_event_day_data_query(param),
-            params={
-                "from": int(param.date_from.timestamp()) if param.date_from else None,
-                "to": int(param.date_to.timestamp()) if param.date_to else None,
-            },
-        )
-        event_day_datas = event_day_datas_data["data"]["eventDayDatas"]
+        event_day_datas = self._get_event_day_datas(param)
 
         return EscrowStatistics(
             total_escrows=int(escrow_statistics.get("totalEscrowCount", 0)),
@@ -394,19 +539,7 @@ class StatisticsClient:
                     )
                 )
         """
-        from human_protocol_sdk.gql.statistics import (
-            get_event_day_data_query,
-        )
-
-        event_day_datas_data = get_data_from_subgraph(
-            self.network["subgraph_url"],
-            query=get_event_day_data_query(param),
-            params={
-                "from": int(param.date_from.timestamp()) if param.date_from else None,
-                "to": int(param.date_to.timestamp()) if param.date_to else None,
-            },
-        )
-        event_day_datas = event_day_datas_data["data"]["eventDayDatas"]
+        event_day_datas = self._get_event_day_datas(param)
 
         return WorkerStatistics(
             daily_workers_data=[
@@ -448,19 +581,7 @@ class StatisticsClient:
                 )
         """
 
-        from human_protocol_sdk.gql.statistics import (
-            get_event_day_data_query,
-        )
-
-        event_day_datas_data = get_data_from_subgraph(
-            self.network["subgraph_url"],
-            query=get_event_day_data_query(param),
-            params={
-                "from": int(param.date_from.timestamp()) if param.date_from else None,
-                "to": int(param.date_to.timestamp()) if param.date_to else None,
-            },
-        )
-        event_day_datas = event_day_datas_data["data"]["eventDayDatas"]
+        event_day_datas = self._get_event_day_datas(param)
 
         return PaymentStatistics(
             daily_payments_data=[
@@ -482,11 +603,16 @@ class StatisticsClient:
         )
 
     def get_hmt_statistics(
-        self, param: StatisticsParam = StatisticsParam()
+        self,
+        param: StatisticsParam = StatisticsParam(),
+        max_holders: Optional[int] = 100,
     ) -> HMTStatistics:
         """Get HMT statistics data for the given date range.
 
         :param param: Object containing the date range
+        :param max_holders: Maximum number of holders to return, ``None`` for
+            all of them. Use ``get_hmt_holders_distribution`` to aggregate
+            the holders instead of loading them.
 
         :return: HMT statistics data
 
@@ -509,7 +635,6 @@ class StatisticsClient:
                 )
         """
         from human_protocol_sdk.gql.statistics import (
-            get_event_day_data_query,
             get_hmtoken_statistics_query,
         )
 
@@ -519,21 +644,19 @@ class StatisticsClient:
         )
         hmtoken_statistics = hmtoken_statistics_data["data"]["hmtokenStatistics"]
 
-        holders_data = get_data_from_subgraph(
-            self.network["subgraph_url"],
-            query=get_holders_query,
-        )
-        holders = holders_data["data"]["holders"]
+        if max_holders is None:
+            holders = list(self.iter_hmt_holders())
+        elif max_holders > 0:
+            holders = list(
+                islice(
+                    self.iter_hmt_holders(min(max_holders, HOLDERS_PAGE_SIZE)),
+                    max_holders,
+                )
+            )
+        else:
+            holders = []
 
-        event_day_datas_data = get_data_from_subgraph(
-            self.network["subgraph_url"],
-            query=get_event_day_data_query(param),
-            params={
-                "from": int(param.date_from.timestamp()) if param.date_from else None,
-                "to": int(param.date_to.timestamp()) if param.date_to else None,
-            },
-        )
-        event_day_datas = event_day_datas_data["data"]["eventDayDatas"]
+        event_day_datas = self._get_event_day_datas(param)
 
         return HMTStatistics(
             total_transfer_amount=int(
@@ -543,13 +666,7 @@ class StatisticsClient:
                 hmtoken_statistics.get("totalTransferEventCount", 0)
             ),
             total_holders=int(hmtoken_statistics.get("holders", 0)),
-            holders=[
-                HMTHolder(
-                    address=holder.get("address", ""),
-                    balance=int(holder.get("balance", 0)),
-                )
-                for holder in holders
-            ],
+            holders=holders,
             daily_hmt_data=[
                 DailyHMTData(
                     timestamp=datetime.fromtimestamp(
@@ -565,3 +682,112 @@ class StatisticsClient:
                 for event_day_data in event_day_datas
             ],
         )
+
+    def iter_hmt_holders(
+        self, page_size: int = HOLDERS_PAGE_SIZE
+    ) -> Iterator[HMTHolder]:
+        """Iterate over all HMT holders.
+
+        Holders are requested page by page, using the last received holder
+        as the cursor for the next page, so only one page is kept in memory.
+
+        :param page_size: Number of holders requested per page
+
+        :return: Iterator over the HMT holders
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.contants import ChainId
+                from human_protocol_sdk.statistics import StatisticsClient
+
+                statistics_client = StatisticsClient(ChainId.POLYGON_MUMBAI)
+
+                for holder in statistics_client.iter_hmt_holders():
+                    print(holder.address, holder.balance)
+        """
+
+        cursor = ""
+        while True:
+            holders_data = get_data_from_subgraph(
+                self.network["subgraph_url"],
+                query=get_holders_page_query,
+                params={"cursor": cursor, "first": page_size},
+            )
+            holders = holders_data["data"]["holders"]
+
+            for holder in holders:
+                yield HMTHolder(
+                    address=holder.get("address", ""),
+                    balance=int(holder.get("balance", 0)),
+                )
+
+            if len(holders) < page_size:
+                break
+
+            cursor = holders[-1]["id"]
+
+    def get_hmt_holders_distribution(
+        self,
+        bins: List[int] = DEFAULT_HOLDER_BALANCE_BINS,
+        top_n: int = 10,
+        page_size: int = HOLDERS_PAGE_SIZE,
+    ) -> HMTHolderDistribution:
+        """Get the balance distribution of the HMT holders.
+
+        The histogram and the top holders are computed while iterating over
+        the holders, so memory usage does not depend on the number of holders.
+
+        :param bins: Ascending lower edges of the balance buckets, in wei.
+            Balances below the first edge are not counted in the histogram.
+        :param top_n: Number of holders with the highest balance to return
+        :param page_size: Number of holders requested per page
+
+        :return: HMT holders distribution
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.contants import ChainId
+                from human_protocol_sdk.statistics import StatisticsClient
+
+                statistics_client = StatisticsClient(ChainId.POLYGON_MUMBAI)
+
+                distribution = statistics_client.get_hmt_holders_distribution(
+                    top_n=5
+                )
+                print(distribution.histogram)
+        """
+
+        if list(bins) != sorted(bins):
+            raise StatisticsClientError("Bins must be sorted in ascending order")
+
+        total_holders = 0
+        total_balance = 0
+        histogram = [0] * len(bins)
+        top_holders: List[Tuple[int, str]] = []
+
+        for holder in self.iter_hmt_holders(page_size):
+            total_holders += 1
+            total_balance += holder.balance
+
+            bucket = bisect_right(bins, holder.balance) - 1
+            if bucket >= 0:
+                histogram[bucket] += 1
+
+            if top_n > 0:
+                if len(top_holders) < top_n:
+                    heapq.heappush(top_holders, (holder.balance, holder.address))
+                elif holder.balance > top_holders[0][0]:
+                    heapq.heapreplace(top_holders, (holder.balance, holder.address))
+
+        return HMTHolderDistribution(
+            total_holders=total_holders,
+            total_balance=total_balance,
+            bins=list(bins),
+            histogram=histogram,
+            top_holders=[
+                HMTHolder(address=address, balance=balance)
+                for balance, address in sorted(top_holders, reverse=True)
+            ],
+        )
@@ -0,0 +1,182 @@
+"""
+This client keeps a local copy of the daily statistical data from the subgraph.
+
+The daily data is persisted into a SQLite database. Each synchronization only
+downloads the days newer than the last stored one, plus a re-sync window
+which covers the current (still changing) day and chain reorganizations.
+The ``get_*_statistics`` methods are then served from the local database.
+
+Code Example
+------------
+
+.. code-block:: python
+
+    from human_protocol_sdk.constants import ChainId
+    from human_protocol_sdk.statistics import StatisticsSync
+
+    statistics_sync = StatisticsSync(ChainId.POLYGON_MUMBAI, "statistics.db")
+
+    print(statistics_sync.get_worker_statistics())
+
+Module
+------
+"""
+
+import json
+import logging
+import sqlite3
+from contextlib import closing
+from typing import List, Optional
+
+from human_protocol_sdk.constants import ChainId
+from human_protocol_sdk.statistics.statistics_client import (
+    StatisticsClient,
+    StatisticsParam,
+)
+from human_protocol_sdk.utils import get_data_from_subgraph
+
+LOG = logging.getLogger("human_protocol_sdk.statistics")
+
+SUBGRAPH_PAGE_SIZE = 1000
+
+DEFAULT_RESYNC_WINDOW = 2 * 24 * 60 * 60
+
+
+class StatisticsSync(StatisticsClient):
+    """
+    A statistics client which serves daily data from a local store.
+    """
+
+    def __init__(
+        self,
+        chain_id: ChainId = ChainId.POLYGON_MUMBAI,
+        db_path: str = "statistics.db",
+        resync_window: int = DEFAULT_RESYNC_WINDOW,
+        auto_sync: bool = True,
+        event_day_data_ttl: int = 0,
+    ):
+        """Initializes a StatisticsSync instance
+
+        :param chain_id: Chain ID to get statistical data from
+        :param db_path: Path of the SQLite database used as local store
+        :param resync_window: Number of seconds before the last stored day
+            which are downloaded again on every synchronization
+        :param auto_sync: Synchronize the store before serving statistics
+        :param event_day_data_ttl: Number of seconds the daily data read
+            for a date range is shared between the statistics calls.
+            By default, fresh data is always read.
+
+        """
+
+        super().__init__(chain_id, event_day_data_ttl=event_day_data_ttl)
+
+        self.chain_id = ChainId(chain_id)
+        self.db_path = db_path
+        self.resync_window = resync_window
+        self.auto_sync = auto_sync
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS event_day_data ("
+                "chain_id INTEGER NOT NULL, "
+                "timestamp INTEGER NOT NULL, "
+                "data TEXT NOT NULL, "
+                "PRIMARY KEY (chain_id, timestamp))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def get_last_timestamp(self) -> Optional[int]:
+        """Get the timestamp of the last stored day.
+
+        :return: Timestamp of the last stored day, None if the store is empty
+        """
+
+        with closing(self._connect()) as connection:
+            (last_timestamp,) = connection.execute(
+                "SELECT MAX(timestamp) FROM event_day_data WHERE chain_id = ?",
+                (self.chain_id.value,),
+            ).fetchone()
+
+        return last_timestamp
+
+    def sync(self) -> int:
+        """Downloads the new daily data into the local store.
+
+        :return: Number of stored days which were inserted or updated
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.constants import ChainId
+                from human_protocol_sdk.statistics import StatisticsSync
+
+                statistics_sync = StatisticsSync(
+                    ChainId.POLYGON_MUMBAI, "statistics.db", auto_sync=False
+                )
+
+                print(statistics_sync.sync())
+        """
+
+        from human_protocol_sdk.gql.statistics import get_event_day_data_since_query
+
+        last_timestamp = self.get_last_timestamp()
+        cursor = last_timestamp - self.resync_window - 1 if last_timestamp else -1
+
+        synced = 0
+        while True:
+            event_day_datas_data = get_data_from_subgraph(
+                self.network["subgraph_url"],
+                query=get_event_day_data_since_query,
+                params={"from": cursor, "first": SUBGRAPH_PAGE_SIZE},
+            )
+            event_day_datas = event_day_datas_data["data"]["eventDayDatas"]
+            if not event_day_datas:
+                break
+
+            with closing(self._connect()) as connection, connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO event_day_data (chain_id, timestamp, data) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (
+                            self.chain_id.value,
+                            int(event_day_data["timestamp"]),
+                            json.dumps(event_day_data),
+                        )
+                        for event_day_data in event_day_datas
+                    ],
+                )
+
+            synced += len(event_day_datas)
+            cursor = int(event_day_datas[-1]["timestamp"])
+
+            if len(event_day_datas) < SUBGRAPH_PAGE_SIZE:
+                break
+
+        LOG.debug(f"Synchronized {synced} days of statistics from {cursor}")
+
+        return synced
+
+    def _fetch_event_day_datas(self, param: StatisticsParam) -> List[dict]:
+        if self.auto_sync:
+            self.sync()
+
+        query = "SELECT data FROM event_day_data WHERE chain_id = ?"
+        args = [self.chain_id.value]
+        if param.date_from:
+            query += " AND timestamp >= ?"
+            args.append(int(param.date_from.timestamp()))
+        if param.date_to:
+            query += " AND timestamp <= ?"
+            args.append(int(param.date_to.timestamp()))
+        query += " ORDER BY timestamp DESC"
+        if param.limit:
+            query += " LIMIT ?"
+            args.append(param.limit)
+
+        with closing(self._connect()) as connection:
+            rows = connection.execute(query, args).fetchall()
+
+        return [json.loads(data) for (data,) in rows]
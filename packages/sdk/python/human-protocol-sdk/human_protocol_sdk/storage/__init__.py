@@ -6,6 +6,7 @@ from .storage_client import (
     StorageClient,
     StorageClientError,
     StorageFileNotFoundError,
+    StorageObject,
     Credentials,
 )
 from .storage_utils import StorageUtils
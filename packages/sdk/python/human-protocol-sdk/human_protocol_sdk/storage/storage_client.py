@@ -34,7 +34,9 @@ import io
 import json
 import logging
 import os
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from warnings import warn
 
 from minio import Minio
@@ -45,6 +47,12 @@ DEBUG = "true" in os.getenv("DEBUG", "false").lower()
 LOG = logging.getLogger("human_protocol_sdk.storage")
 LOG.setLevel(logging.DEBUG if DEBUG else logging.INFO)
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+MULTIPART_PART_SIZE = 64 * 1024 * 1024
+
+EXISTENCE_CHECK_LISTING_LIMIT = 1000
+
 
 warn(f"The module {__name__} is deprecated.", DeprecationWarning, stacklevel=2)
 
@@ -90,6 +98,33 @@ class Credentials:
         self.secret_key = secret_key
 
 
+class StorageObject:
+    """
+    A class to represent an object stored in an S3-compatible bucket.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        size: Optional[int] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[datetime] = None,
+    ):
+        """
+        Initializes a StorageObject instance.
+
+        :param key: The key of the object.
+        :param size: The size of the object, in bytes.
+        :param etag: The ETag of the object.
+        :param last_modified: The last modification time of the object.
+        """
+
+        self.key = key
+        self.size = size
+        self.etag = etag
+        self.last_modified = last_modified
+
+
 class StorageClient:
     """
     A class for downloading files from an S3-compatible service.
@@ -156,12 +191,16 @@ class StorageClient:
             LOG.error(f"Connection with S3 failed because of: {e}")
             raise e
 
-    def download_files(self, files: List[str], bucket: str) -> List[bytes]:
+    def download_files(
+        self, files: List[str], bucket: str, max_workers: Optional[int] = None
+    ) -> List[bytes]:
         """
         Downloads a list of files from the specified S3-compatible bucket.
 
         :param files: A list of file keys to download.
         :param bucket: The name of the S3-compatible bucket to download from.
+        :param max_workers: Number of files downloaded concurrently.
+            Files are downloaded sequentially by default.
 
         :return: A list of file contents (bytes) downloaded from the bucket.
 
@@ -192,26 +231,175 @@ class StorageClient:
                     bucket = "my-bucket"
                 )
         """
-        result_files = []
+        return self._run_in_pool(
+            lambda file: self._download_file(file, bucket), files, max_workers
+        )
+
+    def iter_files(
+        self, files: List[str], bucket: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> Iterator[Tuple[str, Iterator[bytes]]]:
+        """
+        Streams a list of files from the specified S3-compatible bucket.
+
+        Files are downloaded one by one. Each chunk iterator must be consumed
+        before requesting the next file, since the connection of the file is
+        released when the next file is requested.
+
+        :param files: A list of file keys to download.
+        :param bucket: The name of the S3-compatible bucket to download from.
+        :param chunk_size: Maximum size of the chunks, in bytes.
+
+        :return: Iterator over (key, chunk iterator) pairs.
+
+        :raise StorageClientError: If an error occurs while downloading the files.
+        :raise StorageFileNotFoundError: If one of the specified files is not found in the bucket.
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.storage import StorageClient
+
+                storage_client = StorageClient(
+                    endpoint_url="s3.us-west-2.amazonaws.com",
+                    region="us-west-2",
+                )
+
+                for key, chunks in storage_client.iter_files(
+                    files = ["file1.txt", "file2.txt"],
+                    bucket = "my-bucket"
+                ):
+                    with open(key, "wb") as f:
+                        for chunk in chunks:
+                            f.write(chunk)
+        """
         for file in files:
+            response = self._get_object(file, bucket)
             try:
-                response = self.client.get_object(bucket_name=bucket, object_name=file)
-                result_files.append(response.read())
-            except Exception as e:
-                if hasattr(e, "code") and str(e.code) == "NoSuchKey":
-                    raise StorageFileNotFoundError("No object found - returning empty")
-                LOG.warning(
-                    f"Reading the key {file} with S3 failed" f" because of: {str(e)}"
+                yield file, self._stream_response(file, response, chunk_size)
+            finally:
+                self._release_response(response)
+
+    def download_files_to(
+        self,
+        files: Dict[str, Union[str, BinaryIO]],
+        bucket: str,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> None:
+        """
+        Downloads files from the specified S3-compatible bucket directly to
+        local paths or file objects, without keeping whole files in memory.
+
+        :param files: File keys mapped to the local path or the binary
+            file object to write each file to.
+        :param bucket: The name of the S3-compatible bucket to download from.
+        :param max_workers: Number of files downloaded concurrently.
+            Files are downloaded sequentially by default.
+        :param chunk_size: Maximum size of the chunks, in bytes.
+
+        :return: None
+
+        :raise StorageClientError: If an error occurs while downloading the files.
+        :raise StorageFileNotFoundError: If one of the specified files is not found in the bucket.
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.storage import StorageClient
+
+                storage_client = StorageClient(
+                    endpoint_url="s3.us-west-2.amazonaws.com",
+                    region="us-west-2",
                 )
-                raise StorageClientError(str(e))
-        return result_files
 
-    def upload_files(self, files: List[dict], bucket: str) -> List[dict]:
+                storage_client.download_files_to(
+                    files = {"file1.txt": "/tmp/file1.txt"},
+                    bucket = "my-bucket",
+                    max_workers = 8,
+                )
+        """
+
+        def download_file_to(item: Tuple[str, Union[str, BinaryIO]]) -> None:
+            file, destination = item
+            response = self._get_object(file, bucket)
+            try:
+                if isinstance(destination, (str, os.PathLike)):
+                    with open(destination, "wb") as f:
+                        for chunk in self._stream_response(file, response, chunk_size):
+                            f.write(chunk)
+                else:
+                    for chunk in self._stream_response(file, response, chunk_size):
+                        destination.write(chunk)
+            finally:
+                self._release_response(response)
+
+        self._run_in_pool(download_file_to, list(files.items()), max_workers)
+
+    @staticmethod
+    def _run_in_pool(fn: Callable, items: list, max_workers: Optional[int]) -> list:
+        if not max_workers or max_workers <= 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+
+        # The Minio client is thread-safe and shares one connection pool
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(fn, item) for item in items]
+            try:
+                return [future.result() for future in futures]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _get_object(self, file: str, bucket: str):
+        try:
+            return self.client.get_object(bucket_name=bucket, object_name=file)
+        except Exception as e:
+            raise self._download_error(file, e)
+
+    def _download_file(self, file: str, bucket: str) -> bytes:
+        response = self._get_object(file, bucket)
+        try:
+            return response.read()
+        except Exception as e:
+            raise self._download_error(file, e)
+        finally:
+            self._release_response(response)
+
+    def _stream_response(self, file: str, response, chunk_size: int) -> Iterator[bytes]:
+        try:
+            yield from response.stream(chunk_size)
+        except Exception as e:
+            raise self._download_error(file, e)
+
+    @staticmethod
+    def _release_response(response) -> None:
+        response.close()
+        response.release_conn()
+
+    @staticmethod
+    def _download_error(file: str, e: Exception) -> StorageClientError:
+        if hasattr(e, "code") and str(e.code) == "NoSuchKey":
+            return StorageFileNotFoundError("No object found - returning empty")
+        LOG.warning(f"Reading the key {file} with S3 failed" f" because of: {str(e)}")
+        return StorageClientError(str(e))
+
+    def upload_files(
+        self, files: List[dict], bucket: str, max_workers: Optional[int] = None
+    ) -> List[dict]:
         """
         Uploads a list of files to the specified S3-compatible bucket.
 
+        Files are either JSON-serializable objects, stored under the key
+        ``s3<sha1>.json``, or dicts with ``file``, ``key`` and ``hash`` fields.
+        ``file`` can be bytes or a binary file object, which is streamed
+        to the bucket as a multipart upload.
+
         :param files: A list of files to upload.
         :param bucket: The name of the S3-compatible bucket to upload to.
+        :param max_workers: Number of threads used to hash and upload files.
+            When set, the existing files are detected with a single listing
+            of the bucket instead of one request per file.
+            Files are uploaded sequentially by default.
 
         :return: List of dict with key, url, hash fields
 
@@ -241,25 +429,13 @@ class StorageClient:
                     bucket = "my-bucket"
                 )
         """
+        if max_workers and max_workers > 1 and len(files) > 1:
+            return self._upload_files_concurrently(files, bucket, max_workers)
+
         result_files = []
         for file in files:
-            if "file" in file and "key" in file and "hash" in file:
-                data = file["file"]
-                hash = file["hash"]
-                key = file["key"]
-            else:
-                try:
-                    artifact = json.dumps(file, sort_keys=True)
-                except Exception as e:
-                    LOG.error("Can't extract the json from the object")
-                    raise e
-                data = artifact.encode("utf-8")
-                hash = hashlib.sha1(data).hexdigest()
-                key = f"s3{hash}.json"
-
-            url = (
-                f"{'https' if self.secure else 'http'}://{self.endpoint}/{bucket}/{key}"
-            )
+            data, hash, key = self._prepare_upload(file)
+
             file_exist = None
 
             try:
@@ -279,21 +455,147 @@ class StorageClient:
 
             if not file_exist:
                 # file does not exist in bucket, so upload it
-                try:
-                    self.client.put_object(
-                        bucket_name=bucket,
-                        object_name=key,
-                        data=io.BytesIO(data),
-                        length=len(data),
-                    )
-                    LOG.debug(f"Uploaded to S3, key: {key}")
-                except Exception as e:
-                    raise StorageClientError(str(e))
+                self._put_file(bucket, key, data)
 
-            result_files.append({"key": key, "url": url, "hash": hash})
+            result_files.append(
+                {"key": key, "url": self._get_file_url(bucket, key), "hash": hash}
+            )
 
         return result_files
 
+    def _upload_files_concurrently(
+        self, files: List[dict], bucket: str, max_workers: int
+    ) -> List[dict]:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            prepared_files = list(executor.map(self._prepare_upload, files))
+
+            existing_keys = self._find_existing_keys(
+                bucket, [key for _, _, key in prepared_files], executor
+            )
+
+            # The same content can be passed several times, upload it once
+            uploads = {
+                key: data for data, _, key in prepared_files if key not in existing_keys
+            }
+            futures = [
+                executor.submit(self._put_file, bucket, key, data)
+                for key, data in uploads.items()
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return [
+            {"key": key, "url": self._get_file_url(bucket, key), "hash": hash}
+            for _, hash, key in prepared_files
+        ]
+
+    def _find_existing_keys(
+        self, bucket: str, keys: List[str], executor: ThreadPoolExecutor
+    ) -> set:
+        """
+        Checks which keys already exist in the bucket.
+
+        Uses a single listing of the bucket, from the first to the last of the
+        keys. If the listing goes past ``EXISTENCE_CHECK_LISTING_LIMIT`` unrelated
+        objects, falls back to concurrent ``stat_object`` calls.
+        """
+
+        pending = set(keys)
+        existing = set()
+        prefix = os.path.commonprefix(keys)
+        first_key = min(keys)
+        last_key = max(keys)
+        listing_limit = EXISTENCE_CHECK_LISTING_LIMIT + len(pending)
+
+        try:
+            for listed, obj in enumerate(
+                self.client.list_objects(
+                    bucket_name=bucket,
+                    prefix=prefix or None,
+                    # Any string preceding the first key, as start_after is exclusive
+                    start_after=first_key[:-1] or None,
+                    recursive=True,
+                )
+            ):
+                if obj.object_name in pending:
+                    existing.add(obj.object_name)
+                    pending.discard(obj.object_name)
+                # Listing is sorted, so no more keys can be found
+                if not pending or obj.object_name >= last_key:
+                    return existing
+                if listed >= listing_limit:
+                    break
+            else:
+                return existing
+        except Exception as e:
+            LOG.warning(f"Listing objects in S3 failed because of: {str(e)}")
+            raise StorageClientError(str(e))
+
+        def file_exists(key: str) -> bool:
+            try:
+                return bool(
+                    self.client.stat_object(bucket_name=bucket, object_name=key)
+                )
+            except Exception as e:
+                if hasattr(e, "code") and str(e.code) == "NoSuchKey":
+                    return False
+                LOG.warning(
+                    f"Reading the key {key} in S3 failed" f" because of: {str(e)}"
+                )
+                raise StorageClientError(str(e))
+
+        pending = sorted(pending)
+        existing.update(
+            key
+            for key, exists in zip(pending, executor.map(file_exists, pending))
+            if exists
+        )
+        return existing
+
+    @staticmethod
+    def _prepare_upload(file: dict) -> Tuple[Union[bytes, BinaryIO], str, str]:
+        if "file" in file and "key" in file and "hash" in file:
+            return file["file"], file["hash"], file["key"]
+
+        try:
+            artifact = json.dumps(file, sort_keys=True)
+        except Exception as e:
+            LOG.error("Can't extract the json from the object")
+            raise e
+        data = artifact.encode("utf-8")
+        hash = hashlib.sha1(data).hexdigest()
+        return data, hash, f"s3{hash}.json"
+
+    def _put_file(self, bucket: str, key: str, data: Union[bytes, BinaryIO]) -> None:
+        try:
+            if isinstance(data, (bytes, bytearray)):
+                self.client.put_object(
+                    bucket_name=bucket,
+                    object_name=key,
+                    data=io.BytesIO(data),
+                    length=len(data),
+                )
+            else:
+                # Streams of unknown length are sent as multipart uploads
+                self.client.put_object(
+                    bucket_name=bucket,
+                    object_name=key,
+                    data=data,
+                    length=-1,
+                    part_size=MULTIPART_PART_SIZE,
+                )
+            LOG.debug(f"Uploaded to S3, key: {key}")
+        except Exception as e:
+            raise StorageClientError(str(e))
+
+    def _get_file_url(self, bucket: str, key: str) -> str:
+        return f"{'https' if self.secure else 'http'}://{self.endpoint}/{bucket}/{key}"
+
     def bucket_exists(self, bucket: str) -> bool:
         """
         Check if a given bucket exists.
@@ -377,3 +679,72 @@ class StorageClient:
         except Exception as e:
             LOG.warning(f"Listing objects in S3 failed because of: {str(e)}")
             raise StorageClientError(str(e))
+
+    def iter_objects(
+        self,
+        bucket: str,
+        prefix: Optional[str] = None,
+        start_after: Optional[str] = None,
+        recursive: bool = True,
+    ) -> Iterator[StorageObject]:
+        """
+        Iterate over the objects in a given bucket, in key order.
+
+        Objects are requested page by page while iterating, so the memory usage
+        does not depend on the size of the bucket. The key of the last
+        processed object can be used as ``start_after`` to resume the iteration.
+
+        :param bucket: The name of the bucket to list objects from.
+        :param prefix: (Optional) Only list the objects whose key starts with it.
+        :param start_after: (Optional) Only list the objects after this key.
+        :param recursive: List the objects of all nested "directories".
+            When False, the nested "directories" are listed as objects instead.
+
+        :return: An iterator over the objects in the given bucket.
+
+        :raise StorageClientError: If an error occurs while listing the objects.
+
+        :example:
+            .. code-block:: python
+
+                from human_protocol_sdk.storage import (
+                    Credentials,
+                    StorageClient,
+                )
+
+                credentials = Credentials(
+                    access_key="my-access-key",
+                    secret_key="my-secret-key",
+                )
+
+                storage_client = StorageClient(
+                    endpoint_url="s3.us-west-2.amazonaws.com",
+                    region="us-west-2",
+                    credentials=credentials,
+                )
+
+                cursor = None
+                for obj in storage_client.iter_objects(
+                    bucket = "my-bucket",
+                    prefix = "results/",
+                    start_after = cursor,
+                ):
+                    print(obj.key, obj.size, obj.last_modified)
+                    cursor = obj.key
+        """
+        try:
+            for obj in self.client.list_objects(
+                bucket_name=bucket,
+                prefix=prefix,
+                start_after=start_after,
+                recursive=recursive,
+            ):
+                yield StorageObject(
+                    key=obj.object_name,
+                    size=obj.size,
+                    etag=obj.etag,
+                    last_modified=obj.last_modified,
+                )
+        except Exception as e:
+            LOG.warning(f"Listing objects in S3 failed because of: {str(e)}")
+            raise StorageClientError(str(e))
@@ -2,13 +2,21 @@
 Utility class for storage-related operations.
 """
 
+import hashlib
 import logging
 import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
 from warnings import warn
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from human_protocol_sdk.storage.storage_client import StorageClientError
+from human_protocol_sdk.storage.storage_client import (
+    DOWNLOAD_CHUNK_SIZE,
+    StorageClientError,
+)
 from human_protocol_sdk.utils import validate_url
 
 logging.getLogger("minio").setLevel(logging.INFO)
@@ -20,6 +28,93 @@ LOG.setLevel(logging.DEBUG if DEBUG else logging.INFO)
 
 warn(f"The module {__name__} is deprecated.", DeprecationWarning, stacklevel=2)
 
+DOWNLOAD_TIMEOUT = int(os.getenv("STORAGE_DOWNLOAD_TIMEOUT", 30))
+
+MAX_DOWNLOAD_SIZE = (
+    int(os.environ["STORAGE_MAX_DOWNLOAD_SIZE"])
+    if os.getenv("STORAGE_MAX_DOWNLOAD_SIZE")
+    else None
+)
+
+DOWNLOAD_CACHE_DIR = os.getenv("STORAGE_DOWNLOAD_CACHE_DIR")
+
+# Total size of the files cached in memory, in bytes
+DOWNLOAD_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Larger files are only cached on disk, if a cache directory is set
+DOWNLOAD_CACHE_MAX_ENTRY_BYTES = 4 * 1024 * 1024
+
+DOWNLOAD_POOL_SIZE = 32
+
+
+class _DownloadCache:
+    """
+    An LRU cache of the downloaded files, bounded by their total size.
+    Files are keyed by URL or by content hash, and stored with their ETag.
+    """
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._entries: "OrderedDict[str, Tuple[Optional[str], bytes]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Tuple[Optional[str], bytes]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, etag: Optional[str], content: bytes) -> None:
+        with self._lock:
+            self._remove(key)
+            if len(content) > self.max_entry_bytes:
+                return
+
+            self._entries[key] = (etag, content)
+            self._size += len(content)
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+
+_download_cache = _DownloadCache(
+    DOWNLOAD_CACHE_MAX_BYTES, DOWNLOAD_CACHE_MAX_ENTRY_BYTES
+)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=DOWNLOAD_POOL_SIZE, pool_maxsize=DOWNLOAD_POOL_SIZE
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+
+        return _session
+
 
 class StorageUtils:
     """
@@ -27,32 +122,141 @@ class StorageUtils:
     """
 
     @staticmethod
-    def download_file_from_url(url: str) -> bytes:
+    def download_file_from_url(
+        url: str,
+        hash: Optional[str] = None,
+        timeout: Optional[float] = DOWNLOAD_TIMEOUT,
+        max_size: Optional[int] = MAX_DOWNLOAD_SIZE,
+        cache_dir: Optional[str] = DOWNLOAD_CACHE_DIR,
+    ) -> bytes:
         """
         Downloads a file from the specified URL.
 
+        Connections are reused between calls. Files served with an ``ETag``
+        are cached, and later calls only revalidate them with the server.
+        When the expected hash of the file is known (e.g. the manifest hash of
+        an escrow), the file is treated as immutable: it is verified once and
+        then served from the cache without any request.
+
         :param url: The URL of the file to download.
+        :param hash: (Optional) The SHA1 hash of the file content, as computed by
+            ``StorageClient.upload_files``.
+        :param timeout: (Optional) The connect timeout and the maximum time
+            between two received chunks, in seconds. Use ``None`` to wait forever.
+        :param max_size: (Optional) The maximum size of the file, in bytes.
+            Unlimited by default, unless ``STORAGE_MAX_DOWNLOAD_SIZE`` is set.
+        :param cache_dir: (Optional) The directory used to persist the cache.
 
         :return: The content of the downloaded file.
 
-        :raise StorageClientError: If an error occurs while downloading the file.
+        :raise StorageClientError: If an error occurs while downloading the file,
+            if the file is too large or if it does not match the hash.
 
         :example:
             .. code-block:: python
 
-                from human_protocol_sdk.storage import StorageClient
+                from human_protocol_sdk.storage import StorageUtils
 
-                result = StorageClient.download_file_from_url(
+                result = StorageUtils.download_file_from_url(
                     "https://www.example.com/file.txt"
                 )
         """
         if not validate_url(url):
             raise StorageClientError(f"Invalid URL: {url}")
 
+        cache_key = hash or url
+        etag, content = StorageUtils._get_cached_file(cache_key, cache_dir, hash)
+        if content is not None and hash:
+            return content
+
         try:
-            response = requests.get(url)
-            response.raise_for_status()
+            headers = {"If-None-Match": etag} if etag else None
+            response = _get_session().get(
+                url, headers=headers, timeout=timeout, stream=True
+            )
+            try:
+                if response.status_code == 304 and content is not None:
+                    return content
+
+                response.raise_for_status()
 
-            return response.content
+                content_length = response.headers.get("Content-Length")
+                if max_size and content_length and int(content_length) > max_size:
+                    raise StorageClientError(
+                        f"File is too large: {content_length} bytes, "
+                        f"max {max_size} bytes"
+                    )
+
+                data = bytearray()
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    data.extend(chunk)
+                    if max_size and len(data) > max_size:
+                        raise StorageClientError(
+                            f"File is too large: more than {max_size} bytes"
+                        )
+                content = bytes(data)
+                etag = response.headers.get("ETag")
+            finally:
+                response.close()
+        except StorageClientError:
+            raise
         except Exception as e:
             raise StorageClientError(str(e))
+
+        if hash:
+            if hashlib.sha1(content).hexdigest() != hash:
+                raise StorageClientError(f"Invalid hash of the file: {url}")
+            StorageUtils._cache_file(cache_key, None, content, cache_dir)
+        elif etag:
+            StorageUtils._cache_file(cache_key, etag, content, cache_dir)
+
+        return content
+
+    @staticmethod
+    def _get_cache_path(cache_key: str, cache_dir: str) -> str:
+        return os.path.join(
+            cache_dir, hashlib.sha1(cache_key.encode("utf-8")).hexdigest()
+        )
+
+    @staticmethod
+    def _get_cached_file(
+        cache_key: str, cache_dir: Optional[str], hash: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[bytes]]:
+        entry = _download_cache.get(cache_key)
+        if entry is not None:
+            return entry
+
+        if not cache_dir:
+            return None, None
+
+        path = StorageUtils._get_cache_path(cache_key, cache_dir)
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+            with open(f"{path}.etag", encoding="utf-8") as f:
+                etag = f.read() or None
+        except OSError:
+            return None, None
+
+        if hash and hashlib.sha1(content).hexdigest() != hash:
+            LOG.warning(f"Ignoring corrupted cache file {path}")
+            return None, None
+
+        StorageUtils._cache_file(cache_key, etag, content, None)
+        return etag, content
+
+    @staticmethod
+    def _cache_file(
+        cache_key: str, etag: Optional[str], content: bytes, cache_dir: Optional[str]
+    ) -> None:
+        _download_cache.put(cache_key, etag, content)
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            path = StorageUtils._get_cache_path(cache_key, cache_dir)
+            # The ETag is written last, so a file without it is never served.
+            for file_path, data in ((path, content), (f"{path}.etag", etag or "")):
+                tmp_path = f"{file_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data.encode("utf-8") if isinstance(data, str) else data)
+                os.replace(tmp_path, file_path)
@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 import time
@@ -13,6 +14,7 @@ from web3.exceptions import ContractLogicError
 from web3.types import TxParams
 
 from human_protocol_sdk.constants import ARTIFACTS_FOLDER
+from human_protocol_sdk.signer import get_signer
 
 logger = logging.getLogger("human_protocol_sdk.utils")
 
@@ -96,9 +98,12 @@ def parse_transfer_transaction(
     return hmt_transferred and tx_balance is not None, tx_balance
 
 
+@functools.lru_cache(maxsize=None)
 def get_contract_interface(contract_entrypoint):
     """Retrieve the contract interface of a given contract.
 
+    The interface is read once per contract, and shared afterwards.
+
     :param contract_entrypoint: the entrypoint of the JSON.
 
     :return: The contract interface containing the contract abi.
@@ -211,11 +216,16 @@ def handle_transaction(
 
     :validate:
         - There must be a default account
+        - There must be a local signer attached to the Web3 instance, or
+          the construct_sign_and_send_raw_middleware middleware
 
     """
+    signer = get_signer(w3)
     if not w3.eth.default_account:
         raise exception("You must add an account to Web3 instance")
-    if not w3.middleware_onion.get("construct_sign_and_send_raw_middleware"):
+    if signer is None and not w3.middleware_onion.get(
+        "construct_sign_and_send_raw_middleware"
+    ):
         raise exception(
             "You must add construct_sign_and_send_raw_middleware middleware to Web3 instance"
         )
@@ -224,7 +234,10 @@ def handle_transaction(
             tx_options["gas"] = tx.estimate_gas()
         elif tx_options is None:
             tx_options = {"gas": tx.estimate_gas()}
-        tx_hash = tx.transact(tx_options)
+        if signer is not None:
+            tx_hash = signer.send_transaction(tx, tx_options)
+        else:
+            tx_hash = tx.transact(tx_options)
         return w3.eth.wait_for_transaction_receipt(tx_hash)
     except ContractLogicError as e:
         start_index = e.args[0].find("execution reverted: ") + len(
@@ -0,0 +1,68 @@
+"""
+Compares the backends of the legacy ECIES encryption.
+
+Usage: python scripts/benchmark_legacy_encryption.py [--messages N] [--workers N]
+"""
+
+import argparse
+import time
+
+from human_protocol_sdk.legacy_encryption import (
+    BACKEND_COINCURVE,
+    BACKEND_CRYPTOGRAPHY,
+    Encryption,
+    coincurve,
+)
+
+
+def measure(name: str, count: int, function) -> None:
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<40} {count / elapsed:>10.0f} msg/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=1024)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    backends = [BACKEND_CRYPTOGRAPHY]
+    if coincurve:
+        backends.append(BACKEND_COINCURVE)
+    else:
+        print("coincurve is not installed, only the cryptography backend is measured")
+
+    private_key = Encryption().generate_private_key()
+    data = b"x" * args.size
+
+    for backend in backends:
+        encryption = Encryption(backend)
+        encrypted = []
+
+        measure(
+            f"{backend}: encrypt",
+            args.messages,
+            lambda: encrypted.extend(
+                encryption.encrypt(data, private_key.public_key)
+                for _ in range(args.messages)
+            ),
+        )
+        measure(
+            f"{backend}: decrypt",
+            args.messages,
+            lambda: [encryption.decrypt(message, private_key) for message in encrypted],
+        )
+        measure(
+            f"{backend}: decrypt_many",
+            args.messages,
+            lambda: encryption.decrypt_many(
+                encrypted, private_key, max_workers=args.workers
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,5 +17,9 @@ setuptools.setup(
     packages=setuptools.find_packages() + ["artifacts"],
     setup_requires="setuptools-pipfile",
     use_pipfile=True,
-    extras_require={"agreement": ["numpy", "pyerf"]},
+    extras_require={
+        "agreement": ["numpy", "pyerf"],
+        "statistics": ["numpy"],
+        "legacy-encryption": ["coincurve"],
+    },
 )
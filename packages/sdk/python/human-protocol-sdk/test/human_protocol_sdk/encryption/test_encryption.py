@@ -88,6 +88,45 @@ class TestEncryption(unittest.TestCase):
         self.assertIsInstance(decrypted_message, str)
         self.assertEqual(decrypted_message, message)
 
+    def test_encrypt_many(self):
+        encryption = Encryption(private_key3, passphrase)
+        messages = [f"{message} {i}" for i in range(4)]
+        results = encryption.encrypt_many(
+            messages, [public_key, public_key2], max_workers=2
+        )
+
+        self.assertTrue(all(result.ok for result in results))
+        decryption = Encryption(private_key2)
+        self.assertEqual(
+            [decryption.decrypt(result.message, public_key3) for result in results],
+            messages,
+        )
+
+    def test_decrypt_many(self):
+        encryption = Encryption(private_key3, passphrase)
+        results = encryption.decrypt_many(
+            [encrypted_message, "invalid_message", encrypted_unsigned_message],
+            max_workers=2,
+        )
+
+        self.assertEqual(results[0].message, message)
+        self.assertFalse(results[1].ok)
+        self.assertIsNone(results[1].message)
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertEqual(results[2].message, message)
+
+    def test_decrypt_many_in_current_process(self):
+        encryption = Encryption(private_key2)
+        results = encryption.decrypt_many(
+            [encrypted_message, encrypted_message], public_key2, max_workers=1
+        )
+
+        for result in results:
+            self.assertEqual(
+                "Failed to decrypt message: Could not find signature with this public key",
+                str(result.error),
+            )
+
     def test_sign(self):
         encryption = Encryption(private_key)
         signed_message = encryption.sign(message)
@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import patch
+from test.human_protocol_sdk.utils.encryption import (
+    private_key2,
+    public_key,
+    public_key2,
+    public_key3,
+    signed_message,
+    message,
+)
+
+from human_protocol_sdk.encryption import Encryption, EncryptionUtils, Keyring
+from pgpy import PGPKey
+
+
+class TestKeyring(unittest.TestCase):
+    def test_add(self):
+        keyring = Keyring([public_key2, public_key3])
+
+        self.assertEqual(len(keyring), 2)
+        for key in keyring.public_keys:
+            self.assertIsInstance(key, PGPKey)
+            self.assertIn(str(key.fingerprint), keyring)
+
+    def test_add_invalid_public_key(self):
+        with self.assertRaises(ValueError) as cm:
+            Keyring(["invalid_public_key"])
+        self.assertEqual(f"Expected: ASCII-armored PGP data", str(cm.exception))
+
+    def test_get_parses_once(self):
+        keyring = Keyring([public_key2])
+        from_blob = PGPKey.from_blob
+        with patch("human_protocol_sdk.encryption.keyring.PGPKey.from_blob") as mock:
+            mock.side_effect = from_blob
+            key2 = keyring.get(public_key2)
+            key3 = keyring.get(public_key3)
+
+            self.assertIs(keyring.get(public_key3), key3)
+            self.assertIs(keyring.get(str(key2.fingerprint)), key2)
+            mock.assert_called_once_with(public_key3)
+
+        self.assertEqual(len(keyring), 1)
+
+    def test_get_evicts_least_recently_used(self):
+        keyring = Keyring(cache_size=1)
+        key2 = keyring.get(public_key2)
+        keyring.get(public_key3)
+
+        self.assertIsNot(keyring.get(public_key2), key2)
+
+    def test_encrypt_with_keyring(self):
+        keyring = Keyring([public_key, public_key2])
+        encrypted_message = EncryptionUtils.encrypt(message, keyring)
+
+        encryption = Encryption(private_key2)
+        self.assertEqual(encryption.decrypt(encrypted_message), message)
+
+    def test_verify_with_keyring(self):
+        keyring = Keyring([public_key])
+        self.assertTrue(EncryptionUtils.verify(signed_message, public_key, keyring))
+
+
+if __name__ == "__main__":
+    unittest.main(exit=True)
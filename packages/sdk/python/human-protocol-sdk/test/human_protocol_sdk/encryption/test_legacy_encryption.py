@@ -1,6 +1,12 @@
 import unittest
 
-from human_protocol_sdk.legacy_encryption import Encryption, DecryptionError
+from human_protocol_sdk.legacy_encryption import (
+    BACKEND_COINCURVE,
+    BACKEND_CRYPTOGRAPHY,
+    Encryption,
+    DecryptionError,
+    coincurve,
+)
 from test.human_protocol_sdk.utils.encryption import message
 
 from eth_keys import keys as eth_keys
@@ -64,3 +70,68 @@ class TestLegacyEncryption(unittest.TestCase):
         decrypted = self.encryption.decrypt(encrypted, self.private_key)
 
         self.assertEqual(decrypted, self.data)
+
+    @unittest.skipUnless(coincurve, "coincurve is not installed")
+    def test_backends_are_compatible(self):
+        """Tests decryption of data encrypted with another backend."""
+        coincurve_encryption = Encryption(BACKEND_COINCURVE)
+        cryptography_encryption = Encryption(BACKEND_CRYPTOGRAPHY)
+
+        encrypted = coincurve_encryption.encrypt(self.data, self.public_key)
+        decrypted = cryptography_encryption.decrypt(encrypted, self.private_key)
+        self.assertEqual(decrypted, self.data)
+
+        encrypted = cryptography_encryption.encrypt(self.data, self.public_key)
+        decrypted = coincurve_encryption.decrypt(encrypted, self.private_key)
+        self.assertEqual(decrypted, self.data)
+
+    def test_private_key_cache(self):
+        """Tests loaded private keys are kept per instance, by public key."""
+        encryption = Encryption(key_cache_size=2)
+        keys = [encryption.generate_private_key() for _ in range(3)]
+
+        for key in keys:
+            encrypted = encryption.encrypt(self.data, key.public_key)
+            self.assertEqual(encryption.decrypt(encrypted, key), self.data)
+
+        self.assertEqual(
+            list(encryption._private_keys),
+            [key.public_key.to_bytes() for key in keys[1:]],
+        )
+        self.assertNotIn(keys[2].to_bytes(), encryption._private_keys)
+        self.assertEqual(len(self.encryption._private_keys), 0)
+
+        encryption.clear_key_cache()
+        self.assertEqual(len(encryption._private_keys), 0)
+
+    def test_private_key_cache_disabled(self):
+        """Tests private keys are not kept when the cache is disabled."""
+        encryption = Encryption(key_cache_size=0)
+        encrypted = encryption.encrypt(self.data, self.public_key)
+
+        self.assertEqual(encryption.decrypt(encrypted, self.private_key), self.data)
+        self.assertEqual(len(encryption._private_keys), 0)
+
+    def test_invalid_backend(self):
+        """Tests unsupported backends are rejected."""
+        with self.assertRaises(ValueError):
+            Encryption("invalid")
+
+    def test_decrypt_many(self):
+        """Tests decryption of many messages, keeping their order and errors."""
+        messages = [self.data + bytes([i]) for i in range(4)]
+        encrypted = [
+            self.encryption.encrypt(message, self.public_key) for message in messages
+        ]
+        encrypted.insert(2, self.encryption.encrypt(self.data, self.bad_public_key))
+
+        for max_workers in (1, 2):
+            results = self.encryption.decrypt_many(
+                encrypted, self.private_key, max_workers=max_workers
+            )
+
+            self.assertEqual(
+                [result.message for result in results if result.ok], messages
+            )
+            self.assertIsNone(results[2].message)
+            self.assertIsInstance(results[2].error, DecryptionError)
@@ -0,0 +1,140 @@
+import io
+import unittest
+from test.human_protocol_sdk.utils.encryption import (
+    private_key,
+    private_key2,
+    private_key3,
+    public_key2,
+    public_key3,
+    passphrase,
+)
+
+from human_protocol_sdk.encryption import Encryption, EncryptionUtils
+from human_protocol_sdk.encryption.streaming import (
+    ARMOR_FOOTER,
+    ARMOR_HEADER,
+    CHUNK_HEADER,
+    CHUNK_SIZE,
+    FRAME_LENGTH,
+)
+from pgpy import PGPKey, PGPMessage
+
+# Spans two chunks
+data = bytes(range(256)) * (CHUNK_SIZE // 256) + b"end"
+
+
+class TestStreaming(unittest.TestCase):
+    def encrypt(self, content: bytes, armor: bool = False) -> bytes:
+        output = io.BytesIO()
+        EncryptionUtils.encrypt_stream(
+            io.BytesIO(content), output, [public_key2, public_key3], armor=armor
+        )
+        return output.getvalue()
+
+    def decrypt(self, encryption: Encryption, encrypted: bytes) -> bytes:
+        output = io.BytesIO()
+        encryption.decrypt_stream(io.BytesIO(encrypted), output)
+        return output.getvalue()
+
+    def test_encrypt_and_decrypt_stream(self):
+        encrypted = self.encrypt(data)
+
+        self.assertEqual(self.decrypt(Encryption(private_key2), encrypted), data)
+        self.assertEqual(
+            self.decrypt(Encryption(private_key3, passphrase), encrypted), data
+        )
+
+    def test_encrypt_and_decrypt_empty_stream(self):
+        encrypted = self.encrypt(b"")
+        self.assertEqual(self.decrypt(Encryption(private_key2), encrypted), b"")
+
+    def test_encrypt_stream_armored(self):
+        encrypted = self.encrypt(data, armor=True)
+
+        self.assertTrue(encrypted.startswith(ARMOR_HEADER))
+        self.assertEqual(self.decrypt(Encryption(private_key2), encrypted), data)
+
+    def test_encrypted_stream_chunks_are_openpgp_messages(self):
+        recipient_key, _ = PGPKey.from_blob(private_key2)
+        encrypted = self.encrypt(data)
+
+        chunks = []
+        offset = 0
+        while offset < len(encrypted):
+            (length,) = FRAME_LENGTH.unpack_from(encrypted, offset)
+            offset += FRAME_LENGTH.size
+            pgp_message = PGPMessage.from_blob(encrypted[offset : offset + length])
+            chunks.append(bytes(recipient_key.decrypt(pgp_message).message))
+            offset += length
+
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(b"".join(chunk[CHUNK_HEADER.size :] for chunk in chunks), data)
+
+    def test_encrypt_stream_armored_without_checksum(self):
+        encrypted = self.encrypt(data, armor=True)
+
+        lines = encrypted.splitlines()
+        self.assertEqual(lines[0], ARMOR_HEADER)
+        self.assertEqual(lines[-1], ARMOR_FOOTER)
+        self.assertFalse(any(line.startswith(b"=") for line in lines))
+
+    def test_decrypt_stream_wrong_private_key(self):
+        with self.assertRaises(ValueError) as cm:
+            self.decrypt(Encryption(private_key), self.encrypt(data))
+        self.assertEqual(
+            "Failed to decrypt message: Cannot decrypt the provided message with this key",
+            str(cm.exception),
+        )
+
+    def assertModified(self, encrypted: bytes, output: io.BytesIO = None):
+        with self.assertRaises(ValueError) as cm:
+            Encryption(private_key2).decrypt_stream(
+                io.BytesIO(encrypted), output or io.BytesIO()
+            )
+        self.assertEqual(
+            "Failed to decrypt message: Message modification detected",
+            str(cm.exception),
+        )
+
+    def split_frames(self, encrypted: bytes) -> list:
+        frames = []
+        offset = 0
+        while offset < len(encrypted):
+            (length,) = FRAME_LENGTH.unpack_from(encrypted, offset)
+            frames.append(encrypted[offset : offset + FRAME_LENGTH.size + length])
+            offset += FRAME_LENGTH.size + length
+        return frames
+
+    def test_decrypt_stream_modified_message(self):
+        encrypted = bytearray(self.encrypt(data))
+        encrypted[-30] ^= 1
+
+        output = io.BytesIO()
+        self.assertModified(bytes(encrypted), output)
+        # Only the verified chunks are written
+        self.assertEqual(output.getvalue(), data[:CHUNK_SIZE])
+
+    def test_decrypt_stream_modified_first_bytes(self):
+        # The encrypted data of a short chunk, the quick check bytes included,
+        # don't give a different error when modified
+        for position in range(1, 79):
+            encrypted = bytearray(self.encrypt(b"data"))
+            encrypted[-position] ^= 1
+            self.assertModified(bytes(encrypted))
+
+    def test_decrypt_stream_truncated_message(self):
+        frames = self.split_frames(self.encrypt(data))
+        self.assertModified(frames[0])
+
+    def test_decrypt_stream_reordered_chunks(self):
+        frames = self.split_frames(self.encrypt(data))
+        self.assertModified(frames[1] + frames[0])
+
+    def test_decrypt_stream_mixed_streams(self):
+        frames = self.split_frames(self.encrypt(data))
+        other_frames = self.split_frames(self.encrypt(data))
+        self.assertModified(frames[0] + other_frames[1])
+
+
+if __name__ == "__main__":
+    unittest.main(exit=True)
@@ -1,12 +1,20 @@
+import json
+import os
+import tempfile
 import unittest
 
+import requests
+
 from human_protocol_sdk.constants import NETWORKS
 from test.human_protocol_sdk.utils import DEFAULT_GAS_PAYER_PRIV
 from unittest.mock import MagicMock, PropertyMock, patch
 
 from human_protocol_sdk.kvstore import KVStoreClient, KVStoreClientError
-from human_protocol_sdk.constants import ChainId
+from human_protocol_sdk.kvstore import kvstore_client
+from human_protocol_sdk.constants import ChainId, MULTICALL3_ADDRESS
 from web3 import Web3
+from web3.exceptions import BadFunctionCallOutput
+from web3.providers.base import BaseProvider
 from web3.providers.rpc import HTTPProvider
 from web3.middleware import construct_sign_and_send_raw_middleware
 
@@ -28,6 +36,8 @@ class TestKVStoreClient(unittest.TestCase):
         type(self.w3.eth).chain_id = PropertyMock(return_value=self.mock_chain_id)
 
         self.kvstore = KVStoreClient(self.w3)
+        kvstore_client._file_cache.clear()
+        kvstore_client._multicall3_unavailable_chains.clear()
 
     def test_init_with_valid_inputs(self):
         mock_provider = MagicMock(spec=HTTPProvider)
@@ -328,6 +338,162 @@ class TestKVStoreClient(unittest.TestCase):
         mock_function.return_value.call.assert_called_once_with()
         self.assertEqual(result, "mock_value")
 
+    def test_get_bulk(self):
+        address_1 = Web3.to_checksum_address(
+            "0x1234567890123456789012345678901234567890"
+        )
+        address_2 = Web3.to_checksum_address(
+            "0x1234567890123456789012345678901234567891"
+        )
+        mock_multicall = MagicMock()
+        mock_multicall.functions.aggregate3.return_value.call.side_effect = [
+            [
+                (True, self.w3.codec.encode(["string"], ["role"])),
+                (True, self.w3.codec.encode(["string"], ["http://localhost"])),
+            ],
+            [(True, self.w3.codec.encode(["string"], [""]))],
+        ]
+
+        with patch.object(self.w3.eth, "contract", return_value=mock_multicall):
+            result = self.kvstore.get_bulk(
+                [
+                    (address_1, "role"),
+                    (address_1, "webhook_url"),
+                    (address_2, "role"),
+                ],
+                batch_size=2,
+            )
+
+        self.assertEqual(
+            result,
+            {
+                address_1: {"role": "role", "webhook_url": "http://localhost"},
+                address_2: {"role": ""},
+            },
+        )
+        self.assertEqual(mock_multicall.functions.aggregate3.call_count, 2)
+        calls = mock_multicall.functions.aggregate3.call_args_list[0].args[0]
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0][0], self.kvstore.kvstore_contract.address)
+        self.assertEqual(
+            calls[0][2],
+            self.kvstore.kvstore_contract.encodeABI(
+                fn_name="get", args=[address_1, "role"]
+            ),
+        )
+
+    def test_get_bulk_rpc_batch_fallback(self):
+        address = Web3.to_checksum_address("0x1234567890123456789012345678901234567890")
+        values = {
+            self.kvstore.kvstore_contract.encodeABI(
+                fn_name="get", args=[address, key]
+            ): value
+            for key, value in [("role", "Job Launcher"), ("fee", "10")]
+        }
+        posted = []
+
+        class RPCAdapter(requests.adapters.BaseAdapter):
+            """Answers the JSON-RPC requests of a node without Multicall3"""
+
+            def send(self, request, **kwargs):
+                body = json.loads(request.body)
+                posted.append(body)
+
+                def result(item):
+                    if item["method"] == "eth_chainId":
+                        return hex(ChainId.LOCALHOST.value)
+                    if item["method"] == "eth_getCode":
+                        return "0x"
+                    call = item["params"][0]
+                    if call["to"] == MULTICALL3_ADDRESS:
+                        return "0x"  # no code at the address
+                    return Web3.to_hex(
+                        Web3().codec.encode(["string"], [values[call["data"]]])
+                    )
+
+                items = body if isinstance(body, list) else [body]
+                responses = [
+                    {"jsonrpc": "2.0", "id": item["id"], "result": result(item)}
+                    for item in reversed(items)
+                ]
+
+                response = requests.Response()
+                response.status_code = 200
+                response._content = json.dumps(
+                    responses if isinstance(body, list) else responses[0]
+                ).encode()
+                return response
+
+            def close(self):
+                pass
+
+        session = requests.Session()
+        session.mount("http://", RPCAdapter())
+        w3 = Web3(HTTPProvider("http://kvstore.test:8545", session=session))
+        kvstore = KVStoreClient(w3)
+
+        result = kvstore.get_bulk(
+            [(address, "role"), (address, "fee"), (address, "role")], batch_size=2
+        )
+
+        self.assertEqual(result, {address: {"role": "Job Launcher", "fee": "10"}})
+        batches = [body for body in posted if isinstance(body, list)]
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertTrue(all(item["method"] == "eth_call" for item in batches[0]))
+        # Multicall3 is not tried again once it is known to be unavailable
+        multicalls = [
+            body
+            for body in posted
+            if isinstance(body, dict)
+            and body["method"] == "eth_call"
+            and body["params"][0]["to"] == MULTICALL3_ADDRESS
+        ]
+        self.assertEqual(len(multicalls), 1)
+
+    def test_get_bulk_sequential_fallback(self):
+        address = Web3.to_checksum_address("0x1234567890123456789012345678901234567890")
+        mock_multicall = MagicMock()
+        mock_multicall.functions.aggregate3.return_value.call.side_effect = Exception(
+            "Connection error"
+        )
+
+        # Only HTTP providers support batching
+        self.w3.provider = MagicMock(spec=BaseProvider)
+
+        with (
+            patch.object(self.w3.eth, "contract", return_value=mock_multicall),
+            patch.object(self.w3.eth, "call") as mock_call,
+        ):
+            mock_call.side_effect = [
+                self.w3.codec.encode(["string"], ["Job Launcher"]),
+                self.w3.codec.encode(["string"], ["10"]),
+            ]
+
+            result = self.kvstore.get_bulk([(address, "role"), (address, "fee")])
+
+            self.assertEqual(mock_call.call_count, 2)
+            self.assertEqual(
+                mock_call.call_args_list[0].args[0]["to"],
+                self.kvstore.kvstore_contract.address,
+            )
+
+        self.assertEqual(result, {address: {"role": "Job Launcher", "fee": "10"}})
+        # Multicall3 is still used after an unrelated failure
+        self.assertNotIn(
+            self.kvstore.chain_id, kvstore_client._multicall3_unavailable_chains
+        )
+
+    def test_get_bulk_invalid_address(self):
+        with self.assertRaises(KVStoreClientError) as cm:
+            self.kvstore.get_bulk([("invalid_address", "key")])
+        self.assertEqual("Invalid address: invalid_address", str(cm.exception))
+
+    def test_get_bulk_empty_key(self):
+        address = Web3.to_checksum_address("0x1234567890123456789012345678901234567890")
+        with self.assertRaises(KVStoreClientError) as cm:
+            self.kvstore.get_bulk([(address, "")])
+        self.assertEqual("Key can not be empty", str(cm.exception))
+
     def test_get_empty_key(self):
         address = Web3.to_checksum_address("0x1234567890123456789012345678901234567890")
         key = ""
@@ -520,6 +686,81 @@ class TestKVStoreClient(unittest.TestCase):
 
             self.assertEqual(result, "PUBLIC_KEY")
 
+    def test_get_public_key_is_downloaded_once(self):
+        public_key_hash = self.w3.keccak(text="PUBLIC_KEY").hex()
+        mock_function = MagicMock(
+            side_effect=lambda address, key: MagicMock(
+                call=MagicMock(
+                    return_value=(
+                        public_key_hash if key.endswith("_hash") else "PUBLIC_KEY_URL"
+                    )
+                )
+            )
+        )
+        self.kvstore.kvstore_contract.functions.get = mock_function
+        address = Web3.to_checksum_address("0x1234567890123456789012345678901234567890")
+
+        with patch("requests.get") as mock_get:
+            mock_get.return_value.text = "PUBLIC_KEY"
+
+            self.assertEqual(self.kvstore.get_public_key(address), "PUBLIC_KEY")
+            self.assertEqual(self.kvstore.get_public_key(address), "PUBLIC_KEY")
+
+            mock_get.assert_called_once_with("PUBLIC_KEY_URL", timeout=30)
+
+    def test_get_public_key_from_disk_cache(self):
+        public_key_hash = self.w3.keccak(text="PUBLIC_KEY").hex()
+        mock_function = MagicMock(
+            side_effect=lambda address, key: MagicMock(
+                call=MagicMock(
+                    return_value=(
+                        public_key_hash if key.endswith("_hash") else "PUBLIC_KEY_URL"
+                    )
+                )
+            )
+        )
+        address = Web3.to_checksum_address("0x1234567890123456789012345678901234567890")
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            kvstore = KVStoreClient(self.w3, cache_dir=cache_dir)
+            kvstore.kvstore_contract.functions.get = mock_function
+
+            with patch("requests.get") as mock_get:
+                mock_get.return_value.text = "PUBLIC_KEY"
+                self.assertEqual(kvstore.get_public_key(address), "PUBLIC_KEY")
+
+            self.assertTrue(os.path.isfile(os.path.join(cache_dir, public_key_hash)))
+            kvstore_client._file_cache.clear()
+
+            with patch("requests.get") as mock_get:
+                self.assertEqual(kvstore.get_public_key(address), "PUBLIC_KEY")
+                mock_get.assert_not_called()
+
+    def test_get_public_key_ignores_corrupted_disk_cache(self):
+        public_key_hash = self.w3.keccak(text="PUBLIC_KEY").hex()
+        mock_function = MagicMock(
+            side_effect=lambda address, key: MagicMock(
+                call=MagicMock(
+                    return_value=(
+                        public_key_hash if key.endswith("_hash") else "PUBLIC_KEY_URL"
+                    )
+                )
+            )
+        )
+        address = Web3.to_checksum_address("0x1234567890123456789012345678901234567890")
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with open(os.path.join(cache_dir, public_key_hash), "w") as f:
+                f.write("CORRUPTED")
+
+            kvstore = KVStoreClient(self.w3, cache_dir=cache_dir)
+            kvstore.kvstore_contract.functions.get = mock_function
+
+            with patch("requests.get") as mock_get:
+                mock_get.return_value.text = "PUBLIC_KEY"
+                self.assertEqual(kvstore.get_public_key(address), "PUBLIC_KEY")
+                mock_get.assert_called_once()
+
     def test_get_public_key_invalid_address(self):
         address = "invalid_address"
         with self.assertRaises(KVStoreClientError) as cm:
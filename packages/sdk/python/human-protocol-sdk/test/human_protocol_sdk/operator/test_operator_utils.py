@@ -5,11 +5,17 @@ from unittest.mock import MagicMock, patch
 from human_protocol_sdk.constants import NETWORKS, ChainId
 from human_protocol_sdk.gql.operator import (
     get_leader_query,
+    get_leaders_page_query,
     get_leaders_query,
     get_reputation_network_query,
 )
 from human_protocol_sdk.gql.reward import get_reward_added_events_query
-from human_protocol_sdk.operator import LeaderFilter, OperatorUtils
+from human_protocol_sdk.operator import (
+    LeaderDirectory,
+    LeaderFilter,
+    OperatorUtils,
+    OperatorUtilsError,
+)
 
 
 class TestOperatorUtils(unittest.TestCase):
@@ -204,5 +210,211 @@ class TestOperatorUtils(unittest.TestCase):
             self.assertEqual(rewards_info[1].amount, 20)
 
 
+class TestLeaderDirectory(unittest.TestCase):
+    def setUp(self):
+        self.leaders_data = {
+            "data": {
+                "leaders": [
+                    {
+                        "id": DEFAULT_GAS_PAYER,
+                        "address": DEFAULT_GAS_PAYER,
+                        "role": "Job Launcher",
+                        "fee": "10",
+                        "publicKey": "public key",
+                        "webhookUrl": "http://job-launcher",
+                    },
+                    {
+                        "id": "0x1234567890123456789012345678901234567891",
+                        "address": "0x1234567890123456789012345678901234567891",
+                        "role": "Recording Oracle",
+                        "fee": None,
+                        "publicKey": None,
+                        "webhookUrl": "http://recording-oracle",
+                    },
+                ],
+            }
+        }
+
+    def test_lookups_are_served_from_memory(self):
+        with patch(
+            "human_protocol_sdk.operator.operator_utils.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.return_value = self.leaders_data
+            leader_directory = LeaderDirectory(ChainId.POLYGON)
+
+            self.assertEqual(
+                leader_directory.get_webhook_url(DEFAULT_GAS_PAYER.lower()),
+                "http://job-launcher",
+            )
+            self.assertEqual(
+                leader_directory.get_public_key(DEFAULT_GAS_PAYER), "public key"
+            )
+            self.assertEqual(leader_directory.get_fee(DEFAULT_GAS_PAYER), 10)
+            self.assertEqual(
+                leader_directory.get_webhook_url(
+                    "0x1234567890123456789012345678901234567891"
+                ),
+                "http://recording-oracle",
+            )
+            self.assertEqual(len(leader_directory.get_leaders()), 2)
+            self.assertEqual(
+                [
+                    leader.address
+                    for leader in leader_directory.get_leaders(role="Job Launcher")
+                ],
+                [DEFAULT_GAS_PAYER],
+            )
+            self.assertEqual(leader_directory.get_leaders(role="Validator"), [])
+
+            mock_function.assert_called_once_with(
+                NETWORKS[ChainId.POLYGON]["subgraph_url"],
+                query=get_leaders_page_query,
+                params={"cursor": "", "first": 1000},
+            )
+
+    def test_all_leader_pages_are_loaded(self):
+        leaders = [
+            {"id": f"0x{i:040x}", "address": f"0x{i:040x}", "role": "Job Launcher"}
+            for i in range(1, 251)
+        ]
+
+        with patch(
+            "human_protocol_sdk.operator.operator_utils.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.side_effect = [
+                {"data": {"leaders": leaders[:100]}},
+                {"data": {"leaders": leaders[100:200]}},
+                {"data": {"leaders": leaders[200:]}},
+            ]
+            leader_directory = LeaderDirectory(ChainId.POLYGON, page_size=100)
+
+            self.assertEqual(len(leader_directory.get_leaders()), 250)
+            self.assertIsNotNone(leader_directory.get_leader(leaders[-1]["address"]))
+
+            self.assertEqual(mock_function.call_count, 3)
+            self.assertEqual(
+                [c.kwargs["params"]["cursor"] for c in mock_function.call_args_list],
+                ["", leaders[99]["id"], leaders[199]["id"]],
+            )
+
+    def test_unknown_leader_is_looked_up(self):
+        new_leader_address = "0x1234567890123456789012345678901234567892"
+        unknown_address = "0x0000000000000000000000000000000000000000"
+
+        with patch(
+            "human_protocol_sdk.operator.operator_utils.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.side_effect = [
+                self.leaders_data,
+                {
+                    "data": {
+                        "leader": {
+                            "id": new_leader_address,
+                            "address": new_leader_address,
+                            "role": "Job Launcher",
+                            "webhookUrl": "http://new-job-launcher",
+                        }
+                    }
+                },
+                {"data": {"leader": None}},
+            ]
+            leader_directory = LeaderDirectory(ChainId.POLYGON)
+
+            self.assertEqual(
+                leader_directory.get_webhook_url(new_leader_address),
+                "http://new-job-launcher",
+            )
+            self.assertEqual(len(leader_directory.get_leaders(role="Job Launcher")), 2)
+            self.assertIsNone(leader_directory.get_webhook_url(unknown_address))
+
+            # Found and missing addresses are not looked up again
+            self.assertIsNotNone(leader_directory.get_leader(new_leader_address))
+            self.assertIsNone(leader_directory.get_leader(unknown_address))
+            self.assertIsNone(leader_directory.get_leader("invalid"))
+
+            self.assertEqual(mock_function.call_count, 3)
+            mock_function.assert_called_with(
+                NETWORKS[ChainId.POLYGON]["subgraph_url"],
+                query=get_leader_query,
+                params={"address": unknown_address},
+            )
+
+    def test_refresh_after_ttl(self):
+        with patch(
+            "human_protocol_sdk.operator.operator_utils.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.return_value = self.leaders_data
+            leader_directory = LeaderDirectory(ChainId.POLYGON, ttl=0)
+
+            leader_directory.get_leader(DEFAULT_GAS_PAYER)
+            leader_directory.get_leader(DEFAULT_GAS_PAYER)
+            refresh_thread = leader_directory._refresh_thread
+            if refresh_thread:
+                refresh_thread.join()
+
+            self.assertEqual(mock_function.call_count, 2)
+
+    def test_failed_refresh_is_backed_off(self):
+        with patch(
+            "human_protocol_sdk.operator.operator_utils.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.side_effect = [self.leaders_data, Exception("Unavailable")]
+            leader_directory = LeaderDirectory(ChainId.POLYGON, ttl=0)
+
+            leader_directory.get_leader(DEFAULT_GAS_PAYER)
+            leader_directory.get_leader(DEFAULT_GAS_PAYER)
+            refresh_thread = leader_directory._refresh_thread
+            if refresh_thread:
+                refresh_thread.join()
+
+            # The stale data is served until the retry
+            for _ in range(5):
+                self.assertIsNotNone(leader_directory.get_leader(DEFAULT_GAS_PAYER))
+
+            self.assertEqual(mock_function.call_count, 2)
+            self.assertIsNone(leader_directory._refresh_thread)
+
+    def test_reputation_network_operators(self):
+        reputation_address = "0x1234567890123456789012345678901234567891"
+
+        with patch(
+            "human_protocol_sdk.operator.operator_utils.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.side_effect = [
+                self.leaders_data,
+                {
+                    "data": {
+                        "reputationNetwork": {
+                            "operators": [
+                                {"address": DEFAULT_GAS_PAYER, "role": "Job Launcher"}
+                            ]
+                        }
+                    }
+                },
+            ]
+            leader_directory = LeaderDirectory(
+                ChainId.POLYGON, reputation_oracle=reputation_address
+            )
+
+            operators = leader_directory.get_reputation_network_operators()
+            self.assertEqual(len(operators), 1)
+            self.assertEqual(operators[0].address, DEFAULT_GAS_PAYER)
+            self.assertEqual(
+                leader_directory.get_reputation_network_operators(role="Validator"),
+                [],
+            )
+
+    def test_invalid_reputation_oracle(self):
+        with self.assertRaises(OperatorUtilsError) as cm:
+            LeaderDirectory(ChainId.POLYGON, reputation_oracle="invalid")
+        self.assertEqual("Invalid reputation address: invalid", str(cm.exception))
+
+    def test_get_leader_directory_is_shared(self):
+        self.assertIs(
+            OperatorUtils.get_leader_directory(ChainId.POLYGON_MUMBAI),
+            OperatorUtils.get_leader_directory(ChainId.POLYGON_MUMBAI),
+        )
+
+
 if __name__ == "__main__":
     unittest.main(exit=True)
@@ -3,7 +3,7 @@ from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 from human_protocol_sdk.constants import NETWORKS, ChainId
-from human_protocol_sdk.gql.hmtoken import get_holders_query
+from human_protocol_sdk.gql.hmtoken import get_holders_page_query
 from human_protocol_sdk.gql.statistics import (
     get_event_day_data_query,
     get_escrow_statistics_query,
@@ -11,7 +11,9 @@ from human_protocol_sdk.gql.statistics import (
 )
 from human_protocol_sdk.statistics import (
     StatisticsClient,
+    StatisticsClientError,
     StatisticsParam,
+    TableFormat,
 )
 
 
@@ -202,6 +204,7 @@ class TestStatisticsClient(unittest.TestCase):
                     "data": {
                         "holders": [
                             {
+                                "id": "0x123",
                                 "address": "0x123",
                                 "balance": "10",
                             },
@@ -230,7 +233,8 @@ class TestStatisticsClient(unittest.TestCase):
 
             mock_function.assert_any_call(
                 "subgraph_url",
-                query=get_holders_query,
+                query=get_holders_page_query,
+                params={"cursor": "", "first": 100},
             )
 
             mock_function.assert_any_call(
@@ -259,6 +263,306 @@ class TestStatisticsClient(unittest.TestCase):
                 hmt_statistics.daily_hmt_data[0].total_transaction_count, 4
             )
 
+    def test_get_hmt_statistics_max_holders(self):
+        with patch(
+            "human_protocol_sdk.statistics.statistics_client.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.side_effect = [
+                {"data": {"hmtokenStatistics": {"holders": "3"}}},
+                {
+                    "data": {
+                        "holders": [
+                            {"id": "0x1", "address": "0x1", "balance": "10"},
+                            {"id": "0x2", "address": "0x2", "balance": "20"},
+                        ],
+                    }
+                },
+                {"data": {"eventDayDatas": []}},
+            ]
+
+            hmt_statistics = self.statistics.get_hmt_statistics(max_holders=2)
+
+            # The holders are not requested past the maximum
+            self.assertEqual(mock_function.call_count, 3)
+            mock_function.assert_any_call(
+                "subgraph_url",
+                query=get_holders_page_query,
+                params={"cursor": "", "first": 2},
+            )
+            self.assertEqual(
+                [holder.address for holder in hmt_statistics.holders], ["0x1", "0x2"]
+            )
+
+    def test_get_hmt_statistics_without_holders(self):
+        with patch(
+            "human_protocol_sdk.statistics.statistics_client.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.side_effect = [
+                {"data": {"hmtokenStatistics": {"holders": "3"}}},
+                {"data": {"eventDayDatas": []}},
+            ]
+
+            hmt_statistics = self.statistics.get_hmt_statistics(max_holders=0)
+
+            self.assertEqual(mock_function.call_count, 2)
+            self.assertEqual(hmt_statistics.total_holders, 3)
+            self.assertEqual(hmt_statistics.holders, [])
+
+    def test_event_day_data_is_shared_between_calls(self):
+        statistics = StatisticsClient(ChainId.LOCALHOST, event_day_data_ttl=60)
+        param = StatisticsParam(
+            date_from=datetime.fromtimestamp(1683811973),
+            date_to=datetime.fromtimestamp(1683812007),
+        )
+
+        with patch(
+            "human_protocol_sdk.statistics.statistics_client.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.return_value = {
+                "data": {
+                    "eventDayDatas": [
+                        {
+                            "timestamp": 1,
+                            "dailyWorkerCount": "4",
+                            "dailyPayoutCount": "4",
+                            "dailyPayoutAmount": "100",
+                        },
+                    ],
+                }
+            }
+
+            worker_statistics = statistics.get_worker_statistics(param)
+            payment_statistics = statistics.get_payment_statistics(param)
+
+            mock_function.assert_called_once_with(
+                "subgraph_url",
+                query=get_event_day_data_query(param),
+                params={
+                    "from": 1683811973,
+                    "to": 1683812007,
+                },
+            )
+            self.assertEqual(worker_statistics.daily_workers_data[0].active_workers, 4)
+            self.assertEqual(
+                payment_statistics.daily_payments_data[0].total_amount_paid, 100
+            )
+
+    def test_event_day_data_is_not_shared_without_ttl(self):
+        statistics = StatisticsClient(ChainId.LOCALHOST, event_day_data_ttl=0)
+
+        with patch(
+            "human_protocol_sdk.statistics.statistics_client.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.return_value = {"data": {"eventDayDatas": []}}
+
+            statistics.get_worker_statistics()
+            statistics.get_worker_statistics()
+
+            self.assertEqual(mock_function.call_count, 2)
+
+    def test_event_day_data_cache_is_bounded(self):
+        statistics = StatisticsClient(ChainId.LOCALHOST, event_day_data_ttl=60)
+
+        with (
+            patch(
+                "human_protocol_sdk.statistics.statistics_client.get_data_from_subgraph"
+            ) as mock_function,
+            patch(
+                "human_protocol_sdk.statistics.statistics_client.EVENT_DAY_DATA_CACHE_SIZE",
+                2,
+            ),
+        ):
+            mock_function.return_value = {"data": {"eventDayDatas": []}}
+
+            for date_from in [1, 2, 3, 1]:
+                statistics.get_worker_statistics(
+                    StatisticsParam(date_from=datetime.fromtimestamp(date_from))
+                )
+
+            # The first range was evicted by the third one
+            self.assertEqual(mock_function.call_count, 4)
+            self.assertEqual(len(statistics._event_day_datas_cache), 2)
+
+    def test_expired_event_day_data_is_evicted(self):
+        statistics = StatisticsClient(ChainId.LOCALHOST, event_day_data_ttl=60)
+
+        with (
+            patch(
+                "human_protocol_sdk.statistics.statistics_client.get_data_from_subgraph"
+            ) as mock_function,
+            patch(
+                "human_protocol_sdk.statistics.statistics_client.time.monotonic"
+            ) as mock_monotonic,
+        ):
+            mock_function.return_value = {"data": {"eventDayDatas": []}}
+
+            mock_monotonic.return_value = 0
+            statistics.get_worker_statistics(
+                StatisticsParam(date_from=datetime.fromtimestamp(1))
+            )
+            mock_monotonic.return_value = 100
+            statistics.get_worker_statistics(
+                StatisticsParam(date_from=datetime.fromtimestamp(2))
+            )
+
+            self.assertEqual(len(statistics._event_day_datas_cache), 1)
+
+    def test_get_daily_statistics_table(self):
+        param = StatisticsParam(
+            date_from=datetime.fromtimestamp(1683811973),
+            date_to=datetime.fromtimestamp(1683812007),
+        )
+
+        with patch(
+            "human_protocol_sdk.statistics.statistics_client.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.return_value = {
+                "data": {
+                    "eventDayDatas": [
+                        {
+                            "timestamp": "1683849600",
+                            "dailyEscrowCount": "3",
+                            "dailyPendingStatusEventCount": "1",
+                            "dailyCompletedStatusEventCount": "1",
+                            "dailyPaidStatusEventCount": "1",
+                            "dailyCancelledStatusEventCount": "0",
+                            "dailyWorkerCount": "4",
+                            "dailyPayoutCount": "4",
+                            "dailyPayoutAmount": "100000000000000000000",
+                            "dailyHMTTransferCount": "2",
+                            "dailyHMTTransferAmount": "50",
+                        },
+                        {
+                            "timestamp": "1683763200",
+                            "dailyWorkerCount": "0",
+                        },
+                    ],
+                }
+            }
+
+            table = self.statistics.get_daily_statistics_table(param)
+
+            mock_function.assert_called_once_with(
+                "subgraph_url",
+                query=get_event_day_data_query(param),
+                params={
+                    "from": 1683811973,
+                    "to": 1683812007,
+                },
+            )
+
+            self.assertEqual(len(table), 2)
+            self.assertEqual(
+                table["timestamp"][0].astype(datetime),
+                datetime.utcfromtimestamp(1683849600),
+            )
+            self.assertEqual(list(table["escrows_total"]), [3, 0])
+            self.assertEqual(list(table["escrows_solved"]), [1, 0])
+            self.assertEqual(list(table["active_workers"]), [4, 0])
+            self.assertEqual(table["total_amount_paid"][0], 1e20)
+            self.assertEqual(list(table["average_amount_per_worker"]), [2.5e19, 0])
+            self.assertEqual(list(table["hmt_transfer_count"]), [2, 0])
+            self.assertEqual(list(table["hmt_transfer_amount"]), [50, 0])
+
+    def test_get_daily_statistics_table_invalid_format(self):
+        with patch(
+            "human_protocol_sdk.statistics.statistics_client.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.return_value = {"data": {"eventDayDatas": []}}
+
+            with self.assertRaises(ValueError):
+                self.statistics.get_daily_statistics_table(table_format="csv")
+
+            table = self.statistics.get_daily_statistics_table(
+                table_format=TableFormat.NUMPY
+            )
+            self.assertEqual(len(table), 0)
+
+    def test_iter_hmt_holders(self):
+        with patch(
+            "human_protocol_sdk.statistics.statistics_client.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.side_effect = [
+                {
+                    "data": {
+                        "holders": [
+                            {"id": "0x1", "address": "0x1", "balance": "10"},
+                            {"id": "0x2", "address": "0x2", "balance": "20"},
+                        ],
+                    }
+                },
+                {
+                    "data": {
+                        "holders": [
+                            {"id": "0x3", "address": "0x3", "balance": "30"},
+                        ],
+                    }
+                },
+            ]
+
+            holders = list(self.statistics.iter_hmt_holders(page_size=2))
+
+            self.assertEqual(mock_function.call_count, 2)
+            mock_function.assert_any_call(
+                "subgraph_url",
+                query=get_holders_page_query,
+                params={"cursor": "", "first": 2},
+            )
+            mock_function.assert_any_call(
+                "subgraph_url",
+                query=get_holders_page_query,
+                params={"cursor": "0x2", "first": 2},
+            )
+            self.assertEqual(
+                [holder.address for holder in holders], ["0x1", "0x2", "0x3"]
+            )
+            self.assertEqual([holder.balance for holder in holders], [10, 20, 30])
+
+    def test_get_hmt_holders_distribution(self):
+        with patch(
+            "human_protocol_sdk.statistics.statistics_client.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.side_effect = [
+                {
+                    "data": {
+                        "holders": [
+                            {"id": "0x1", "address": "0x1", "balance": "0"},
+                            {"id": "0x2", "address": "0x2", "balance": "5"},
+                        ],
+                    }
+                },
+                {
+                    "data": {
+                        "holders": [
+                            {"id": "0x3", "address": "0x3", "balance": "50"},
+                            {"id": "0x4", "address": "0x4", "balance": "500"},
+                        ],
+                    }
+                },
+                {"data": {"holders": []}},
+            ]
+
+            distribution = self.statistics.get_hmt_holders_distribution(
+                bins=[0, 10, 100], top_n=2, page_size=2
+            )
+
+            self.assertEqual(distribution.total_holders, 4)
+            self.assertEqual(distribution.total_balance, 555)
+            self.assertEqual(distribution.bins, [0, 10, 100])
+            self.assertEqual(distribution.histogram, [2, 1, 1])
+            self.assertEqual(
+                [holder.address for holder in distribution.top_holders],
+                ["0x4", "0x3"],
+            )
+            self.assertEqual(
+                [holder.balance for holder in distribution.top_holders], [500, 50]
+            )
+
+    def test_get_hmt_holders_distribution_invalid_bins(self):
+        with self.assertRaises(StatisticsClientError) as cm:
+            self.statistics.get_hmt_holders_distribution(bins=[10, 0])
+        self.assertEqual("Bins must be sorted in ascending order", str(cm.exception))
+
 
 if __name__ == "__main__":
     unittest.main(exit=True)
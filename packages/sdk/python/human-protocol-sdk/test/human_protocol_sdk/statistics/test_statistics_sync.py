@@ -0,0 +1,141 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from human_protocol_sdk.constants import ChainId
+from human_protocol_sdk.gql.statistics import get_event_day_data_since_query
+from human_protocol_sdk.statistics import StatisticsParam, StatisticsSync
+from human_protocol_sdk.statistics.statistics_sync import SUBGRAPH_PAGE_SIZE
+
+DAY = 24 * 60 * 60
+
+
+def event_day_data(timestamp: int, workers: int = 1):
+    return {
+        "timestamp": str(timestamp),
+        "dailyWorkerCount": str(workers),
+        "dailyPayoutCount": "1",
+        "dailyPayoutAmount": "10",
+    }
+
+
+class TestStatisticsSync(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "statistics.db")
+        self.statistics = StatisticsSync(
+            ChainId.LOCALHOST, self.db_path, event_day_data_ttl=0
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_initial_sync_is_paginated(self):
+        first_page = [event_day_data(i * DAY) for i in range(1, SUBGRAPH_PAGE_SIZE + 1)]
+        second_page = [event_day_data((SUBGRAPH_PAGE_SIZE + 1) * DAY)]
+
+        with patch(
+            "human_protocol_sdk.statistics.statistics_sync.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.side_effect = [
+                {"data": {"eventDayDatas": first_page}},
+                {"data": {"eventDayDatas": second_page}},
+            ]
+
+            self.assertEqual(self.statistics.sync(), SUBGRAPH_PAGE_SIZE + 1)
+
+            mock_function.assert_any_call(
+                "subgraph_url",
+                query=get_event_day_data_since_query,
+                params={"from": -1, "first": SUBGRAPH_PAGE_SIZE},
+            )
+            mock_function.assert_any_call(
+                "subgraph_url",
+                query=get_event_day_data_since_query,
+                params={"from": SUBGRAPH_PAGE_SIZE * DAY, "first": SUBGRAPH_PAGE_SIZE},
+            )
+            self.assertEqual(
+                self.statistics.get_last_timestamp(), (SUBGRAPH_PAGE_SIZE + 1) * DAY
+            )
+
+    def test_incremental_sync_uses_resync_window(self):
+        with patch(
+            "human_protocol_sdk.statistics.statistics_sync.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.side_effect = [
+                {"data": {"eventDayDatas": [event_day_data(10 * DAY)]}},
+                {"data": {"eventDayDatas": [event_day_data(10 * DAY, workers=5)]}},
+            ]
+
+            self.statistics.sync()
+            self.assertEqual(self.statistics.sync(), 1)
+
+            mock_function.assert_called_with(
+                "subgraph_url",
+                query=get_event_day_data_since_query,
+                params={
+                    "from": 10 * DAY - self.statistics.resync_window - 1,
+                    "first": SUBGRAPH_PAGE_SIZE,
+                },
+            )
+
+        statistics = StatisticsSync(ChainId.LOCALHOST, self.db_path, auto_sync=False)
+        worker_statistics = statistics.get_worker_statistics()
+        self.assertEqual(len(worker_statistics.daily_workers_data), 1)
+        self.assertEqual(worker_statistics.daily_workers_data[0].active_workers, 5)
+
+    def test_statistics_are_served_from_store(self):
+        with patch(
+            "human_protocol_sdk.statistics.statistics_sync.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.return_value = {
+                "data": {
+                    "eventDayDatas": [
+                        event_day_data(DAY, workers=1),
+                        event_day_data(2 * DAY, workers=2),
+                        event_day_data(3 * DAY, workers=4),
+                    ]
+                }
+            }
+
+            payment_statistics = self.statistics.get_payment_statistics(
+                StatisticsParam(
+                    date_from=datetime.fromtimestamp(2 * DAY),
+                    date_to=datetime.fromtimestamp(3 * DAY),
+                )
+            )
+
+            mock_function.assert_called_once()
+
+        self.assertEqual(len(payment_statistics.daily_payments_data), 2)
+        self.assertEqual(
+            payment_statistics.daily_payments_data[0].timestamp,
+            datetime.fromtimestamp(3 * DAY),
+        )
+        self.assertEqual(
+            payment_statistics.daily_payments_data[0].average_amount_per_worker, 2.5
+        )
+        self.assertEqual(
+            payment_statistics.daily_payments_data[1].average_amount_per_worker, 5
+        )
+
+    def test_store_is_separated_by_chain(self):
+        with patch(
+            "human_protocol_sdk.statistics.statistics_sync.get_data_from_subgraph"
+        ) as mock_function:
+            mock_function.return_value = {
+                "data": {"eventDayDatas": [event_day_data(DAY)]}
+            }
+            self.statistics.sync()
+
+        statistics = StatisticsSync(
+            ChainId.POLYGON_MUMBAI, self.db_path, auto_sync=False
+        )
+        self.assertIsNone(statistics.get_last_timestamp())
+        self.assertEqual(statistics.get_worker_statistics().daily_workers_data, [])
+
+
+if __name__ == "__main__":
+    unittest.main(exit=True)
@@ -1,7 +1,11 @@
 import hashlib
+import io
 import json
+import os
 import random
+import tempfile
 import unittest
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 import types
 from minio import S3Error
@@ -11,6 +15,7 @@ from human_protocol_sdk.storage import (
     StorageClient,
     StorageClientError,
     StorageFileNotFoundError,
+    StorageObject,
 )
 
 
@@ -122,6 +127,95 @@ class TestStorageClient(unittest.TestCase):
         with self.assertRaises(StorageClientError):
             self.client.download_files(files=self.files, bucket=self.bucket)
 
+    def test_download_files_releases_connections(self):
+        responses = [
+            MagicMock(read=MagicMock(return_value=b"file1 contents")),
+            MagicMock(read=MagicMock(return_value=b"file2 contents")),
+        ]
+        self.client.client.get_object = MagicMock(side_effect=responses)
+        self.client.download_files(files=self.files, bucket=self.bucket)
+        for response in responses:
+            response.close.assert_called_once()
+            response.release_conn.assert_called_once()
+
+    def test_download_files_concurrently(self):
+        files = [f"file{i}.txt" for i in range(20)]
+        self.client.client.get_object = MagicMock(
+            side_effect=lambda bucket_name, object_name: MagicMock(
+                read=MagicMock(return_value=object_name.encode())
+            )
+        )
+        result = self.client.download_files(
+            files=files, bucket=self.bucket, max_workers=4
+        )
+        self.assertEqual(result, [file.encode() for file in files])
+
+    def test_download_files_concurrently_error(self):
+        self.client.client.get_object = MagicMock(
+            side_effect=S3Error(
+                code="NoSuchKey",
+                message="Key not found",
+                resource="",
+                request_id="",
+                host_id="",
+                response="",
+            )
+        )
+        with self.assertRaises(StorageFileNotFoundError):
+            self.client.download_files(
+                files=self.files, bucket=self.bucket, max_workers=2
+            )
+
+    def test_iter_files(self):
+        responses = [
+            MagicMock(stream=MagicMock(return_value=iter([b"file1 ", b"contents"]))),
+            MagicMock(stream=MagicMock(return_value=iter([b"file2 contents"]))),
+        ]
+        self.client.client.get_object = MagicMock(side_effect=responses)
+
+        result = {
+            key: b"".join(chunks)
+            for key, chunks in self.client.iter_files(
+                files=self.files, bucket=self.bucket, chunk_size=6
+            )
+        }
+
+        self.assertEqual(
+            result, {"file1.txt": b"file1 contents", "file2.txt": b"file2 contents"}
+        )
+        responses[0].stream.assert_called_once_with(6)
+        for response in responses:
+            response.release_conn.assert_called_once()
+
+    def test_download_files_to(self):
+        self.client.client.get_object = MagicMock(
+            side_effect=lambda bucket_name, object_name: MagicMock(
+                stream=MagicMock(return_value=iter([object_name.encode(), b"!"]))
+            )
+        )
+        file_object = io.BytesIO()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "file1.txt")
+            self.client.download_files_to(
+                files={"file1.txt": path, "file2.txt": file_object},
+                bucket=self.bucket,
+                max_workers=2,
+            )
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"file1.txt!")
+
+        self.assertEqual(file_object.getvalue(), b"file2.txt!")
+
+    def test_download_files_to_error(self):
+        self.client.client.get_object = MagicMock(
+            side_effect=Exception("Connection error")
+        )
+        with self.assertRaises(StorageClientError):
+            self.client.download_files_to(
+                files={"file1.txt": io.BytesIO()}, bucket=self.bucket
+            )
+
     def test_upload_files(self):
         file3 = "file3 content"
         hash = hashlib.sha1(json.dumps("file3 content").encode("utf-8")).hexdigest()
@@ -221,6 +315,128 @@ class TestStorageClient(unittest.TestCase):
         with self.assertRaises(StorageClientError):
             self.client.upload_files(files=[file3], bucket=self.bucket)
 
+    def test_upload_files_concurrently(self):
+        files = [f"file{i} content" for i in range(5)]
+        hashes = [
+            hashlib.sha1(json.dumps(file).encode("utf-8")).hexdigest() for file in files
+        ]
+        keys = [f"s3{hash}.json" for hash in hashes]
+
+        self.client.client.list_objects = MagicMock(
+            return_value=[
+                types.SimpleNamespace(object_name=key)
+                for key in sorted(keys[:2] + ["s3other.json"])
+            ]
+        )
+        self.client.client.stat_object = MagicMock()
+        self.client.client.put_object = MagicMock()
+
+        result = self.client.upload_files(
+            files=files + [files[4]], bucket=self.bucket, max_workers=3
+        )
+
+        self.assertEqual([file["key"] for file in result], keys + [keys[4]])
+        self.assertEqual([file["hash"] for file in result], hashes + [hashes[4]])
+        self.assertEqual(
+            result[0]["url"], f"https://s3.us-west-2.amazonaws.com/my-bucket/{keys[0]}"
+        )
+        self.client.client.list_objects.assert_called_once_with(
+            bucket_name=self.bucket,
+            prefix="s3",
+            start_after=min(keys)[:-1],
+            recursive=True,
+        )
+        self.client.client.stat_object.assert_not_called()
+        self.assertEqual(
+            sorted(
+                call.kwargs["object_name"]
+                for call in self.client.client.put_object.call_args_list
+            ),
+            sorted(keys[2:]),
+        )
+
+    def test_upload_files_concurrently_stat_fallback(self):
+        files = [f"file{i} content" for i in range(3)]
+        keys = [
+            f"s3{hashlib.sha1(json.dumps(file).encode('utf-8')).hexdigest()}.json"
+            for file in files
+        ]
+        existing_key = sorted(keys)[0]
+
+        self.client.client.list_objects = MagicMock(
+            return_value=iter(
+                types.SimpleNamespace(object_name=f"s3{i:03}") for i in range(100)
+            )
+        )
+
+        def stat_object(bucket_name, object_name):
+            if object_name == existing_key:
+                return {"_object_name": object_name}
+            raise S3Error(
+                code="NoSuchKey",
+                message="Object does not exist",
+                resource="",
+                request_id="",
+                host_id="",
+                response="",
+            )
+
+        self.client.client.stat_object = MagicMock(side_effect=stat_object)
+        self.client.client.put_object = MagicMock()
+
+        with patch(
+            "human_protocol_sdk.storage.storage_client.EXISTENCE_CHECK_LISTING_LIMIT",
+            10,
+        ):
+            self.client.upload_files(files=files, bucket=self.bucket, max_workers=2)
+
+        self.assertEqual(self.client.client.stat_object.call_count, 3)
+        self.assertEqual(
+            sorted(
+                call.kwargs["object_name"]
+                for call in self.client.client.put_object.call_args_list
+            ),
+            sorted(set(keys) - {existing_key}),
+        )
+
+    def test_upload_files_concurrently_error(self):
+        self.client.client.list_objects = MagicMock(return_value=[])
+        self.client.client.put_object = MagicMock(
+            side_effect=Exception("Connection error")
+        )
+        with self.assertRaises(StorageClientError):
+            self.client.upload_files(
+                files=["file1 content", "file2 content"],
+                bucket=self.bucket,
+                max_workers=2,
+            )
+
+    def test_upload_stream(self):
+        stream = io.BytesIO(b"large artifact")
+        file = {"file": stream, "hash": "hash", "key": "artifact.zip"}
+
+        self.client.client.stat_object = MagicMock(
+            side_effect=S3Error(
+                code="NoSuchKey",
+                message="Object does not exist",
+                resource="",
+                request_id="",
+                host_id="",
+                response="",
+            )
+        )
+        self.client.client.put_object = MagicMock()
+        result = self.client.upload_files(files=[file], bucket=self.bucket)
+
+        self.client.client.put_object.assert_called_once_with(
+            bucket_name=self.bucket,
+            object_name="artifact.zip",
+            data=stream,
+            length=-1,
+            part_size=64 * 1024 * 1024,
+        )
+        self.assertEqual(result[0]["key"], "artifact.zip")
+
     def test_bucket_exists(self):
         self.client.client.bucket_exists = MagicMock(side_effect=[True])
         result = self.client.bucket_exists(bucket=self.bucket)
@@ -279,6 +495,47 @@ class TestStorageClient(unittest.TestCase):
         with self.assertRaises(StorageClientError):
             self.client.list_objects(bucket=self.bucket)
 
+    def test_iter_objects(self):
+        last_modified = datetime(2023, 1, 1)
+        self.client.client.list_objects = MagicMock(
+            return_value=iter(
+                [
+                    types.SimpleNamespace(
+                        object_name=f"results/file{i}",
+                        size=i,
+                        etag=f"etag{i}",
+                        last_modified=last_modified,
+                    )
+                    for i in range(3)
+                ]
+            )
+        )
+
+        objects = self.client.iter_objects(
+            bucket=self.bucket, prefix="results/", start_after="results/file"
+        )
+        self.client.client.list_objects.assert_not_called()
+
+        first = next(objects)
+        self.assertIsInstance(first, StorageObject)
+        self.assertEqual(first.key, "results/file0")
+        self.assertEqual([obj.size for obj in objects], [1, 2])
+        self.client.client.list_objects.assert_called_once_with(
+            bucket_name=self.bucket,
+            prefix="results/",
+            start_after="results/file",
+            recursive=True,
+        )
+        self.assertEqual(first.etag, "etag0")
+        self.assertEqual(first.last_modified, last_modified)
+
+    def test_iter_objects_error(self):
+        self.client.client.list_objects = MagicMock(
+            side_effect=Exception("Connection error")
+        )
+        with self.assertRaises(StorageClientError):
+            list(self.client.iter_objects(bucket=self.bucket))
+
     def test_list_objects_length(self):
         expected_length = random.randint(1, 10)
         mock_client = MagicMock()
@@ -1,21 +1,40 @@
+import hashlib
+import tempfile
 import unittest
 from unittest.mock import patch
 
 from human_protocol_sdk.storage import StorageUtils, StorageClientError
+from human_protocol_sdk.storage import storage_utils
 import requests
 
 
 class TestStorageUtils(unittest.TestCase):
+    def setUp(self):
+        storage_utils._download_cache.clear()
+
+    def _mock_response(self, mock_get, content, headers=None, status_code=200):
+        mock_response = mock_get.return_value
+        mock_response.status_code = status_code
+        mock_response.raise_for_status.return_value = None
+        mock_response.headers = headers or {}
+        mock_response.iter_content.return_value = [content]
+        return mock_response
+
     def test_download_file_from_url(self):
-        with patch("requests.get") as mock_get:
-            mock_response = mock_get.return_value
-            mock_response.raise_for_status.return_value = None
-            mock_response.content = b"Test file content"
+        with patch("requests.Session.get") as mock_get:
+            mock_response = self._mock_response(mock_get, b"Test file content")
             url = "https://www.example.com/file.txt"
 
             result = StorageUtils.download_file_from_url(url)
 
             self.assertEqual(result, b"Test file content")
+            mock_get.assert_called_once_with(
+                url,
+                headers=None,
+                timeout=storage_utils.DOWNLOAD_TIMEOUT,
+                stream=True,
+            )
+            mock_response.close.assert_called_once()
 
     def test_download_file_from_url_invalid_url(self):
         url = "invalid_url"
@@ -25,9 +44,9 @@ class TestStorageUtils(unittest.TestCase):
         self.assertEqual(f"Invalid URL: {url}", str(cm.exception))
 
     def test_download_file_from_url_error(self):
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             url = "https://www.example.com/file.txt"
-            mock_response = mock_get.return_value
+            mock_response = self._mock_response(mock_get, b"")
             mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
                 f"Not Found for url: {url}", response=mock_response
             )
@@ -35,3 +54,84 @@ class TestStorageUtils(unittest.TestCase):
             with self.assertRaises(StorageClientError) as cm:
                 StorageUtils.download_file_from_url(url)
             self.assertEqual(f"Not Found for url: {url}", str(cm.exception))
+
+    def test_download_file_from_url_too_large(self):
+        url = "https://www.example.com/file.txt"
+        with patch("requests.Session.get") as mock_get:
+            self._mock_response(mock_get, b"x" * 11)
+
+            with self.assertRaises(StorageClientError):
+                StorageUtils.download_file_from_url(url, max_size=10)
+
+            self._mock_response(mock_get, b"", headers={"Content-Length": "11"})
+
+            with self.assertRaises(StorageClientError):
+                StorageUtils.download_file_from_url(url, max_size=10)
+
+    def test_download_file_from_url_revalidates_etag(self):
+        url = "https://www.example.com/file.txt"
+        with patch("requests.Session.get") as mock_get:
+            self._mock_response(mock_get, b"Test file content", {"ETag": '"etag"'})
+            StorageUtils.download_file_from_url(url)
+
+            self._mock_response(mock_get, b"", status_code=304)
+            result = StorageUtils.download_file_from_url(url)
+
+            self.assertEqual(result, b"Test file content")
+            self.assertEqual(
+                mock_get.call_args.kwargs["headers"], {"If-None-Match": '"etag"'}
+            )
+
+    def test_download_file_from_url_with_hash(self):
+        url = "https://www.example.com/file.txt"
+        content = b"Test file content"
+        hash = hashlib.sha1(content).hexdigest()
+
+        with tempfile.TemporaryDirectory() as cache_dir, patch(
+            "requests.Session.get"
+        ) as mock_get:
+            self._mock_response(mock_get, content)
+
+            for _ in range(2):
+                result = StorageUtils.download_file_from_url(
+                    url, hash=hash, cache_dir=cache_dir
+                )
+                self.assertEqual(result, content)
+            mock_get.assert_called_once()
+
+            storage_utils._download_cache.clear()
+            result = StorageUtils.download_file_from_url(
+                url, hash=hash, cache_dir=cache_dir
+            )
+            self.assertEqual(result, content)
+            mock_get.assert_called_once()
+
+    def test_download_file_from_url_invalid_hash(self):
+        url = "https://www.example.com/file.txt"
+        with patch("requests.Session.get") as mock_get:
+            self._mock_response(mock_get, b"Test file content")
+
+            with self.assertRaises(StorageClientError):
+                StorageUtils.download_file_from_url(url, hash="0" * 40)
+            self.assertEqual(len(storage_utils._download_cache), 0)
+
+    def test_download_cache_is_bounded_by_size(self):
+        cache = storage_utils._DownloadCache(max_bytes=10, max_entry_bytes=6)
+
+        cache.put("a", None, b"1234")
+        cache.put("b", None, b"1234")
+        cache.get("a")
+        cache.put("c", None, b"1234")
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+        # Too large to be cached in memory
+        cache.put("d", None, b"1234567")
+        self.assertIsNone(cache.get("d"))
+        self.assertEqual(len(cache), 2)
+
+        cache.put("a", '"etag"', b"12")
+        self.assertEqual(cache.get("a"), ('"etag"', b"12"))
+        self.assertEqual(cache._size, 6)
@@ -0,0 +1,148 @@
+import unittest
+from test.human_protocol_sdk.utils import DEFAULT_GAS_PAYER_PRIV
+from unittest.mock import patch
+
+from human_protocol_sdk.client_factory import ClientFactory, ClientFactoryError
+from human_protocol_sdk.constants import NETWORKS, ChainId
+from human_protocol_sdk.escrow import EscrowClient
+from human_protocol_sdk.kvstore import KVStoreClient
+from human_protocol_sdk.signer import get_signer
+from human_protocol_sdk.staking import StakingClient
+from web3 import Web3
+from web3.eth import Eth
+from web3.providers.rpc import HTTPProvider
+
+
+class TestClientFactory(unittest.TestCase):
+    def setUp(self):
+        self.factory = ClientFactory(
+            {
+                ChainId.LOCALHOST: "http://localhost:8545",
+                ChainId.POLYGON_MUMBAI: "http://localhost:8546",
+            },
+            private_key=DEFAULT_GAS_PAYER_PRIV,
+        )
+
+        self.requests = []
+
+        def make_request(provider, method, params):
+            self.requests.append((provider.endpoint_uri, method))
+            chain_id = (
+                ChainId.LOCALHOST
+                if provider.endpoint_uri.endswith("8545")
+                else ChainId.POLYGON_MUMBAI
+            )
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(chain_id.value)}
+
+        # Other tests replace the property on the class
+        self.patches = [
+            patch.object(HTTPProvider, "make_request", make_request),
+            patch.object(Eth, "chain_id", property(lambda eth: eth._chain_id())),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+
+    def test_get_web3(self):
+        w3 = self.factory.get_web3(ChainId.LOCALHOST)
+
+        self.assertIsInstance(w3, Web3)
+        self.assertIs(w3, self.factory.get_web3(ChainId.LOCALHOST.value))
+        self.assertIsNot(w3, self.factory.get_web3(ChainId.POLYGON_MUMBAI))
+        self.assertEqual(w3.provider.endpoint_uri, "http://localhost:8545")
+        self.assertIsNotNone(w3.middleware_onion.get("geth_poa"))
+        self.assertIsNotNone(
+            w3.middleware_onion.get("construct_sign_and_send_raw_middleware")
+        )
+        self.assertEqual(
+            w3.eth.default_account,
+            w3.eth.account.from_key(DEFAULT_GAS_PAYER_PRIV).address,
+        )
+
+    def test_get_web3_without_private_key(self):
+        factory = ClientFactory({ChainId.LOCALHOST: "http://localhost:8545"})
+
+        w3 = factory.get_web3(ChainId.LOCALHOST)
+
+        self.assertIsNone(
+            w3.middleware_onion.get("construct_sign_and_send_raw_middleware")
+        )
+
+    def test_get_web3_with_local_signer(self):
+        factory = ClientFactory(
+            {ChainId.LOCALHOST: "http://localhost:8545"},
+            private_key=DEFAULT_GAS_PAYER_PRIV,
+            local_signer=True,
+        )
+
+        w3 = factory.get_web3(ChainId.LOCALHOST)
+
+        self.assertIsNone(
+            w3.middleware_onion.get("construct_sign_and_send_raw_middleware")
+        )
+        self.assertIsNotNone(get_signer(w3))
+        self.assertEqual(w3.eth.default_account, get_signer(w3).address)
+
+    def test_get_web3_unknown_network(self):
+        with self.assertRaises(ClientFactoryError) as cm:
+            self.factory.get_web3(ChainId.POLYGON)
+        self.assertEqual("Network is not configured: POLYGON", str(cm.exception))
+
+    def test_get_web3_invalid_chain_id(self):
+        with self.assertRaises(ClientFactoryError) as cm:
+            self.factory.get_web3(9999)
+        self.assertEqual("Invalid ChainId: 9999", str(cm.exception))
+
+    def test_chain_id_is_cached(self):
+        w3 = self.factory.get_web3(ChainId.LOCALHOST)
+
+        self.assertEqual(w3.eth.chain_id, ChainId.LOCALHOST.value)
+        self.assertEqual(w3.eth.chain_id, ChainId.LOCALHOST.value)
+
+        self.assertEqual(self.requests, [("http://localhost:8545", "eth_chainId")])
+
+    def test_get_clients(self):
+        escrow_client = self.factory.get_escrow_client(ChainId.LOCALHOST)
+        staking_client = self.factory.get_staking_client(ChainId.LOCALHOST)
+        kvstore_client = self.factory.get_kvstore_client(ChainId.LOCALHOST)
+
+        self.assertIsInstance(escrow_client, EscrowClient)
+        self.assertIsInstance(staking_client, StakingClient)
+        self.assertIsInstance(kvstore_client, KVStoreClient)
+        self.assertIs(escrow_client.w3, self.factory.get_web3(ChainId.LOCALHOST))
+        self.assertIs(staking_client.w3, escrow_client.w3)
+        self.assertIs(kvstore_client.w3, escrow_client.w3)
+        self.assertEqual(escrow_client.network, NETWORKS[ChainId.LOCALHOST])
+
+        self.assertIs(escrow_client, self.factory.get_escrow_client(ChainId.LOCALHOST))
+        self.assertEqual(len(self.requests), 1)
+
+    def test_get_clients_per_network(self):
+        localhost_client = self.factory.get_escrow_client(ChainId.LOCALHOST)
+        mumbai_client = self.factory.get_escrow_client(ChainId.POLYGON_MUMBAI)
+
+        self.assertEqual(localhost_client.network, NETWORKS[ChainId.LOCALHOST])
+        self.assertEqual(mumbai_client.network, NETWORKS[ChainId.POLYGON_MUMBAI])
+
+    def test_add_network_discards_clients(self):
+        escrow_client = self.factory.get_escrow_client(ChainId.LOCALHOST)
+        self.factory.add_network(ChainId.LOCALHOST, "http://127.0.0.1:8545")
+
+        new_client = self.factory.get_escrow_client(ChainId.LOCALHOST)
+
+        self.assertIsNot(escrow_client, new_client)
+        self.assertEqual(new_client.w3.provider.endpoint_uri, "http://127.0.0.1:8545")
+        self.assertEqual(
+            self.factory.chain_ids, [ChainId.LOCALHOST, ChainId.POLYGON_MUMBAI]
+        )
+
+    def test_get_client_invalid_network(self):
+        with self.assertRaises(ClientFactoryError):
+            self.factory.get_escrow_client(ChainId.POLYGON)
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
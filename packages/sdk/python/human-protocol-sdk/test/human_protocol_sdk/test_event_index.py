@@ -0,0 +1,113 @@
+import copy
+import unittest
+
+from web3.datastructures import AttributeDict
+
+from human_protocol_sdk.event_index import INTERFACE_CACHE_SIZE, EventIndex
+from human_protocol_sdk.utils import get_erc20_interface, get_factory_interface
+
+TOKEN_ADDRESS = "0x0376D26246Eb35FF4F9924cF13E6C05fd0bD7Fb4"
+ESCROW_ADDRESS = "0xa76507AbFE3B67cB25F16DbC75a883D4190B7e46"
+RECIPIENT_ADDRESS = "0x5607Acf0828E238099AA1784541A5ABD7F975C76"
+TRANSFER_TOPIC = bytes.fromhex(
+    "ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+)
+
+
+def get_log(address=TOKEN_ADDRESS, topics=None, log_index=0):
+    if topics is None:
+        topics = [
+            TRANSFER_TOPIC,
+            bytes.fromhex(
+                "000000000000000000000000a76507abfe3b67cb25f16dbc75a883d4190b7e46"
+            ),
+            bytes.fromhex(
+                "0000000000000000000000005607acf0828e238099aa1784541a5abd7f975c76"
+            ),
+        ]
+
+    # Receipts returned by web3 are attribute dictionaries
+    return AttributeDict(
+        {
+            "logIndex": log_index,
+            "transactionIndex": 0,
+            "transactionHash": bytes.fromhex(
+                "01682095d5abb0270d11a31139b9a1f410b363c84add467004e728ec831bd529"
+            ),
+            "blockHash": bytes.fromhex(
+                "92abf9325a3959a911a2581e9ea36cba3060d8b293b50e5738ff959feb95258a"
+            ),
+            "blockNumber": 5,
+            "address": address,
+            "data": bytes.fromhex(
+                "000000000000000000000000000000000000000000000000029b003c075b5e42"
+            ),
+            "topics": topics,
+        }
+    )
+
+
+class TestEventIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = EventIndex(get_erc20_interface()["abi"])
+
+    def test_event_names(self):
+        self.assertEqual(sorted(self.index.event_names), ["Approval", "Transfer"])
+
+    def test_decode_log(self):
+        event = self.index.decode_log(get_log())
+
+        self.assertEqual(event.event, "Transfer")
+        self.assertEqual(event.address, TOKEN_ADDRESS)
+        self.assertEqual(event.args["from"], ESCROW_ADDRESS)
+        self.assertEqual(event.args.to, RECIPIENT_ADDRESS)
+        self.assertEqual(event.args.value, 187744067287473730)
+
+    def test_decode_log_unknown_event(self):
+        self.assertIsNone(self.index.decode_log(get_log(topics=[bytes(32)])))
+        self.assertIsNone(self.index.decode_log(get_log(topics=[])))
+
+    def test_decode_logs(self):
+        logs = [
+            get_log(log_index=0),
+            get_log(topics=[bytes(32)], log_index=1),
+            get_log(address=ESCROW_ADDRESS, log_index=2),
+        ]
+
+        events = list(self.index.decode_logs(logs))
+        self.assertEqual([event.logIndex for event in events], [0, 2])
+
+        events = list(self.index.decode_logs(logs, address=ESCROW_ADDRESS))
+        self.assertEqual([event.logIndex for event in events], [2])
+
+        events = list(self.index.decode_logs(logs, event_name="Approval"))
+        self.assertEqual(events, [])
+
+    def test_from_interface(self):
+        index = EventIndex.from_interface(get_factory_interface())
+
+        self.assertIs(index, EventIndex.from_interface(get_factory_interface()))
+        self.assertIn("LaunchedV2", index.event_names)
+
+    def test_from_interface_same_abi(self):
+        interface = get_factory_interface()
+        index = EventIndex.from_interface(interface)
+
+        # Indexes are found by ABI, not by interface object
+        self.assertIs(index, EventIndex.from_interface(copy.deepcopy(interface)))
+
+        abi = copy.deepcopy(interface["abi"])
+        abi[0]["name"] = "Other"
+        self.assertIsNot(index, EventIndex.from_interface({"abi": abi}))
+
+    def test_from_interface_cache_is_bounded(self):
+        for i in range(INTERFACE_CACHE_SIZE + 1):
+            EventIndex.from_interface(
+                {"abi": [{"type": "event", "name": f"Event{i}", "inputs": []}]}
+            )
+
+        self.assertEqual(len(EventIndex._interface_cache), INTERFACE_CACHE_SIZE)
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
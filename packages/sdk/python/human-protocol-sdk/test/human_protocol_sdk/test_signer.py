@@ -0,0 +1,203 @@
+import unittest
+from test.human_protocol_sdk.utils import DEFAULT_GAS_PAYER, DEFAULT_GAS_PAYER_PRIV
+from unittest.mock import MagicMock, patch
+
+from eth_account import Account
+from eth_account._utils.typed_transactions import TypedTransaction
+from human_protocol_sdk.constants import ChainId
+from human_protocol_sdk.signer import FeeOracle, LocalSigner, get_signer
+from human_protocol_sdk.utils import get_factory_interface, handle_transaction
+from web3 import Web3
+from web3.eth import Eth
+from web3.providers.rpc import HTTPProvider
+
+FACTORY_ADDRESS = "0x5fbdb2315678AFECb367f032c93F642f64180Aa3"
+TOKEN_ADDRESS = "0x1234567890123456789012345678901234567890"
+TX_HASH = "0x" + "ab" * 32
+
+
+class TestLocalSigner(unittest.TestCase):
+    def setUp(self):
+        self.requests = []
+        self.responses = {
+            "eth_chainId": hex(ChainId.LOCALHOST.value),
+            "eth_getBlockByNumber": {"number": "0x1", "baseFeePerGas": hex(100)},
+            "eth_maxPriorityFeePerGas": hex(2),
+            "eth_gasPrice": hex(50),
+            "eth_getTransactionCount": hex(7),
+            "eth_estimateGas": hex(21000),
+            "eth_sendRawTransaction": TX_HASH,
+        }
+
+        def make_request(provider, method, params):
+            self.requests.append(method)
+            response = self.responses[method]
+            if isinstance(response, Exception):
+                raise response
+            return {"jsonrpc": "2.0", "id": 1, "result": response}
+
+        # Other tests replace the property on the class
+        self.patches = [
+            patch.object(HTTPProvider, "make_request", make_request),
+            patch.object(Eth, "chain_id", property(lambda eth: eth._chain_id())),
+        ]
+        for p in self.patches:
+            p.start()
+
+        self.w3 = Web3(HTTPProvider("http://localhost:8545"))
+        self.signer = LocalSigner(self.w3, DEFAULT_GAS_PAYER_PRIV)
+        self.tx = self.w3.eth.contract(
+            address=FACTORY_ADDRESS, abi=get_factory_interface()["abi"]
+        ).functions.createEscrow(TOKEN_ADDRESS, [DEFAULT_GAS_PAYER], "job-requester")
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+
+    def test_attach(self):
+        self.assertIsNone(get_signer(self.w3))
+
+        self.assertIs(self.signer.attach(), self.signer)
+
+        self.assertIs(get_signer(self.w3), self.signer)
+        self.assertEqual(self.w3.eth.default_account, DEFAULT_GAS_PAYER)
+
+    def test_build_transaction(self):
+        transaction = self.signer.build_transaction(self.tx, {"gas": 100000})
+
+        self.assertEqual(transaction["from"], DEFAULT_GAS_PAYER)
+        self.assertEqual(transaction["to"], FACTORY_ADDRESS)
+        self.assertEqual(transaction["chainId"], ChainId.LOCALHOST.value)
+        self.assertEqual(transaction["gas"], 100000)
+        self.assertEqual(transaction["nonce"], 7)
+        self.assertEqual(transaction["maxFeePerGas"], 202)
+        self.assertEqual(transaction["maxPriorityFeePerGas"], 2)
+
+    def test_build_transaction_estimates_gas(self):
+        transaction = self.signer.build_transaction(self.tx)
+
+        self.assertEqual(transaction["gas"], 21000)
+
+    def test_build_transaction_with_options(self):
+        transaction = self.signer.build_transaction(
+            self.tx, {"gas": 100000, "gasPrice": 10, "nonce": 3}
+        )
+
+        self.assertEqual(transaction["gasPrice"], 10)
+        self.assertEqual(transaction["nonce"], 3)
+        self.assertNotIn("maxFeePerGas", transaction)
+        self.assertNotIn("eth_getBlockByNumber", self.requests)
+        self.assertNotIn("eth_getTransactionCount", self.requests)
+
+    def test_requests_are_cached(self):
+        nonces = [
+            self.signer.build_transaction(self.tx, {"gas": 100000})["nonce"]
+            for _ in range(3)
+        ]
+
+        self.assertEqual(nonces, [7, 8, 9])
+        self.assertEqual(
+            self.requests,
+            [
+                "eth_chainId",
+                "eth_getBlockByNumber",
+                "eth_maxPriorityFeePerGas",
+                "eth_getTransactionCount",
+            ],
+        )
+
+    def test_send_transaction(self):
+        tx_hash = self.signer.send_transaction(self.tx, {"gas": 100000})
+
+        self.assertEqual(tx_hash.hex(), TX_HASH)
+        self.assertEqual(self.requests[-1], "eth_sendRawTransaction")
+
+    def test_sign_transaction(self):
+        transaction = self.signer.build_transaction(self.tx, {"gas": 100000})
+
+        raw_transaction = self.signer.sign_transaction(transaction)
+
+        self.assertEqual(
+            Account.recover_transaction(raw_transaction), DEFAULT_GAS_PAYER
+        )
+        signed = TypedTransaction.from_bytes(raw_transaction).as_dict()
+        self.assertEqual(signed["nonce"], 7)
+        self.assertEqual(signed["chainId"], ChainId.LOCALHOST.value)
+
+    def test_send_transaction_failure_resets_nonce(self):
+        self.responses["eth_sendRawTransaction"] = ValueError("nonce too low")
+
+        with self.assertRaises(ValueError):
+            self.signer.send_transaction(self.tx, {"gas": 100000})
+
+        self.responses["eth_sendRawTransaction"] = TX_HASH
+        self.responses["eth_getTransactionCount"] = hex(9)
+        transaction = self.signer.build_transaction(self.tx, {"gas": 100000})
+
+        self.assertEqual(transaction["nonce"], 9)
+        self.assertEqual(self.requests.count("eth_getBlockByNumber"), 2)
+
+    def test_handle_transaction(self):
+        self.signer.attach()
+        self.w3.eth.wait_for_transaction_receipt = MagicMock(return_value={"logs": []})
+
+        receipt = handle_transaction(self.w3, "Create Escrow", self.tx, Exception, None)
+
+        self.assertEqual(receipt, {"logs": []})
+        self.assertIn("eth_sendRawTransaction", self.requests)
+        self.w3.eth.wait_for_transaction_receipt.assert_called_once()
+
+    def test_handle_transaction_without_signer(self):
+        self.w3.eth.default_account = DEFAULT_GAS_PAYER
+
+        with self.assertRaises(Exception) as cm:
+            handle_transaction(self.w3, "Create Escrow", self.tx, Exception, None)
+        self.assertEqual(
+            "You must add construct_sign_and_send_raw_middleware middleware to Web3 instance",
+            str(cm.exception),
+        )
+
+
+class TestFeeOracle(unittest.TestCase):
+    def setUp(self):
+        self.w3 = MagicMock()
+        self.w3.eth.get_block.return_value = {"baseFeePerGas": 100}
+        self.w3.eth.max_priority_fee = 2
+        self.w3.eth.gas_price = 50
+
+    def test_get_fees(self):
+        fee_oracle = FeeOracle(self.w3, base_fee_multiplier=3)
+
+        self.assertEqual(
+            fee_oracle.get_fees(),
+            {"maxFeePerGas": 302, "maxPriorityFeePerGas": 2},
+        )
+
+    def test_get_fees_legacy_network(self):
+        self.w3.eth.get_block.return_value = {}
+        fee_oracle = FeeOracle(self.w3)
+
+        self.assertEqual(fee_oracle.get_fees(), {"gasPrice": 50})
+
+    def test_fees_are_cached(self):
+        fee_oracle = FeeOracle(self.w3)
+
+        fee_oracle.get_fees()
+        fee_oracle.get_fees()
+        self.w3.eth.get_block.assert_called_once()
+
+        fee_oracle.invalidate()
+        fee_oracle.get_fees()
+        self.assertEqual(self.w3.eth.get_block.call_count, 2)
+
+    def test_fees_expire(self):
+        fee_oracle = FeeOracle(self.w3, base_fee_ttl=0)
+
+        fee_oracle.get_fees()
+        fee_oracle.get_fees()
+
+        self.assertEqual(self.w3.eth.get_block.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)